@@ -21,6 +21,9 @@ new DcpOpsMonitorStack(app, 'DcpOpsMonitorStack', {
        --value '{"start_url": "https://xxx", "login_user_id":"xxxx","login_password":"xxxx","login_birthdate":"19701201"}' \
        --type "SecureString"
 
+    複数のアカウントを取得する場合は、accounts にアカウント名(name)付きのログイン情報を列挙します。
+       --value '{"accounts": [{"name": "self", "start_url": "https://xxx", "login_user_id":"xxxx", ...}, {"name": "spouse", ...}]}'
+
     $ aws ssm put-parameter \
        --name "/dcp-ops-monitor/spreadsheet-parameters" \
        --value '{"spreadsheet_id": "xxx", "sheet_name": "xxx", "credentials": {"type": "service_account", ...}}' \
@@ -0,0 +1,35 @@
+"""パッケージの公開名の遅延読み込み
+
+外部ライブラリ（NumPy, boto3, gspread, selenium 等）の読み込みはコールドスタートの大半を占めるため、
+それらに依存する実装はパッケージの import 時には読み込まず、公開名の参照時に読み込む。
+"""
+
+import sys
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+
+
+def lazy_exports(package: str, exports: dict[str, str]) -> Callable[[str], Any]:
+    """公開名を参照時に読み込むモジュールレベルの `__getattr__` を生成する
+
+    読み込んだ値はパッケージの属性として保持し、2 回目以降の参照では `__getattr__` を経由しない。
+
+    Args:
+        package (str): 公開元のパッケージ名（`__name__`）
+        exports (dict[str, str]): 公開名と、それを定義するモジュール名（package からの相対名も可）の対応
+
+    Returns:
+        Callable[[str], Any]: パッケージの `__getattr__` に設定する関数
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        value = getattr(import_module(module_name, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
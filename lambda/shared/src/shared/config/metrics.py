@@ -0,0 +1,74 @@
+"""処理段階ごとの所要時間の計測
+
+各段階の所要時間を CloudWatch Embedded Metric Format (EMF) のメトリクスとして記録する。
+記録したメトリクスは handler に付与した `log_metrics` により、実行終了時にまとめて出力される。
+メトリクスの記録は計測対象の処理の結果に影響させないため、記録時のエラーはログ出力のみとする。
+"""
+
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from aws_lambda_powertools import Metrics
+from aws_lambda_powertools.metrics import MetricUnit
+
+from shared.config.base_settings import get_logger
+
+logger = get_logger()
+
+# POWERTOOLS_METRICS_NAMESPACE が未設定の場合（ベンチマーク等の Lambda 外での実行）の名前空間
+# （記録数が上限に達した際の自動出力では名前空間が必須となる）
+DEFAULT_METRICS_NAMESPACE = "DcpOpsMonitor"
+
+
+def get_metrics(metrics: Metrics | None = None) -> Metrics:
+    """Metrics のインスタンスを取得する
+
+    Metrics はインスタンス間で記録内容を共有するため、モジュールごとに取得してよい。
+
+    Args:
+        metrics (Metrics | None, optional): Metrics のインスタンス. Defaults to None.
+
+    Returns:
+        Metrics: Metrics のインスタンス
+    """
+    if metrics is None:
+        metrics = Metrics(namespace=os.getenv("POWERTOOLS_METRICS_NAMESPACE", DEFAULT_METRICS_NAMESPACE))
+    return metrics
+
+
+def record_metric(name: str, unit: MetricUnit, value: float) -> None:
+    """メトリクスを記録する（記録に失敗した場合はログのみ出力する）
+
+    Args:
+        name: メトリクス名
+        unit: 単位
+        value: 値
+    """
+    try:
+        get_metrics().add_metric(name=name, unit=unit, value=value)
+    except Exception:
+        logger.warning("メトリクスの記録に失敗しました", extra={"metric": name}, exc_info=True)
+
+
+@contextmanager
+def measure_stage(stage: str) -> Iterator[None]:
+    """処理段階の所要時間を計測し、メトリクスとして記録する
+
+    コンテキストマネージャとしても、デコレータとしても使用できる。
+    所要時間は成否に関わらず `<stage>Duration`（ミリ秒）として記録し、
+    例外が発生した場合は `<stage>Failures` も記録する。
+
+    Args:
+        stage: 処理段階の名前（例: "Login"）
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        record_metric(f"{stage}Failures", MetricUnit.Count, 1)
+        raise
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        record_metric(f"{stage}Duration", MetricUnit.Milliseconds, elapsed_ms)
@@ -5,12 +5,17 @@ from shared.domain.asset_record_object import AssetRecord
 
 class IAssetRecordRepository(ABC):
     @abstractmethod
-    def save_daily_records(self, records: list[AssetRecord]) -> None:
+    def save_daily_records(self, records: list[AssetRecord], product_prefixes: list[str] | None = None) -> None:
         """日次の資産レコードを保存する
 
         冪等性を保証する。同一日付のレコードが既に存在する場合は
         既存レコードを削除してから保存する（upsert セマンティクス）。
 
+        Args:
+            records: 保存する資産レコードのリスト
+            product_prefixes: 置き換える既存レコードの商品名の接頭辞。指定した場合、同一日付の既存レコードのうち
+                商品名がいずれかの接頭辞で始まるものだけを置き換え、それ以外は残す（None の場合は全て置き換える）
+
         Raises:
             AssetRecordError: レコード保存失敗時
         """
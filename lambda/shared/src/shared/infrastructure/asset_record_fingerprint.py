@@ -0,0 +1,77 @@
+"""資産レコードのフィンガープリント
+
+最後に保存した日次の資産レコードの日付と内容（日付を除く）のハッシュを S3 に保存する。
+- 書き込み側: 前回保存したレコードと内容が同じ場合（休日で評価額が更新されない日など）に保存を省略する
+- 読み取り側: 前回の同期以降にレコードが保存されていない場合にシートの読み取りを省略する
+
+キー: `{prefix}/fingerprint.json`
+"""
+
+import hashlib
+import json
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from shared.domain.asset_record_object import AssetRecord
+from shared.infrastructure.aws_clients import get_client
+from shared.infrastructure.s3_asset_record_store import ASSET_RECORDS_PREFIX
+
+
+def compute_fingerprint(records: Iterable[AssetRecord]) -> str:
+    """資産レコードの内容（日付を除く）のハッシュを計算する（レコードの順序に依存しない）"""
+    rows = sorted((r.product, r.asset_valuation, r.cumulative_contributions, r.gains_or_losses) for r in records)
+    return hashlib.sha256(json.dumps(rows, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+class RecordFingerprint(NamedTuple):
+    """最後に保存した資産レコードのフィンガープリント"""
+
+    date: str
+    fingerprint: str
+
+    @property
+    def version(self) -> str:
+        """保存のたびに変わる値（読み取り側の同期状態の比較に使用する）"""
+        return f"{self.date}:{self.fingerprint}"
+
+
+class AssetRecordFingerprintStore:
+    """資産レコードのフィンガープリントを S3 に保存するストア"""
+
+    def __init__(self, bucket: str, prefix: str = ASSET_RECORDS_PREFIX, client=None) -> None:
+        """ストアを初期化
+
+        Args:
+            bucket: S3 バケット名
+            prefix: オブジェクトキーのプレフィックス
+            client: S3 クライアント（省略時はコンテナ内で共有するクライアント）
+        """
+        self.bucket = bucket
+        self.key = f"{prefix}/fingerprint.json"
+        self.client = client if client is not None else get_client("s3")
+
+    def load(self) -> RecordFingerprint | None:
+        """フィンガープリントを読み込む（存在しない場合は None）"""
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=self.key)
+        except self.client.exceptions.NoSuchKey:
+            return None
+        body = json.loads(response["Body"].read())
+        return RecordFingerprint(date=body["date"], fingerprint=body["fingerprint"])
+
+    def save(self, fingerprint: RecordFingerprint) -> None:
+        """フィンガープリントを書き込む"""
+        self.client.put_object(
+            Bucket=self.bucket,
+            Key=self.key,
+            Body=json.dumps(fingerprint._asdict()).encode("utf-8"),
+            ContentType="application/json",
+        )
+
+    def invalidate(self) -> None:
+        """フィンガープリントを削除する
+
+        レコードの保存中に失敗した場合に、古いフィンガープリントが残って読み取り側が
+        同期を省略しないよう、保存の前に削除する。
+        """
+        self.client.delete_object(Bucket=self.bucket, Key=self.key)
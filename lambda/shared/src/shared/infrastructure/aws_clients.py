@@ -0,0 +1,39 @@
+"""AWS クライアントの生成
+
+boto3 のクライアント生成（エンドポイント解決・認証情報の読み込み）はコストが高いため、
+サービス名・リージョン・endpoint ごとにコンテナ内で 1 度だけ生成し、ウォームスタート時に再利用する。
+boto3 自体もクライアントを初めて生成する時点で読み込む。
+
+boto3 のデフォルトセッションの生成とセッションからのクライアント生成はスレッドセーフではないため、
+リソースを並行して初期化する場合に備えて、クライアントの生成はロックで直列化する。
+"""
+
+import os
+import threading
+from functools import cache
+
+_create_client_lock = threading.Lock()
+
+
+def get_client(service_name: str, region_name: str | None = None):
+    """AWS クライアントを取得（コンテナ内で再利用）
+
+    環境変数 ENV が "local" または "test" の場合、LocalStack の endpoint を使用
+
+    Args:
+        service_name: サービス名（例: "s3"）
+        region_name: リージョン名（省略時は実行環境のリージョン）
+
+    Returns:
+        boto3.client: AWS クライアント
+    """
+    endpoint_url = os.environ["LOCAL_STACK_CONTAINER_URL"] if os.environ.get("ENV") in ["local", "test"] else None
+    with _create_client_lock:
+        return _create_client(service_name, region_name, endpoint_url)
+
+
+@cache
+def _create_client(service_name: str, region_name: str | None, endpoint_url: str | None):
+    import boto3
+
+    return boto3.client(service_name, region_name=region_name, endpoint_url=endpoint_url)
@@ -0,0 +1,30 @@
+"""Google Spreadsheet クライアントの生成
+
+認証済みの gspread クライアントを認証情報・スコープごとにコンテナ内で 1 度だけ生成し、
+ウォームスタート時に再利用する（取得済みのアクセストークンも有効期限内は再利用される）。
+"""
+
+import json
+from functools import cache
+
+import gspread
+from google.oauth2.service_account import Credentials
+
+
+def get_spreadsheet_client(credentials: dict, scopes: list[str]) -> gspread.Client:
+    """認証済みの gspread クライアントを取得（コンテナ内で再利用）
+
+    Args:
+        credentials: サービスアカウント認証情報
+        scopes: OAuth スコープ
+
+    Returns:
+        gspread.Client: 認証済みクライアント
+    """
+    return _authorize(json.dumps(credentials, sort_keys=True), tuple(scopes))
+
+
+@cache
+def _authorize(credentials_json: str, scopes: tuple[str, ...]) -> gspread.Client:
+    creds = Credentials.from_service_account_info(json.loads(credentials_json), scopes=scopes)
+    return gspread.authorize(creds)
@@ -0,0 +1,184 @@
+"""S3 上の列指向資産レコードストア
+
+資産レコードを年単位のパーティションに分割し、列指向の JSON（gzip 圧縮）として保存する。
+各パーティションは日付昇順に並んでおり、1 回のオブジェクト読み取りと日付列の二分探索で
+任意期間のレコードを取り出せる。
+
+キー: `{prefix}/year={YYYY}/records.json.gz`
+"""
+
+import gzip
+import json
+import re
+from bisect import bisect_left, bisect_right
+from datetime import date
+
+from shared.domain.asset_object import AssetEvaluation
+from shared.domain.asset_record_object import AssetRecord
+from shared.infrastructure.aws_clients import get_client
+
+ASSET_RECORDS_PREFIX = "asset-records"
+COLUMNS = ("date", "product", "asset_valuation", "cumulative_contributions", "gains_or_losses")
+
+_PARTITION_PATTERN = re.compile(r"year=(\d{4})/records\.json\.gz$")
+
+
+class AssetRecordColumns:
+    """列指向の資産レコード（日付昇順）
+
+    Attributes:
+        columns (dict[str, list]): 列名 → 値のリスト。date 列は ISO 形式の文字列
+    """
+
+    def __init__(self, columns: dict[str, list] | None = None) -> None:
+        self.columns = columns if columns is not None else {name: [] for name in COLUMNS}
+
+    def __len__(self) -> int:
+        return len(self.columns["date"])
+
+    @property
+    def dates(self) -> list[str]:
+        """date 列"""
+        return self.columns["date"]
+
+    @classmethod
+    def from_records(cls, records: list[AssetRecord]) -> "AssetRecordColumns":
+        """AssetRecord のリストから列指向データを生成する（日付昇順に並べ替える）"""
+        ordered = sorted(records, key=lambda r: r.date)
+        return cls(
+            {
+                "date": [str(r.date) for r in ordered],
+                "product": [r.product for r in ordered],
+                "asset_valuation": [r.asset_valuation for r in ordered],
+                "cumulative_contributions": [r.cumulative_contributions for r in ordered],
+                "gains_or_losses": [r.gains_or_losses for r in ordered],
+            }
+        )
+
+    def slice_dates(self, start: str | None = None, end: str | None = None) -> "AssetRecordColumns":
+        """日付範囲 [start, end] の行を二分探索で切り出す
+
+        Args:
+            start: 開始日（ISO 形式、None の場合は先頭から）
+            end: 終了日（ISO 形式、None の場合は末尾まで）
+
+        Returns:
+            AssetRecordColumns: 切り出した列指向データ
+        """
+        lo = 0 if start is None else bisect_left(self.dates, start)
+        hi = len(self) if end is None else bisect_right(self.dates, end)
+        return AssetRecordColumns({name: values[lo:hi] for name, values in self.columns.items()})
+
+    def replace_date(
+        self,
+        target_date: str,
+        other: "AssetRecordColumns",
+        product_prefixes: list[str] | None = None,
+    ) -> "AssetRecordColumns":
+        """対象日付の行を other の行で置き換えた列指向データを返す（日付昇順を維持する）
+
+        Args:
+            target_date: 対象日付（ISO 形式）
+            other: 対象日付の新しい行
+            product_prefixes: 置き換える行の商品名の接頭辞（対象日付の他の行は other の前に残す。
+                None の場合は対象日付の全ての行を置き換える）
+        """
+        lo = bisect_left(self.dates, target_date)
+        hi = bisect_right(self.dates, target_date)
+        kept: list[int] = []
+        if product_prefixes is not None:
+            prefixes = tuple(product_prefixes)
+            kept = [i for i in range(lo, hi) if not self.columns["product"][i].startswith(prefixes)]
+        return AssetRecordColumns(
+            {
+                name: values[:lo] + [values[i] for i in kept] + other.columns[name] + values[hi:]
+                for name, values in self.columns.items()
+            }
+        )
+
+    def concat(self, other: "AssetRecordColumns") -> "AssetRecordColumns":
+        """後ろに other を連結した列指向データを返す"""
+        return AssetRecordColumns({name: values + other.columns[name] for name, values in self.columns.items()})
+
+    def to_products_by_date(self) -> dict[date, dict[str, AssetEvaluation]]:
+        """日付別・商品別の AssetEvaluation のマッピングに変換する
+
+        日付の解析は日付ごとに 1 回だけ行う。
+        （AssetEvaluation は検証付きで生成する。pydantic v2 では model_construct の方が遅いため）
+        """
+        by_date: dict[str, dict[str, AssetEvaluation]] = {}
+        c = self.columns
+        for d, product, valuation, contributions, gains in zip(
+            c["date"], c["product"], c["asset_valuation"], c["cumulative_contributions"], c["gains_or_losses"]
+        ):
+            by_date.setdefault(d, {})[product] = AssetEvaluation(
+                asset_valuation=valuation,
+                cumulative_contributions=contributions,
+                gains_or_losses=gains,
+            )
+        return {date.fromisoformat(d): products for d, products in by_date.items()}
+
+    def to_bytes(self) -> bytes:
+        """gzip 圧縮した JSON に変換する"""
+        return gzip.compress(json.dumps(self.columns, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "AssetRecordColumns":
+        """gzip 圧縮した JSON から生成する"""
+        return cls(json.loads(gzip.decompress(data)))
+
+
+class S3AssetRecordStore:
+    """年単位パーティションの列指向資産レコードを S3 に読み書きする"""
+
+    def __init__(self, bucket: str, prefix: str = ASSET_RECORDS_PREFIX, client=None) -> None:
+        """ストアを初期化
+
+        Args:
+            bucket: S3 バケット名
+            prefix: オブジェクトキーのプレフィックス
+            client: S3 クライアント（省略時はコンテナ内で共有するクライアント）
+        """
+        self.bucket = bucket
+        self.prefix = prefix
+        self.client = client if client is not None else get_client("s3")
+
+    def partition_key(self, year: int) -> str:
+        """パーティションのオブジェクトキー"""
+        return f"{self.prefix}/year={year:04d}/records.json.gz"
+
+    def list_years(self) -> list[int]:
+        """保存済みパーティションの年を昇順で取得する"""
+        paginator = self.client.get_paginator("list_objects_v2")
+        years = []
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=f"{self.prefix}/"):
+            for obj in page.get("Contents", []):
+                match = _PARTITION_PATTERN.search(obj["Key"])
+                if match:
+                    years.append(int(match.group(1)))
+        return sorted(years)
+
+    def read_year(self, year: int) -> AssetRecordColumns:
+        """パーティションを読み込む（存在しない場合は空）"""
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=self.partition_key(year))
+        except self.client.exceptions.NoSuchKey:
+            return AssetRecordColumns()
+        return AssetRecordColumns.from_bytes(response["Body"].read())
+
+    def write_year(self, year: int, columns: AssetRecordColumns) -> None:
+        """パーティションを書き込む"""
+        self.client.put_object(
+            Bucket=self.bucket,
+            Key=self.partition_key(year),
+            Body=columns.to_bytes(),
+            ContentType="application/json",
+            ContentEncoding="gzip",
+        )
+
+    def read_range(self, start: date, end: date) -> AssetRecordColumns:
+        """期間 [start, end] のレコードを読み込む（対象年のパーティションのみ読み取る）"""
+        result = AssetRecordColumns()
+        for year in range(start.year, end.year + 1):
+            result = result.concat(self.read_year(year).slice_dates(str(start), str(end)))
+        return result
@@ -0,0 +1,163 @@
+"""資産レコードシートの日付インデックス
+
+資産レコードシートの date → 行範囲を、別シート（インデックスシート）に記録する。
+資産レコードは日付単位でまとめて追記されるため、同一日付の行は常に連続した範囲に収まる。
+インデックスを参照することで、シートの履歴件数に関わらず一定回数の API 呼び出しで
+最新日付や特定日付の行範囲を特定できる。
+"""
+
+from typing import NamedTuple
+
+from gspread import Spreadsheet
+from gspread.exceptions import APIError
+
+INDEX_SHEET_SUFFIX = "_index"
+INDEX_HEADERS = ["date", "first_row", "last_row"]
+
+# 存在しないシートを範囲指定した場合に Sheets API が返すステータスコード
+RANGE_NOT_FOUND_CODE = 400
+
+
+class DateRowRange(NamedTuple):
+    """同一日付のレコードが格納されている行範囲（1 始まり、両端を含む）"""
+
+    first_row: int
+    last_row: int
+
+    @property
+    def count(self) -> int:
+        """行数"""
+        return self.last_row - self.first_row + 1
+
+
+class SheetDateIndex:
+    """資産レコードシートの日付インデックス
+
+    インデックスシートは `{データシート名}_index` とし、日付昇順で
+    date, first_row, last_row の 3 列を保持する。
+    """
+
+    def __init__(self, spreadsheet: Spreadsheet, data_sheet_name: str) -> None:
+        """日付インデックスを初期化
+
+        Args:
+            spreadsheet: 対象のスプレッドシート
+            data_sheet_name: 資産レコードシート名
+        """
+        self.spreadsheet = spreadsheet
+        self.title = f"{data_sheet_name}{INDEX_SHEET_SUFFIX}"
+
+    def load(self) -> dict[str, DateRowRange] | None:
+        """インデックスを読み込む（API 呼び出し 1 回）
+
+        Returns:
+            dict[str, DateRowRange] | None: 日付文字列 → 行範囲のマッピング（日付昇順）。
+            インデックスシートが存在しない、または空の場合は None
+        """
+        try:
+            response = self.spreadsheet.values_get(self.range_name)
+        except APIError as e:
+            if e.code == RANGE_NOT_FOUND_CODE:
+                return None
+            raise
+
+        return self.parse(response.get("values", []))
+
+    @property
+    def range_name(self) -> str:
+        """インデックスのデータ行（ヘッダー除く）の範囲"""
+        return f"'{self.title}'!A2:C"
+
+    @staticmethod
+    def parse(values: list[list[str]]) -> dict[str, DateRowRange] | None:
+        """インデックスシートの値を解析する
+
+        他の範囲とまとめて読み取った値を解析する場合に使用する。
+
+        Args:
+            values: range_name の範囲の値
+
+        Returns:
+            dict[str, DateRowRange] | None: 日付文字列 → 行範囲のマッピング（日付昇順）。空の場合は None
+        """
+        if not values:
+            return None
+
+        return dict(sorted((row[0], DateRowRange(int(row[1]), int(row[2]))) for row in values if len(row) >= 3))
+
+    def save(self, entries: dict[str, DateRowRange]) -> None:
+        """インデックスを書き込む
+
+        インデックスシートが存在しない場合は作成する。
+
+        Args:
+            entries: 日付文字列 → 行範囲のマッピング
+        """
+        rows = [INDEX_HEADERS] + [[d, r.first_row, r.last_row] for d, r in sorted(entries.items())]
+        try:
+            self.spreadsheet.values_clear(f"'{self.title}'!A:C")
+        except APIError as e:
+            if e.code != RANGE_NOT_FOUND_CODE:
+                raise
+            self.spreadsheet.add_worksheet(title=self.title, rows=len(rows), cols=len(INDEX_HEADERS))
+
+        self.spreadsheet.values_append(
+            f"'{self.title}'!A1",
+            params={"valueInputOption": "RAW"},
+            body={"values": rows},
+        )
+
+    @staticmethod
+    def build(dates: list[str], header_row: int = 1) -> dict[str, DateRowRange]:
+        """資産レコードシートの date 列からインデックスを構築する
+
+        インデックスシートが未作成の既存シートを移行する際に使用する。
+
+        Args:
+            dates: ヘッダー行を除いた date 列の値
+            header_row: ヘッダー行の行番号
+
+        Returns:
+            dict[str, DateRowRange]: 日付文字列 → 行範囲のマッピング
+
+        Raises:
+            ValueError: 同一日付のレコードが連続した範囲に収まっていない場合
+        """
+        entries: dict[str, DateRowRange] = {}
+        for i, d in enumerate(dates):
+            row = i + header_row + 1
+            current = entries.get(d)
+            if current is None:
+                entries[d] = DateRowRange(row, row)
+            elif current.last_row == row - 1:
+                entries[d] = DateRowRange(current.first_row, row)
+            else:
+                msg = f"同一日付のレコードが連続していません: date={d}, row={row}"
+                raise ValueError(msg)
+        return dict(sorted(entries.items()))
+
+    @staticmethod
+    def remove(entries: dict[str, DateRowRange], target_date: str) -> dict[str, DateRowRange]:
+        """指定日付の行範囲を削除した後のインデックスを返す
+
+        削除した範囲より下にある行範囲は、削除した行数分だけ繰り上げる。
+
+        Args:
+            entries: 現在のインデックス
+            target_date: 削除する日付
+
+        Returns:
+            dict[str, DateRowRange]: 更新後のインデックス
+        """
+        removed = entries.get(target_date)
+        if removed is None:
+            return dict(entries)
+
+        result: dict[str, DateRowRange] = {}
+        for d, r in entries.items():
+            if d == target_date:
+                continue
+            if r.first_row > removed.last_row:
+                r = DateRowRange(r.first_row - removed.count, r.last_row - removed.count)
+            result[d] = r
+        return result
@@ -1,34 +1,96 @@
-"""SSM Parameter Store からパラメータを取得"""
+"""SSM Parameter Store からパラメータを取得
+
+取得したパラメータはコンテナ内で一定時間キャッシュし、ウォームスタート時の API 呼び出しを省略する。
+複数のパラメータは GetParameters でまとめて取得する。
+"""
 
 import json
-import os
+import time
 from typing import Any
 
-import boto3
+from shared.config.metrics import measure_stage
+from shared.infrastructure.aws_clients import get_client
+
+DEFAULT_MAX_AGE_SECONDS = 300
+
+# GetParameters で一度に指定できるパラメータ名の上限
+_MAX_NAMES_PER_REQUEST = 10
+
+# (パラメータ名, 復号化有無) → (取得時刻, JSON パラメータ)
+_cache: dict[tuple[str, bool], tuple[float, dict[str, Any]]] = {}
 
 
 def _get_client():
-    """SSM クライアントを取得（遅延初期化）
+    """SSM クライアントを取得（コンテナ内で再利用）
 
     Returns:
         boto3.client: SSM クライアント
     """
-    if os.environ.get("ENV") in ["local", "test"]:
-        return boto3.client("ssm", region_name="ap-northeast-1", endpoint_url=os.environ["LOCAL_STACK_CONTAINER_URL"])
-    return boto3.client("ssm", region_name="ap-northeast-1")
+    return get_client("ssm", region_name="ap-northeast-1")
 
 
-def get_ssm_json_parameter(name: str, decrypt: bool = True) -> dict[str, Any]:  # noqa: FBT001, FBT002
+def get_ssm_json_parameter(
+    name: str,
+    decrypt: bool = True,  # noqa: FBT001, FBT002
+    max_age: float = DEFAULT_MAX_AGE_SECONDS,
+) -> dict[str, Any]:
     """SSM Parameter Store から JSON パラメータを取得
 
     Args:
         name: パラメータ名
         decrypt: 復号化するかどうか (デフォルト: True)
+        max_age: キャッシュの有効期間（秒）
 
     Returns:
         dict[str, Any]: JSON パラメータの辞書
     """
-    client = _get_client()
-    response = client.get_parameter(Name=name, WithDecryption=decrypt)
-    parameters_json = response["Parameter"]["Value"]
-    return json.loads(parameters_json)
+    return get_ssm_json_parameters([name], decrypt=decrypt, max_age=max_age)[name]
+
+
+def get_ssm_json_parameters(
+    names: list[str],
+    decrypt: bool = True,  # noqa: FBT001, FBT002
+    max_age: float = DEFAULT_MAX_AGE_SECONDS,
+) -> dict[str, dict[str, Any]]:
+    """SSM Parameter Store から複数の JSON パラメータをまとめて取得
+
+    キャッシュが有効なパラメータは API を呼び出さずに返し、それ以外は GetParameters で
+    最大 10 件ずつ取得する。
+
+    Args:
+        names: パラメータ名のリスト
+        decrypt: 復号化するかどうか (デフォルト: True)
+        max_age: キャッシュの有効期間（秒）
+
+    Returns:
+        dict[str, dict[str, Any]]: パラメータ名 → JSON パラメータの辞書
+
+    Raises:
+        ValueError: 存在しないパラメータが含まれている場合
+    """
+    now = time.monotonic()
+    parameters: dict[str, dict[str, Any]] = {}
+    missing: list[str] = []
+    for name in dict.fromkeys(names):
+        cached = _cache.get((name, decrypt))
+        if cached is not None and now - cached[0] < max_age:
+            parameters[name] = cached[1]
+        else:
+            missing.append(name)
+
+    if missing:
+        with measure_stage("SsmFetch"):
+            for i in range(0, len(missing), _MAX_NAMES_PER_REQUEST):
+                response = _get_client().get_parameters(
+                    Names=missing[i : i + _MAX_NAMES_PER_REQUEST], WithDecryption=decrypt
+                )
+                if response["InvalidParameters"]:
+                    msg = f"SSM パラメータが見つかりません: {response['InvalidParameters']}"
+                    raise ValueError(msg)
+
+                for parameter in response["Parameters"]:
+                    value = json.loads(parameter["Value"])
+                    _cache[(parameter["Name"], decrypt)] = (now, value)
+                    parameters[parameter["Name"]] = value
+
+    return parameters
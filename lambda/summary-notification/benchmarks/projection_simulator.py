@@ -0,0 +1,44 @@
+"""想定受取額のモンテカルロシミュレーションのベンチマーク
+
+経路数とチャンクサイズごとに、実行時間と NumPy 配列のピークメモリを計測する。
+サマリ通知 Lambda（メモリ 128 MB / タイムアウト 30 秒）の予算内に収まる設定を確認するために使用する。
+
+Usage:
+    cd lambda/summary-notification
+    uv run python -m benchmarks.projection_simulator
+"""
+
+import resource
+import time
+import tracemalloc
+from datetime import date
+
+from src.domain import ReturnParameters, simulate_total_amount_at_60age
+
+PARAMETERS = ReturnParameters(drift=0.04, volatility=0.15)
+TODAY = date(2026, 10, 1)
+CASES = [
+    (10_000, 1_000),
+    (20_000, 2_000),
+    (50_000, 2_000),
+    (50_000, 10_000),
+]
+
+
+def main() -> None:
+    print(f"{'paths':>8} {'chunk':>8} {'time[s]':>8} {'peak[MB]':>9}")
+    for paths, chunk_size in CASES:
+        tracemalloc.start()
+        start = time.perf_counter()
+        simulate_total_amount_at_60age(1_000_000, PARAMETERS, TODAY, paths=paths, chunk_size=chunk_size, seed=0)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{paths:>8,} {chunk_size:>8,} {elapsed:>8.3f} {peak / 1024**2:>9.1f}")
+
+    max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"process max RSS: {max_rss_mb:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
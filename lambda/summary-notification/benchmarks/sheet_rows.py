@@ -0,0 +1,148 @@
+"""資産レコードシートの行変換のベンチマーク
+
+商品数 10 の日次レコードを 1 万行 / 10 万行生成し、シートから読み取った行（文字列のリスト）を
+日付別・商品別の AssetEvaluation に変換するまでの実行時間とピークメモリを、変換方式・工程ごとに計測する。
+シートにはアクセスせず、gspread が返す形式の行をメモリ上に生成する。
+
+- dict: 行ごとに `dict(zip(headers, row))` を生成して日付別にグルーピングし、
+  行ごとに int に変換して AssetEvaluation を生成する（従来の方式）
+- columns: 行を列指向データ（AssetRecordColumns）に直接変換し、数値列を列ごとに一括して int に変換してから
+  AssetEvaluation を生成する（GoogleSheetAssetRepository の方式）
+
+工程は parse（行 → 中間データ）と products（中間データ → AssetEvaluation）に分けて計測する。
+
+Usage:
+    cd lambda/summary-notification
+    uv run python -m benchmarks.sheet_rows [--repeat N]
+"""
+
+import argparse
+import gc
+import os
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import date, timedelta
+
+os.environ.setdefault("POWERTOOLS_LOG_LEVEL", "WARNING")
+
+from shared.infrastructure.s3_asset_record_store import AssetRecordColumns  # noqa: E402
+
+from src.domain import AssetEvaluation  # noqa: E402
+from src.infrastructure.google_sheet_asset_repository import GoogleSheetAssetRepository  # noqa: E402
+
+ROW_COUNTS = [10_000, 100_000]
+PRODUCTS_PER_DAY = 10
+HEADERS = ["date", "product", "asset_valuation", "cumulative_contributions", "gains_or_losses"]
+
+
+def build_rows(row_count: int) -> list[list[str]]:
+    """gspread が返す形式（全セル文字列）の資産レコード行を日付昇順に生成する"""
+    start = date(2000, 1, 1)
+    rows = []
+    for i in range(row_count):
+        day, product = divmod(i, PRODUCTS_PER_DAY)
+        contributions = 100_000 + day * 100
+        valuation = contributions + (i % 997) * 10
+        rows.append(
+            [
+                str(start + timedelta(days=day)),
+                f"プロダクト_{product + 1}",
+                str(valuation),
+                str(contributions),
+                str(valuation - contributions),
+            ]
+        )
+    return rows
+
+
+def group_rows_as_dicts(values: list[list[str]], target_dates: set[str]) -> dict[str, list[dict]]:
+    """行ごとの辞書を日付別にグルーピングする（従来の方式）"""
+    rows_by_date: dict[str, list[dict]] = {}
+    for values_row in values:
+        row = dict(zip(HEADERS, values_row))
+        if row["date"] in target_dates:
+            rows_by_date.setdefault(row["date"], []).append(row)
+    return rows_by_date
+
+
+def dicts_to_products(rows_by_date: dict[str, list[dict]]) -> dict[date, dict[str, AssetEvaluation]]:
+    """日付別の行の辞書から日付別・商品別マッピングを構築する（従来の方式）"""
+    return {
+        date.fromisoformat(d): {
+            row["product"]: AssetEvaluation(
+                asset_valuation=int(row["asset_valuation"]),
+                cumulative_contributions=int(row["cumulative_contributions"]),
+                gains_or_losses=int(row["gains_or_losses"]),
+            )
+            for row in rows
+        }
+        for d, rows in rows_by_date.items()
+    }
+
+
+def bench_dicts(values: list[list[str]], target_dates: set[str]) -> dict[str, tuple[float, float]]:
+    """従来の方式の工程別の計測値"""
+    rows_by_date = group_rows_as_dicts(values, target_dates)
+    return {
+        "parse": measure(lambda: group_rows_as_dicts(values, target_dates)),
+        "products": measure(lambda: dicts_to_products(rows_by_date)),
+    }
+
+
+def bench_columns(values: list[list[str]], target_dates: set[str]) -> dict[str, tuple[float, float]]:
+    """GoogleSheetAssetRepository の方式の工程別の計測値"""
+    columns: AssetRecordColumns = GoogleSheetAssetRepository._parse_rows(HEADERS, values, target_dates)
+    return {
+        "parse": measure(lambda: GoogleSheetAssetRepository._parse_rows(HEADERS, values, target_dates)),
+        "products": measure(columns.to_products_by_date),
+    }
+
+
+def measure(func: Callable[[], object]) -> tuple[float, float]:
+    """関数の実行時間[ms]とピークメモリ[KB]を計測する
+
+    実行時間は tracemalloc の計測負荷を含めないよう、ピークメモリとは別に計測する。
+    前回の計測で生成したオブジェクトの回収が計測に含まれないよう、計測前に GC を実行する。
+    """
+    gc.collect()
+    start = time.perf_counter()
+    func()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed_ms, peak / 1024
+
+
+def report(name: str, runs: list[dict[str, tuple[float, float]]]) -> None:
+    """工程別に実行時間の中央値とピークメモリの最大値を表示する"""
+    for stage in runs[0]:
+        times = [run[stage][0] for run in runs]
+        peaks = [run[stage][1] for run in runs]
+        print(f"  {name:<8} {stage:<9} {statistics.median(times):>9.2f} {max(peaks):>10.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="計測回数（実行時間は中央値を表示）")
+    args = parser.parse_args()
+
+    for row_count in ROW_COUNTS:
+        values = build_rows(row_count)
+        target_dates = {row[0] for row in values}
+        expected = dicts_to_products(group_rows_as_dicts(values, target_dates))
+        assert GoogleSheetAssetRepository._parse_rows(HEADERS, values, target_dates).to_products_by_date() == expected
+
+        print(f"== rows={row_count} (dates={len(target_dates)})")
+        print(f"  {'method':<8} {'stage':<9} {'time[ms]':>9} {'peak[KB]':>10}")
+        report("dict", [bench_dicts(values, target_dates) for _ in range(args.repeat)])
+        report("columns", [bench_columns(values, target_dates) for _ in range(args.repeat)])
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,14 @@
 
 from datetime import date
 
-from src.domain import AssetEvaluation, OpsIndicators
+from src.domain import AssetEvaluation, OpsIndicators, ProjectionBands
 
 
 def format_summary_message(
     total: AssetEvaluation,
     indicators: OpsIndicators,
     weekly_valuations: list[tuple[date, int, int | None]],
+    projection_bands: ProjectionBands | None = None,
 ) -> str:
     """資産情報と運用指標からサマリメッセージをフォーマット
 
@@ -16,6 +17,7 @@ def format_summary_message(
         total: 全商品合計の資産情報
         indicators: 運用指標
         weekly_valuations: (日付, 資産評価額, 前日比 or None) のリスト（新しい日付順）
+        projection_bands: 想定受取額(60歳)の分布（None の場合は出力しない）
 
     Returns:
         str: フォーマットされたメッセージ
@@ -32,6 +34,12 @@ def format_summary_message(
     message += f"想定受取額(60歳): {indicators.total_amount_at_60age:,}円\n"
     message += "\n"
 
+    if projection_bands is not None:
+        message += "想定受取額(60歳)の分布\n"
+        for percentile, amount in sorted(projection_bands.percentiles.items()):
+            message += f"{percentile}%: {amount:,}円\n"
+        message += "\n"
+
     if weekly_valuations:
         message += "資産評価額推移（直近1週間）\n"
         for d, valuation, diff in weekly_valuations:
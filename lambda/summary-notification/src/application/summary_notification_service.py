@@ -1,14 +1,21 @@
 """サマリ通知サービス"""
 
-from datetime import date
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
 
-from src.config.settings import get_logger
-from src.domain import AssetEvaluation, IAssetRepository, INotifier, calculate_indicators
+from src import domain
+from src.config.settings import get_logger, measure_stage
+from src.domain import AssetEvaluation, IAssetRepository, INotifier, ProjectionBands, calculate_indicators
 
 from .message_formatter import format_summary_message
 
 logger = get_logger()
 
+# 想定受取額の分布のシミュレーションに使う資産履歴の日数
+PROJECTION_HISTORY_DAYS = 365 * 3
+# 運用年数・60歳までの期間の基準日のタイムゾーン（資産レコードの日付と同じく日本時間とする）
+TIMEZONE = ZoneInfo("Asia/Tokyo")
+
 
 class SummaryNotificationService:
     """サマリ通知サービス"""
@@ -17,15 +24,18 @@ class SummaryNotificationService:
         self,
         asset_repository: IAssetRepository,
         notifier: INotifier,
+        monte_carlo_paths: int = 0,
     ) -> None:
         """サマリ通知サービスを初期化
 
         Args:
             asset_repository: 資産リポジトリ
             notifier: 通知クライアント
+            monte_carlo_paths: 想定受取額の分布のシミュレーション経路数（0 の場合は計算しない）
         """
         self.asset_repository = asset_repository
         self.notifier = notifier
+        self.monte_carlo_paths = monte_carlo_paths
 
     def send_summary(self) -> None:
         """サマリ通知を送信
@@ -41,21 +51,82 @@ class SummaryNotificationService:
         total = AssetEvaluation.aggregate(products.values())
         logger.info("資産情報を取得しました")
 
-        # 運用指標を計算
-        indicators = calculate_indicators(total)
+        # 運用指標を計算（実行環境のタイムゾーンによらず、日本時間の日付を基準日とする）
+        today = datetime.now(TIMEZONE).date()
+        with measure_stage("IndicatorCalculation"):
+            indicators = calculate_indicators(total, today=today)
         logger.info("運用指標を計算しました", indicators=indicators.model_dump())
 
         # 直近1週間の資産評価額推移を取得・計算
         weekly_products = self.asset_repository.get_weekly_assets()
         weekly_valuations = self._calculate_weekly_valuations(weekly_products)
 
+        # 想定受取額の分布をシミュレーション（有効な場合のみ）
+        projection_bands = self._simulate_projection(total, today) if self.monte_carlo_paths > 0 else None
+
         # メッセージをフォーマット
-        message_text = format_summary_message(total, indicators, weekly_valuations)
+        message_text = format_summary_message(total, indicators, weekly_valuations, projection_bands)
 
         # 通知を送信
         self.notifier.notify([message_text])
         logger.info("サマリ通知を送信しました")
 
+    def _simulate_projection(self, total: AssetEvaluation, today: date) -> ProjectionBands | None:
+        """想定受取額(60歳)の分布をシミュレーションする
+
+        分布は通知の付加情報のため、計算に失敗した場合は分布を含めずに通知する。
+
+        Args:
+            total: 全商品合計の最新の資産情報
+            today: 基準日（日本時間）
+
+        Returns:
+            ProjectionBands | None: 想定受取額の分布。資産履歴が不足している場合、または計算に失敗した場合は None
+        """
+        try:
+            return self._run_projection(total, today)
+        except Exception:
+            logger.warning("想定受取額の分布の計算に失敗したため、分布を含めずに通知します", exc_info=True)
+            return None
+
+    def _run_projection(self, total: AssetEvaluation, today: date) -> ProjectionBands | None:
+        """資産履歴から収益率を推定し、想定受取額(60歳)の分布をシミュレーションする
+
+        Args:
+            total: 全商品合計の最新の資産情報
+            today: 基準日（日本時間）
+
+        Returns:
+            ProjectionBands | None: 想定受取額の分布。資産履歴が不足している場合は None
+        """
+        history = self.asset_repository.get_asset_history(PROJECTION_HISTORY_DAYS)
+        totals = [(d, AssetEvaluation.aggregate(history[d].values())) for d in sorted(history.keys())]
+
+        # シミュレーションは NumPy を使うため、domain の属性として参照した時点で読み込む
+        try:
+            parameters = domain.estimate_return_parameters(
+                dates=[d for d, _ in totals],
+                asset_valuation=[t.asset_valuation for _, t in totals],
+                cumulative_contributions=[t.cumulative_contributions for _, t in totals],
+            )
+        except ValueError:
+            logger.warning("資産履歴が不足しているため想定受取額の分布を計算しません", days=len(totals))
+            return None
+
+        with measure_stage("ProjectionSimulation"):
+            bands = domain.simulate_total_amount_at_60age(
+                asset_valuation=total.asset_valuation,
+                parameters=parameters,
+                today=today,
+                paths=self.monte_carlo_paths,
+            )
+        logger.info(
+            "想定受取額の分布を計算しました",
+            parameters=parameters.model_dump(),
+            percentiles=bands.percentiles,
+        )
+        return bands
+
     @staticmethod
     def _calculate_weekly_valuations(
         weekly_products: dict[date, dict[str, AssetEvaluation]],
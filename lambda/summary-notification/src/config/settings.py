@@ -1,4 +1,8 @@
+from typing import Literal
+
+from pydantic import model_validator
 from shared.config.base_settings import BaseEnvSettings, get_logger  # noqa: F401
+from shared.config.metrics import get_metrics, measure_stage, record_metric  # noqa: F401
 
 
 class EnvSettings(BaseEnvSettings):
@@ -8,6 +12,25 @@ class EnvSettings(BaseEnvSettings):
     line_message_parameter_name: str
     spreadsheet_parameter_name: str
 
+    # 資産レコードの取得元
+    asset_record_store: Literal["sheet", "s3"] = "sheet"
+
+    # 資産レコードの SQLite キャッシュファイルのパス（sheet の場合のみ有効、未指定の場合はキャッシュしない）
+    asset_cache_path: str | None = None
+
+    # 想定受取額(60歳)の分布のシミュレーション経路数（0 の場合は計算しない）
+    monte_carlo_paths: int = 0
+
+    # 資産レコード保存用 S3 バケット名（asset_record_store が s3 の場合は必須）
+    data_bucket_name: str | None = None
+
+    @model_validator(mode="after")
+    def _require_bucket_for_s3_store(self) -> "EnvSettings":
+        if self.asset_record_store == "s3" and not self.data_bucket_name:
+            msg = "asset_record_store=s3 の場合は data_bucket_name が必要です"
+            raise ValueError(msg)
+        return self
+
 
 def get_settings(settings_instance: EnvSettings | None = None) -> EnvSettings:
     """設定インスタンスを取得する
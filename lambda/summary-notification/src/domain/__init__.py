@@ -1,5 +1,8 @@
 """Domain レイヤー: モデル、インターフェース、例外"""
 
+from typing import TYPE_CHECKING
+
+from shared.config.lazy_exports import lazy_exports
 from shared.domain.asset_object import AssetEvaluation
 
 from .asset_interface import IAssetRepository
@@ -8,16 +11,51 @@ from .exceptions import (
     NotificationFailed,
     SummaryNotificationFailed,
 )
-from .indicator_object import OpsIndicators
+from .indicator_object import (
+    MoneyWeightedReturn,
+    OpsIndicators,
+    ProjectionBands,
+    ReturnParameters,
+)
 from .indicators_calculator import calculate_indicators
 from .notification_interface import INotifier
 
+if TYPE_CHECKING:
+    from .indicator_series_calculator import calculate_indicator_series, calculate_indicator_series_from_history
+    from .indicator_series_object import OpsIndicatorSeries
+    from .projection_simulator import estimate_return_parameters, simulate_total_amount_at_60age
+    from .return_calculator import calculate_xirr, calculate_xirr_series
+
+# NumPy に依存するため、参照時に読み込む
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "OpsIndicatorSeries": ".indicator_series_object",
+        "calculate_indicator_series": ".indicator_series_calculator",
+        "calculate_indicator_series_from_history": ".indicator_series_calculator",
+        "calculate_xirr": ".return_calculator",
+        "calculate_xirr_series": ".return_calculator",
+        "estimate_return_parameters": ".projection_simulator",
+        "simulate_total_amount_at_60age": ".projection_simulator",
+    },
+)
+
 __all__ = [
     # Models
     "AssetEvaluation",
     "OpsIndicators",
+    "OpsIndicatorSeries",
+    "MoneyWeightedReturn",
+    "ReturnParameters",
+    "ProjectionBands",
     # Domain Services
     "calculate_indicators",
+    "calculate_indicator_series",
+    "calculate_indicator_series_from_history",
+    "calculate_xirr",
+    "calculate_xirr_series",
+    "estimate_return_parameters",
+    "simulate_total_amount_at_60age",
     # Interfaces
     "IAssetRepository",
     "INotifier",
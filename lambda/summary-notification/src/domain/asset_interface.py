@@ -31,3 +31,19 @@ class IAssetRepository(ABC):
             AssetRetrievalFailed: 資産情報が見つからない場合
         """
         pass
+
+    @abstractmethod
+    def get_asset_history(self, days: int) -> dict[date, dict[str, AssetEvaluation]]:
+        """最新日付から直近カレンダー N 日分の資産情報を日付別に取得
+
+        Args:
+            days: 取得する日数
+
+        Returns:
+            dict[date, dict[str, AssetEvaluation]]: 日付 → 資産情報のマッピング
+            データが存在しない日は含まない
+
+        Raises:
+            AssetRetrievalFailed: 資産情報が見つからない場合
+        """
+        pass
@@ -21,6 +21,15 @@ class AssetRetrievalFailed(SummaryNotificationFailed):
         """
         return cls("スプレッドシートに資産情報が見つかりません")
 
+    @classmethod
+    def no_assets_in_store(cls) -> Self:
+        """資産レコードストアに資産情報が存在しない場合の例外を生成
+
+        Returns:
+            AssetRetrievalFailed: 生成された例外インスタンス
+        """
+        return cls("資産レコードストアに資産情報が見つかりません")
+
     @classmethod
     def during_fetching(cls) -> Self:
         """資産情報の取得中にエラーが発生した場合の例外インスタンスを生成する名前付きコンストラクタ
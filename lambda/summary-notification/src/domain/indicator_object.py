@@ -13,3 +13,39 @@ class OpsIndicators(BaseModel):
     operation_years: float
     actual_yield_rate: float
     total_amount_at_60age: int
+
+
+class MoneyWeightedReturn(BaseModel):
+    """金額加重収益率（XIRR）の計算結果を扱う値クラス
+
+    Attributes:
+        rate (float): 年率換算の金額加重収益率
+        iterations (int): 収束までの反復回数
+    """
+
+    rate: float
+    iterations: int
+
+
+class ReturnParameters(BaseModel):
+    """資産評価額の対数収益率の統計量を扱う値クラス
+
+    Attributes:
+        drift (float): 年率換算の対数収益率の平均
+        volatility (float): 年率換算の対数収益率の標準偏差
+    """
+
+    drift: float
+    volatility: float
+
+
+class ProjectionBands(BaseModel):
+    """60歳時点の想定受取額の分布（パーセンタイル）を扱う値クラス
+
+    Attributes:
+        percentiles (dict[int, int]): パーセンタイル → 想定受取額
+        paths (int): シミュレーションした経路数
+    """
+
+    percentiles: dict[int, int]
+    paths: int
@@ -0,0 +1,83 @@
+"""運用指標の時系列計算
+
+calculate_indicators と同じ計算式を、日付別の資産情報の配列に対して一括で適用する。
+"""
+
+from collections.abc import Mapping
+from datetime import date
+
+import numpy as np
+from numpy.typing import ArrayLike
+from shared.domain.asset_object import AssetEvaluation
+
+from .indicator_series_object import OpsIndicatorSeries
+from .indicators_calculator import ANNUAL_CONTRIBUTION, OPERATION_START_DATE, RETIREMENT_DATE
+
+
+def calculate_indicator_series(
+    dates: ArrayLike,
+    asset_valuation: ArrayLike,
+    cumulative_contributions: ArrayLike,
+    gains_or_losses: ArrayLike,
+) -> OpsIndicatorSeries:
+    """日付別の資産情報から運用指標の時系列を一括で計算するドメインサービス
+
+    calculate_indicators と同じ計算式・丸めを配列演算で適用する。
+    利回りが 0 の日の想定受取額は、計算式の極限（年間積立額 × 60歳までの年数 + 現在の資産評価額）とする。
+
+    Args:
+        dates: 日付の配列（datetime.date または datetime64）
+        asset_valuation: 資産評価額の配列
+        cumulative_contributions: 拠出金額累計の配列
+        gains_or_losses: 評価損益の配列
+
+    Returns:
+        OpsIndicatorSeries: 運用指標の時系列
+    """
+    days = np.asarray(dates, dtype="datetime64[D]")
+    valuation = np.asarray(asset_valuation, dtype=np.int64)
+    contributions = np.asarray(cumulative_contributions, dtype=np.float64)
+    gains = np.asarray(gains_or_losses, dtype=np.float64)
+
+    operation_years = _year_diff(np.datetime64(OPERATION_START_DATE, "D"), days)
+    years_to_60age = _year_diff(days, np.datetime64(RETIREMENT_DATE, "D"))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        yield_rate = np.round(gains / contributions / operation_years, 3)
+        annuity_factor = np.where(
+            yield_rate == 0,
+            years_to_60age,
+            (np.power(1 + yield_rate, years_to_60age) - 1) / yield_rate,
+        )
+
+    total_amount_at_60age = np.trunc(ANNUAL_CONTRIBUTION * annuity_factor).astype(np.int64) + valuation
+
+    return OpsIndicatorSeries(
+        dates=days,
+        operation_years=operation_years,
+        actual_yield_rate=yield_rate,
+        total_amount_at_60age=total_amount_at_60age,
+    )
+
+
+def calculate_indicator_series_from_history(history: Mapping[date, AssetEvaluation]) -> OpsIndicatorSeries:
+    """日付 → 総資産情報のマッピングから運用指標の時系列を計算する（日付昇順）
+
+    Args:
+        history: 日付 → 総資産情報のマッピング
+
+    Returns:
+        OpsIndicatorSeries: 運用指標の時系列
+    """
+    ordered = sorted(history.items())
+    return calculate_indicator_series(
+        dates=[d for d, _ in ordered],
+        asset_valuation=[a.asset_valuation for _, a in ordered],
+        cumulative_contributions=[a.cumulative_contributions for _, a in ordered],
+        gains_or_losses=[a.gains_or_losses for _, a in ordered],
+    )
+
+
+def _year_diff(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """calculate_year_diff の配列版（小数点以下2桁）"""
+    return np.round((end - start).astype(np.float64) / 365, 2)
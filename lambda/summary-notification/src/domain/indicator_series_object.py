@@ -0,0 +1,35 @@
+import numpy as np
+from pydantic import BaseModel, ConfigDict
+
+from .indicator_object import OpsIndicators
+
+
+class OpsIndicatorSeries(BaseModel):
+    """日付別の運用指標の時系列を扱う値クラス
+
+    各配列は dates と同じ長さで、同じ位置の要素が同じ日付に対応する。
+
+    Attributes:
+        dates (np.ndarray): 日付（datetime64[D]）
+        operation_years (np.ndarray): 運用年数（float64）
+        actual_yield_rate (np.ndarray): 運用利回り（float64）
+        total_amount_at_60age (np.ndarray): 想定受取額（60歳、int64）
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
+    dates: np.ndarray
+    operation_years: np.ndarray
+    actual_yield_rate: np.ndarray
+    total_amount_at_60age: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def at(self, index: int) -> OpsIndicators:
+        """指定位置の運用指標を取得する"""
+        return OpsIndicators(
+            operation_years=float(self.operation_years[index]),
+            actual_yield_rate=float(self.actual_yield_rate[index]),
+            total_amount_at_60age=int(self.total_amount_at_60age[index]),
+        )
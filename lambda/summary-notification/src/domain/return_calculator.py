@@ -0,0 +1,127 @@
+"""金額加重収益率（XIRR）の計算
+
+資産履歴の拠出金額累計の日次差分をキャッシュフロー（拠出）とみなし、
+最終日の資産評価額と一致する年率を求める。
+
+    資産評価額 = Σ 拠出額_i × (1 + r)^((最終日 - 拠出日_i) / 365)
+
+各拠出日から最終日までの複利成長を配列演算で評価し、ニュートン法で解く。
+ニュートン法のステップが探索区間を外れる場合は二分法に切り替えるため、初期値に関わらず収束する。
+前日の結果を初期値に渡すと（ウォームスタート）、日次の再計算は数回の反復で収束する。
+"""
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .indicator_object import MoneyWeightedReturn
+
+XIRR_TOLERANCE = 1e-10
+XIRR_MAX_ITERATIONS = 100
+
+# 探索区間（年率）
+RATE_LOWER_BOUND = -0.99
+RATE_UPPER_BOUND = 10.0
+
+_DAYS_PER_YEAR = 365
+
+
+def calculate_xirr(
+    dates: ArrayLike,
+    cumulative_contributions: ArrayLike,
+    final_valuation: float,
+    guess: float = 0.0,
+) -> MoneyWeightedReturn:
+    """資産履歴から最終日時点の金額加重収益率を計算するドメインサービス
+
+    初日の拠出金額累計は初日に一括で拠出したものとみなす。
+
+    Args:
+        dates: 日付の配列（日付昇順）
+        cumulative_contributions: 拠出金額累計の配列
+        final_valuation: 最終日の資産評価額
+        guess: 初期値（前日の計算結果を渡すとウォームスタートになる）
+
+    Returns:
+        MoneyWeightedReturn: 金額加重収益率
+
+    Raises:
+        ValueError: 拠出が最終日のみの場合、または探索区間内で収束しない場合
+    """
+    days = np.asarray(dates, dtype="datetime64[D]").astype(np.int64)
+    flows = np.diff(np.asarray(cumulative_contributions, dtype=np.float64), prepend=0.0)
+    mask = flows != 0
+    years = (days[-1] - days[mask]) / _DAYS_PER_YEAR
+    return _solve(flows[mask], years, float(final_valuation), guess)
+
+
+def calculate_xirr_series(
+    dates: ArrayLike,
+    cumulative_contributions: ArrayLike,
+    asset_valuation: ArrayLike,
+) -> np.ndarray:
+    """各日付時点の金額加重収益率の時系列を計算するドメインサービス
+
+    各日付の計算は前日の結果を初期値とするウォームスタートで行う。
+
+    Args:
+        dates: 日付の配列（日付昇順）
+        cumulative_contributions: 拠出金額累計の配列
+        asset_valuation: 資産評価額の配列
+
+    Returns:
+        np.ndarray: 金額加重収益率（float64）。計算できない日は NaN
+    """
+    days = np.asarray(dates, dtype="datetime64[D]").astype(np.int64)
+    flows = np.diff(np.asarray(cumulative_contributions, dtype=np.float64), prepend=0.0)
+    valuation = np.asarray(asset_valuation, dtype=np.float64)
+
+    flow_indexes = np.flatnonzero(flows)
+    flow_days = days[flow_indexes]
+    flow_amounts = flows[flow_indexes]
+
+    rates = np.full(len(days), np.nan)
+    guess = 0.0
+    for i, day in enumerate(days):
+        n = np.searchsorted(flow_indexes, i, side="right")
+        try:
+            result = _solve(flow_amounts[:n], (day - flow_days[:n]) / _DAYS_PER_YEAR, valuation[i], guess)
+        except ValueError:
+            continue
+        rates[i] = guess = result.rate
+
+    return rates
+
+
+def _solve(flows: np.ndarray, years: np.ndarray, final_valuation: float, guess: float) -> MoneyWeightedReturn:
+    """資産評価額 = Σ flows × (1 + r)^years を満たす r を求める（二分法で保護したニュートン法）"""
+    if not np.any(years > 0):
+        msg = "最終日より前の拠出がないため収益率を計算できません"
+        raise ValueError(msg)
+
+    lower, upper = RATE_LOWER_BOUND, RATE_UPPER_BOUND
+    rate = min(max(guess, lower), upper)
+    for iteration in range(1, XIRR_MAX_ITERATIONS + 1):
+        growth = np.power(1 + rate, years)
+        residual = final_valuation - flows @ growth
+        derivative = -(flows * years) @ (growth / (1 + rate))
+        if residual == 0:
+            return MoneyWeightedReturn(rate=float(rate), iterations=iteration)
+
+        # 拠出が正の場合、残差は rate に対して単調減少する
+        if residual > 0:
+            lower = rate
+        else:
+            upper = rate
+
+        next_rate = rate - residual / derivative if derivative != 0 else np.nan
+        if not lower < next_rate < upper:
+            next_rate = (lower + upper) / 2
+
+        if abs(next_rate - rate) < XIRR_TOLERANCE:
+            if not RATE_LOWER_BOUND < next_rate < RATE_UPPER_BOUND:
+                break
+            return MoneyWeightedReturn(rate=float(next_rate), iterations=iteration)
+        rate = next_rate
+
+    msg = "金額加重収益率が収束しませんでした"
+    raise ValueError(msg)
@@ -2,14 +2,16 @@
 
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
-from src.config.settings import get_logger
+from src.config.settings import get_logger, get_metrics
 from src.domain import SummaryNotificationFailed
 from src.presentation import main
 
 logger = get_logger()
+metrics = get_metrics()
 
 
 @logger.inject_lambda_context
+@metrics.log_metrics(capture_cold_start_metric=True)
 def handler(event: dict, context: LambdaContext) -> str:
     """Lambda handler エントリーポイント
 
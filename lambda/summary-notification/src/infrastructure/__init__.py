@@ -1,12 +1,38 @@
 """Infrastructure レイヤー: AWS サービス実装、外部 API 連携"""
 
-from shared.infrastructure.ssm_parameter import get_ssm_json_parameter
+from typing import TYPE_CHECKING
 
-from .google_sheet_asset_repository import GoogleSheetAssetRepository
-from .line_notifier import LineNotifier
+from shared.config.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from shared.infrastructure.asset_record_fingerprint import AssetRecordFingerprintStore
+    from shared.infrastructure.ssm_parameter import get_ssm_json_parameter, get_ssm_json_parameters
+
+    from .google_sheet_asset_repository import GoogleSheetAssetRepository
+    from .line_notifier import LineNotifier
+    from .s3_asset_repository import S3AssetRepository
+    from .sqlite_cached_asset_repository import SqliteCachedAssetRepository
+
+# 外部ライブラリ（boto3, gspread, google-auth, requests）に依存するため、参照時に読み込む
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "AssetRecordFingerprintStore": "shared.infrastructure.asset_record_fingerprint",
+        "GoogleSheetAssetRepository": ".google_sheet_asset_repository",
+        "LineNotifier": ".line_notifier",
+        "S3AssetRepository": ".s3_asset_repository",
+        "SqliteCachedAssetRepository": ".sqlite_cached_asset_repository",
+        "get_ssm_json_parameter": "shared.infrastructure.ssm_parameter",
+        "get_ssm_json_parameters": "shared.infrastructure.ssm_parameter",
+    },
+)
 
 __all__ = [
+    "AssetRecordFingerprintStore",
     "GoogleSheetAssetRepository",
     "LineNotifier",
+    "S3AssetRepository",
+    "SqliteCachedAssetRepository",
     "get_ssm_json_parameter",
+    "get_ssm_json_parameters",
 ]
@@ -1,17 +1,27 @@
-"""Google Spreadsheet 資産リポジトリ実装"""
+"""Google Spreadsheet 資産リポジトリ実装
 
+読み取った行は行ごとの辞書や AssetEvaluation を経由せず、列指向データ（AssetRecordColumns）に直接変換する。
+数値列は列単位で一括して int に変換し、AssetEvaluation は取得結果を返す時点でのみ生成する。
+"""
+
+from collections import Counter
+from collections.abc import Iterable
 from datetime import date, timedelta
 
-import gspread
-from google.oauth2.service_account import Credentials
+from gspread.exceptions import APIError
 from gspread.utils import rowcol_to_a1
+from shared.infrastructure.google_sheet_client import get_spreadsheet_client
+from shared.infrastructure.s3_asset_record_store import COLUMNS, AssetRecordColumns
+from shared.infrastructure.sheet_date_index import RANGE_NOT_FOUND_CODE, DateRowRange, SheetDateIndex
 
-from src.config.settings import get_logger
+from src.config.settings import get_logger, measure_stage
 from src.domain import AssetEvaluation, AssetRetrievalFailed, IAssetRepository
 
 logger = get_logger()
 
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
+WEEKLY_DAYS = 7
+NUMERIC_COLUMNS = ("asset_valuation", "cumulative_contributions", "gains_or_losses")
 
 
 class GoogleSheetAssetRepository(IAssetRepository):
@@ -27,18 +37,16 @@ class GoogleSheetAssetRepository(IAssetRepository):
             sheet_name: シート名
             credentials: サービスアカウント認証情報
         """
-        creds = Credentials.from_service_account_info(credentials, scopes=SCOPES)
-        client = gspread.authorize(creds)
-        spreadsheet = client.open_by_key(spreadsheet_id)
-        self.worksheet = spreadsheet.worksheet(sheet_name)
+        client = get_spreadsheet_client(credentials, SCOPES)
+        self.spreadsheet = client.open_by_key(spreadsheet_id)
+        self.worksheet = self.spreadsheet.worksheet(sheet_name)
+        self.date_index = SheetDateIndex(self.spreadsheet, sheet_name)
+        self._snapshot: dict[date, dict[str, AssetEvaluation]] | None = None
 
     def get_latest_assets(self) -> dict[str, AssetEvaluation]:
-        """最新日付の資産レコードを取得し商品別マッピングに変換する
+        """最新日付の資産レコードを商品別マッピングで取得する
 
-        1. ヘッダー行から列構成を取得
-        2. date 列のみ取得し、最新日付と該当行番号を特定
-        3. 該当行のデータのみ取得
-        4. 商品別マッピングに変換
+        最新日付は直近1週間の範囲に必ず含まれるため、スナップショットの最新日を返す。
 
         Returns:
             dict[str, AssetEvaluation]: 商品名 → 資産評価情報のマッピング
@@ -46,78 +54,262 @@ class GoogleSheetAssetRepository(IAssetRepository):
         Raises:
             AssetRetrievalFailed: 資産情報が見つからない場合
         """
-        try:
-            headers = self.worksheet.row_values(self.HEADER_ROW)
-            date_col = headers.index("date") + 1
-            date_values = self.worksheet.col_values(date_col)
-            data_dates = date_values[self.HEADER_ROW :]
+        snapshot = self._get_snapshot()
+        latest_date = max(snapshot)
+        logger.info("最新の資産情報を取得します", extra={"date": str(latest_date)})
+        return dict(snapshot[latest_date])
 
-            if not data_dates:
-                raise AssetRetrievalFailed.no_assets_in_spreadsheet()
+    def get_weekly_assets(self) -> dict[date, dict[str, AssetEvaluation]]:
+        """直近カレンダー7日分の資産情報を日付別に取得する
 
-            latest_date = max(data_dates)
-            logger.info("最新の資産情報を取得します", extra={"date": latest_date})
+        Returns:
+            dict[date, dict[str, AssetEvaluation]]: 日付 → 資産情報のマッピング
+        """
+        return dict(self._get_snapshot())
 
-            target_rows = [i + self.HEADER_ROW + 1 for i, d in enumerate(data_dates) if d == latest_date]
+    def get_asset_history(self, days: int) -> dict[date, dict[str, AssetEvaluation]]:
+        """最新日付から直近カレンダー N 日分の資産情報を日付別に取得する
 
-            num_cols = len(headers)
-            ranges = [f"{rowcol_to_a1(row, 1)}:{rowcol_to_a1(row, num_cols)}" for row in target_rows]
-            results = self.worksheet.batch_get(ranges)
-            rows = [dict(zip(headers, row[0])) for row in results if row and row[0]]
+        スナップショットとは別に、対象期間の行を読み取る。
 
-            return self._to_products(rows)
+        Args:
+            days: 取得する日数
 
-        except AssetRetrievalFailed:
-            raise
-        except Exception as e:
-            raise AssetRetrievalFailed.during_fetching() from e
+        Returns:
+            dict[date, dict[str, AssetEvaluation]]: 日付 → 資産情報のマッピング
 
-    def get_weekly_assets(self) -> dict[date, dict[str, AssetEvaluation]]:
-        """直近カレンダー7日分の資産情報を日付別に取得する
+        Raises:
+            AssetRetrievalFailed: 資産情報が見つからない場合
+        """
+        return self._read_assets(days)
+
+    def _get_snapshot(self) -> dict[date, dict[str, AssetEvaluation]]:
+        """直近カレンダー7日分のスナップショットを取得する
+
+        初回呼び出し時のみシートを読み取り、以降はインスタンス内に保持した結果を返す。
+        リポジトリは呼び出しごとに生成されるため、1 回の実行内で全クエリが同一のシート状態を参照する。
 
         Returns:
             dict[date, dict[str, AssetEvaluation]]: 日付 → 資産情報のマッピング
+
+        Raises:
+            AssetRetrievalFailed: 資産情報が見つからない場合
         """
-        try:
-            headers = self.worksheet.row_values(self.HEADER_ROW)
-            date_col = headers.index("date") + 1
-            date_values = self.worksheet.col_values(date_col)
-            data_dates = date_values[self.HEADER_ROW :]
+        if self._snapshot is None:
+            self._snapshot = self._read_assets(WEEKLY_DAYS)
+        return self._snapshot
 
-            if not data_dates:
-                raise AssetRetrievalFailed.no_assets_in_spreadsheet()
+    @measure_stage("SheetRead")
+    def _read_assets(self, days: int) -> dict[date, dict[str, AssetEvaluation]]:
+        """最新日付から直近カレンダー N 日分の資産情報をシートから読み取る
 
-            latest_date = max(data_dates)
-            latest_dt = date.fromisoformat(latest_date)
-            cutoff_dt = latest_dt - timedelta(days=7)
+        1. 日付インデックス（存在しない場合は date 列）から対象期間の行範囲を特定
+        2. 対象行を 1 回の範囲読み取りで取得し、対象日付の行を列指向データに変換
 
-            target_dates = {d for d in data_dates if date.fromisoformat(d) > cutoff_dt}
+        Args:
+            days: 取得する日数
 
-            result: dict[date, dict[str, AssetEvaluation]] = {}
-            num_cols = len(headers)
-            for target_date in target_dates:
-                target_rows = [i + self.HEADER_ROW + 1 for i, d in enumerate(data_dates) if d == target_date]
-                ranges = [f"{rowcol_to_a1(row, 1)}:{rowcol_to_a1(row, num_cols)}" for row in target_rows]
-                results = self.worksheet.batch_get(ranges)
-                rows = [dict(zip(headers, row[0])) for row in results if row and row[0]]
-                result[date.fromisoformat(target_date)] = self._to_products(rows)
+        Returns:
+            dict[date, dict[str, AssetEvaluation]]: 日付 → 資産情報のマッピング
+
+        Raises:
+            AssetRetrievalFailed: 資産情報が見つからない場合
+        """
+        try:
+            columns = self._get_rows_from_index(days)
+            if columns is None:
+                columns = self._get_rows_from_date_column(days)
 
-            return result
+            assets = columns.to_products_by_date()
 
         except AssetRetrievalFailed:
             raise
         except Exception as e:
             raise AssetRetrievalFailed.during_fetching() from e
 
-    def _to_products(self, rows: list[dict]) -> dict[str, AssetEvaluation]:
-        """フラットレコードから商品別マッピングを構築する"""
-        products: dict[str, AssetEvaluation] = {}
+        if not assets:
+            raise AssetRetrievalFailed.no_assets_in_spreadsheet()
 
-        for row in rows:
-            products[row["product"]] = AssetEvaluation(
-                asset_valuation=int(row["asset_valuation"]),
-                cumulative_contributions=int(row["cumulative_contributions"]),
-                gains_or_losses=int(row["gains_or_losses"]),
+        return assets
+
+    @measure_stage("SheetRead")
+    def get_rows_from(self, start_row: int) -> tuple[dict[str, DateRowRange], AssetRecordColumns] | None:
+        """日付インデックスと start_row 以降の行を 1 回の API 呼び出しで取得する
+
+        読み取りスルーキャッシュの差分取得に使用する。
+
+        Args:
+            start_row: 読み取りを開始する行番号
+
+        Returns:
+            tuple[dict[str, DateRowRange], AssetRecordColumns] | None:
+            日付インデックスと、読み取った行のうちインデックスに含まれる日付の行（シートの行順）。
+            インデックスが存在しない、空、またはインデックス上の最終行の後に行がある場合は None
+        """
+        sheet_range = f"'{self.worksheet.title}'!"
+        try:
+            response = self.spreadsheet.values_batch_get(
+                [
+                    self.date_index.range_name,
+                    f"{sheet_range}{self.HEADER_ROW}:{self.HEADER_ROW}",
+                    f"{sheet_range}{start_row}:{max(start_row, self.worksheet.row_count)}",
+                ]
             )
+        except APIError as e:
+            if e.code == RANGE_NOT_FOUND_CODE:
+                return None
+            raise
+
+        index_values, header_values, values = (r.get("values", []) for r in response["valueRanges"])
+        index = SheetDateIndex.parse(index_values)
+        if index is None:
+            return None
+
+        tail_offset = max(r.last_row for r in index.values()) + 1 - start_row
+        if any(row and row[0] for row in values[max(tail_offset, 0) :]):
+            logger.warning("日付インデックスにない行がシートに存在します")
+            return None
+
+        headers = header_values[0] if header_values else []
+        return index, self._parse_rows(headers, values, set(index))
+
+    def _get_rows_from_index(self, days: int) -> AssetRecordColumns | None:
+        """日付インデックスから対象行範囲を特定し、ヘッダー行と合わせて 1 回の読み取りで取得する
+
+        シートの履歴件数に関わらず API 呼び出しはインデックス読み取りと範囲読み取りの 2 回で済む。
+        インデックスの保存（クリアと追記）は行の書き込みとアトミックではないため、
+        インデックス上の最終行の直後の行も同じ読み取りで取得し、空でない場合（インデックスの保存に失敗し、
+        インデックスにない行が追記されている場合）はインデックスを使用しない。
+
+        Returns:
+            AssetRecordColumns | None: 対象日付の行。
+            インデックスが存在しない、またはシートの内容と一致しない場合は None
+        """
+        index = self.date_index.load()
+        if index is None:
+            return None
+
+        target_dates = self._target_dates(index.keys(), days)
+        ranges = [index[d] for d in target_dates]
+        first_row = min(r.first_row for r in ranges)
+        last_row = max(r.last_row for r in ranges)
+
+        tail_row = max(r.last_row for r in index.values()) + 1
+
+        header_values, values, tail_values = self.worksheet.batch_get(
+            [f"{self.HEADER_ROW}:{self.HEADER_ROW}", f"{first_row}:{last_row}", f"A{tail_row}"]
+        )
+        if any(row and row[0] for row in tail_values):
+            logger.warning("日付インデックスにない行がシートに存在するため date 列から取得します")
+            return None
+
+        headers = header_values[0] if header_values else []
+        columns = self._parse_rows(headers, values, target_dates)
+
+        counts = Counter(columns.dates)
+        if any(counts[d] != index[d].count for d in target_dates):
+            logger.warning("日付インデックスがシートの内容と一致しないため date 列から取得します")
+            return None
+
+        return columns
+
+    def _get_rows_from_date_column(self, days: int) -> AssetRecordColumns:
+        """date 列を走査して対象行を特定し、1 回の範囲読み取りで取得する
+
+        日付インデックスが利用できない場合のフォールバック。
+
+        Returns:
+            AssetRecordColumns: 対象日付の行
+        """
+        headers, data_dates = self._get_headers_and_dates()
+        target_dates = self._target_dates(data_dates, days)
+        return self._get_rows_by_date(headers, data_dates, target_dates)
+
+    @staticmethod
+    def _target_dates(dates: Iterable[str], days: int) -> set[str]:
+        """最新日付から直近カレンダー N 日分に含まれる日付を抽出する"""
+        unique_dates = set(dates)
+        cutoff = str(date.fromisoformat(max(unique_dates)) - timedelta(days=days))
+        return {d for d in unique_dates if d > cutoff}
+
+    def _get_headers_and_dates(self) -> tuple[list[str], list[str]]:
+        """ヘッダー行と date 列（ヘッダー除く）を取得する
+
+        Returns:
+            tuple[list[str], list[str]]: ヘッダー、データ行の日付リスト
+
+        Raises:
+            AssetRetrievalFailed: データ行が存在しない場合
+        """
+        headers = self.worksheet.row_values(self.HEADER_ROW)
+        date_col = headers.index("date") + 1
+        date_values = self.worksheet.col_values(date_col)
+        data_dates = date_values[self.HEADER_ROW :]
+
+        if not data_dates:
+            raise AssetRetrievalFailed.no_assets_in_spreadsheet()
+
+        return headers, data_dates
+
+    def _get_rows_by_date(
+        self,
+        headers: list[str],
+        data_dates: list[str],
+        target_dates: set[str],
+    ) -> AssetRecordColumns:
+        """対象日付の行を 1 回の範囲読み取りで取得し、列指向データに変換する
+
+        シートは日付順に追記されるため、対象行は末尾の連続した範囲に収まる。
+        範囲内に対象外の日付の行が混在する場合は読み取り後に除外する。
+
+        Args:
+            headers: ヘッダー行
+            data_dates: データ行の日付リスト
+            target_dates: 取得対象の日付
+
+        Returns:
+            AssetRecordColumns: 対象日付の行
+        """
+        target_indexes = [i for i, d in enumerate(data_dates) if d in target_dates]
+        if not target_indexes:
+            return AssetRecordColumns()
+
+        first_row = target_indexes[0] + self.HEADER_ROW + 1
+        last_row = target_indexes[-1] + self.HEADER_ROW + 1
+        values = self.worksheet.get(f"{rowcol_to_a1(first_row, 1)}:{rowcol_to_a1(last_row, len(headers))}")
+        return self._parse_rows(headers, values, target_dates)
+
+    @staticmethod
+    def _parse_rows(
+        headers: list[str],
+        values: list[list[str]],
+        target_dates: set[str],
+    ) -> AssetRecordColumns:
+        """読み取った行のうち対象日付の行を列指向データに変換する
+
+        列の位置はヘッダーから 1 回だけ解決し、対象行から列ごとに値を取り出す。
+        行ごとの辞書や中間のタプルは生成せず、数値列は取り出す際に int に変換する
+        （変換できない値がある場合は ValueError）。
+
+        Args:
+            headers: ヘッダー行
+            values: 読み取った行
+            target_dates: 取得対象の日付
+
+        Returns:
+            AssetRecordColumns: 対象日付の行（シートの行順）
+        """
+        if not values:
+            return AssetRecordColumns()
+
+        positions = {name: headers.index(name) for name in COLUMNS}
+        date_position = positions["date"]
+        selected = [row for row in values if len(row) > date_position and row[date_position] in target_dates]
 
-        return products
+        columns: dict[str, list] = {}
+        for name, position in positions.items():
+            if name in NUMERIC_COLUMNS:
+                columns[name] = [int(row[position]) for row in selected]
+            else:
+                columns[name] = [row[position] for row in selected]
+        return AssetRecordColumns(columns)
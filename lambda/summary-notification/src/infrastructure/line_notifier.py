@@ -4,7 +4,7 @@ import json
 
 import requests
 
-from src.config.settings import get_logger
+from src.config.settings import get_logger, measure_stage
 from src.domain import INotifier, NotificationFailed
 
 logger = get_logger()
@@ -30,6 +30,7 @@ class LineNotifier(INotifier):
             "Authorization": f"Bearer {token}",
         }
 
+    @measure_stage("LineSend")
     def notify(self, messages: list[str]) -> None:
         """通知を送信
 
@@ -0,0 +1,112 @@
+"""S3 列指向ストアを使った資産リポジトリ実装"""
+
+from datetime import date, timedelta
+
+from shared.infrastructure.s3_asset_record_store import AssetRecordColumns, S3AssetRecordStore
+
+from src.config.settings import get_logger
+from src.domain import AssetEvaluation, AssetRetrievalFailed, IAssetRepository
+
+logger = get_logger()
+
+WEEKLY_DAYS = 7
+
+
+class S3AssetRepository(IAssetRepository):
+    """S3 の列指向ストアから資産情報を取得するリポジトリ"""
+
+    def __init__(self, bucket: str, store: S3AssetRecordStore | None = None) -> None:
+        """リポジトリを初期化
+
+        Args:
+            bucket: S3 バケット名
+            store: 列指向ストア（テスト時に注入可能）
+        """
+        self.store = store if store is not None else S3AssetRecordStore(bucket)
+        self._snapshot: dict[date, dict[str, AssetEvaluation]] | None = None
+
+    def get_latest_assets(self) -> dict[str, AssetEvaluation]:
+        """最新日付の資産レコードを商品別マッピングで取得する
+
+        Returns:
+            dict[str, AssetEvaluation]: 商品名 → 資産評価情報のマッピング
+
+        Raises:
+            AssetRetrievalFailed: 資産情報が見つからない場合
+        """
+        snapshot = self._get_snapshot()
+        latest_date = max(snapshot)
+        logger.info("最新の資産情報を取得します", extra={"date": str(latest_date)})
+        return dict(snapshot[latest_date])
+
+    def get_weekly_assets(self) -> dict[date, dict[str, AssetEvaluation]]:
+        """直近カレンダー7日分の資産情報を日付別に取得する
+
+        Returns:
+            dict[date, dict[str, AssetEvaluation]]: 日付 → 資産情報のマッピング
+        """
+        return dict(self._get_snapshot())
+
+    def get_asset_history(self, days: int) -> dict[date, dict[str, AssetEvaluation]]:
+        """最新日付から直近カレンダー N 日分の資産情報を日付別に取得する
+
+        Args:
+            days: 取得する日数
+
+        Returns:
+            dict[date, dict[str, AssetEvaluation]]: 日付 → 資産情報のマッピング
+
+        Raises:
+            AssetRetrievalFailed: 資産情報が見つからない場合
+        """
+        return self._read_assets(days)
+
+    def _get_snapshot(self) -> dict[date, dict[str, AssetEvaluation]]:
+        """直近カレンダー7日分のスナップショットを取得する
+
+        Returns:
+            dict[date, dict[str, AssetEvaluation]]: 日付 → 資産情報のマッピング
+
+        Raises:
+            AssetRetrievalFailed: 資産情報が見つからない場合
+        """
+        if self._snapshot is None:
+            self._snapshot = self._read_assets(WEEKLY_DAYS)
+        return self._snapshot
+
+    def _read_assets(self, days: int) -> dict[date, dict[str, AssetEvaluation]]:
+        """最新日付から直近カレンダー N 日分の資産情報をストアから読み取る
+
+        最新年のパーティションを 1 回読み取り、日付列の二分探索で対象期間を切り出す。
+        対象期間が年をまたぐ場合のみ前年以前のパーティションも読み取る。
+
+        Args:
+            days: 取得する日数
+
+        Returns:
+            dict[date, dict[str, AssetEvaluation]]: 日付 → 資産情報のマッピング
+
+        Raises:
+            AssetRetrievalFailed: 資産情報が見つからない場合
+        """
+        try:
+            years = self.store.list_years()
+            latest_partition = self.store.read_year(years[-1]) if years else AssetRecordColumns()
+            if len(latest_partition) == 0:
+                raise AssetRetrievalFailed.no_assets_in_store()
+
+            latest_dt = date.fromisoformat(latest_partition.dates[-1])
+            start_dt = latest_dt - timedelta(days=days - 1)
+
+            window = latest_partition.slice_dates(start=str(start_dt))
+            for year in reversed([y for y in years if start_dt.year <= y < latest_dt.year]):
+                window = self.store.read_year(year).slice_dates(start=str(start_dt)).concat(window)
+
+            assets = window.to_products_by_date()
+
+        except AssetRetrievalFailed:
+            raise
+        except Exception as e:
+            raise AssetRetrievalFailed.during_fetching() from e
+
+        return assets
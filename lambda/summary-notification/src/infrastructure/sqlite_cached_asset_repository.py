@@ -0,0 +1,321 @@
+"""SQLite 読み取りスルーキャッシュ付き資産リポジトリ実装
+
+Lambda のウォームコンテナでは /tmp が呼び出し間で保持されるため、
+取得済みの資産レコードを /tmp 上の SQLite に保存し、以降の呼び出しでは
+キャッシュ済みの最新日付以降の行だけを差分取得する。
+資産レコードのフィンガープリントが前回の同期時から変わっていない場合は、シートの読み取りも省略する。
+"""
+
+import sqlite3
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import date
+
+from shared.infrastructure.asset_record_fingerprint import AssetRecordFingerprintStore, RecordFingerprint
+from shared.infrastructure.s3_asset_record_store import AssetRecordColumns
+from shared.infrastructure.sheet_date_index import DateRowRange
+
+from src.config.settings import get_logger
+from src.domain import AssetEvaluation, AssetRetrievalFailed, IAssetRepository
+
+from .google_sheet_asset_repository import GoogleSheetAssetRepository
+
+logger = get_logger()
+
+DEFAULT_CACHE_PATH = "/tmp/asset_records.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    date TEXT NOT NULL,
+    product TEXT NOT NULL,
+    asset_valuation INTEGER NOT NULL,
+    cumulative_contributions INTEGER NOT NULL,
+    gains_or_losses INTEGER NOT NULL,
+    PRIMARY KEY (date, product)
+);
+CREATE TABLE IF NOT EXISTS sheet_index (
+    date TEXT PRIMARY KEY,
+    first_row INTEGER NOT NULL,
+    last_row INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# 同期時点の資産レコードのフィンガープリント（sync_state のキー）
+_FINGERPRINT_VERSION_KEY = "fingerprint_version"
+
+
+class SqliteCachedAssetRepository(IAssetRepository):
+    """Google Spreadsheet の資産レコードを SQLite にキャッシュするリポジトリ
+
+    キャッシュにはシートの日付インデックス（日付 → 行範囲）も保存する。
+    キャッシュ済みの最新日付の先頭行以降を読み取ることで、最新日付の再書き込みと
+    新しい日付の追加を 1 回の API 呼び出しで反映する。
+    キャッシュ済みのそれ以前の日付の行範囲が変わっていた場合はキャッシュを破棄して全件取得する。
+
+    行範囲が変わらない過去日付の上書き（同一件数での再取得）は行範囲からは検出できない。
+    フィンガープリントのストアを指定した場合は、最後に保存された日付がキャッシュ済みの最新日付より
+    古ければその日付以降を読み直す。ただし前回の同期以降に複数の過去日付が上書きされた場合に反映されるのは
+    最後に保存された日付のみであり、ストアを指定しない場合は過去日付の上書きは反映されない。
+    """
+
+    HEADER_ROW = GoogleSheetAssetRepository.HEADER_ROW
+
+    def __init__(
+        self,
+        source: GoogleSheetAssetRepository,
+        cache_path: str = DEFAULT_CACHE_PATH,
+        fingerprint_store: AssetRecordFingerprintStore | None = None,
+    ) -> None:
+        """リポジトリを初期化
+
+        Args:
+            source: 取得元の Google Spreadsheet リポジトリ
+            cache_path: SQLite ファイルのパス
+            fingerprint_store: 資産レコードのフィンガープリントのストア（省略時は毎回シートを読み取る）
+        """
+        self.source = source
+        self.cache_path = cache_path
+        self.fingerprint_store = fingerprint_store
+        self._synced = False
+        self._use_source = False
+
+    def get_latest_assets(self) -> dict[str, AssetEvaluation]:
+        """最新日付の資産レコードを商品別マッピングで取得する
+
+        Returns:
+            dict[str, AssetEvaluation]: 商品名 → 資産評価情報のマッピング
+
+        Raises:
+            AssetRetrievalFailed: 資産情報が見つからない場合
+        """
+        self._sync()
+        if self._use_source:
+            return self.source.get_latest_assets()
+
+        assets = self._query("WHERE date = (SELECT MAX(date) FROM assets)")
+        latest_date = max(assets)
+        logger.info("最新の資産情報を取得します", extra={"date": str(latest_date)})
+        return assets[latest_date]
+
+    def get_weekly_assets(self) -> dict[date, dict[str, AssetEvaluation]]:
+        """直近カレンダー7日分の資産情報を日付別に取得する
+
+        Returns:
+            dict[date, dict[str, AssetEvaluation]]: 日付 → 資産情報のマッピング
+        """
+        self._sync()
+        if self._use_source:
+            return self.source.get_weekly_assets()
+
+        return self._query_recent(days=7)
+
+    def get_asset_history(self, days: int) -> dict[date, dict[str, AssetEvaluation]]:
+        """最新日付から直近カレンダー N 日分の資産情報を日付別に取得する
+
+        Args:
+            days: 取得する日数
+
+        Returns:
+            dict[date, dict[str, AssetEvaluation]]: 日付 → 資産情報のマッピング
+        """
+        self._sync()
+        if self._use_source:
+            return self.source.get_asset_history(days)
+
+        return self._query_recent(days)
+
+    def _query_recent(self, days: int) -> dict[date, dict[str, AssetEvaluation]]:
+        """最新日付から直近カレンダー N 日分の資産情報を日付別に取得する"""
+        return self._query(
+            "WHERE date > date((SELECT MAX(date) FROM assets), ?)",
+            (f"-{days} days",),
+        )
+
+    def _sync(self) -> None:
+        """キャッシュをシートの内容に追従させる（インスタンスごとに 1 回）
+
+        Raises:
+            AssetRetrievalFailed: 資産情報が見つからない場合
+        """
+        if self._synced:
+            return
+
+        try:
+            with self._connect() as conn:
+                self._refresh(conn)
+        except AssetRetrievalFailed:
+            raise
+        except sqlite3.Error:
+            logger.warning("資産キャッシュを利用できないためシートから直接取得します", exc_info=True)
+            self._use_source = True
+        except Exception as e:
+            raise AssetRetrievalFailed.during_fetching() from e
+
+        self._synced = True
+
+    def _refresh(self, conn: sqlite3.Connection) -> None:
+        """キャッシュ済みの最新日付以降の行を取得してキャッシュを更新する"""
+        cached_index = self._load_cached_index(conn)
+        fingerprint = self._load_fingerprint()
+        version = fingerprint.version if fingerprint is not None else None
+        if version is not None and cached_index and self._load_synced_version(conn) == version:
+            logger.info("資産レコードが前回の同期以降更新されていないためシートの読み取りを省略します")
+            return
+
+        refresh_from = max(cached_index) if cached_index else None
+        saved_date = fingerprint.date if fingerprint is not None else None
+        if refresh_from and saved_date in cached_index and saved_date < refresh_from:
+            # 最後に保存された日付が過去日付の場合（再取得による上書き）は、その日付以降を読み直す
+            logger.info("過去日付の資産レコードが保存されたためその日付以降を読み直します", extra={"date": saved_date})
+            refresh_from = saved_date
+        start_row = cached_index[refresh_from].first_row if refresh_from else self.HEADER_ROW + 1
+
+        fetched = self.source.get_rows_from(start_row)
+        if (
+            fetched is not None
+            and refresh_from
+            and not self._is_prefix_unchanged(cached_index, fetched[0], refresh_from)
+        ):
+            logger.info("シートの行位置が変わったため資産キャッシュを再構築します")
+            refresh_from = None
+            fetched = self.source.get_rows_from(self.HEADER_ROW + 1)
+
+        if fetched is None:
+            logger.warning("日付インデックスを利用できないため資産キャッシュを使用せずに取得します")
+            self._use_source = True
+            return
+
+        index, columns = fetched
+
+        refresh_dates = [d for d in index if refresh_from is None or d >= refresh_from]
+        counts = Counter(columns.dates)
+        if any(counts[d] != index[d].count for d in refresh_dates):
+            logger.warning("日付インデックスがシートの内容と一致しないため資産キャッシュを使用せずに取得します")
+            self._use_source = True
+            return
+
+        self._write(conn, index, columns, refresh_dates, full=refresh_from is None)
+        self._save_synced_version(conn, version)
+        logger.info("資産キャッシュを更新しました", extra={"refreshed_dates": refresh_dates})
+
+    @staticmethod
+    def _is_prefix_unchanged(
+        cached_index: dict[str, DateRowRange],
+        index: dict[str, DateRowRange],
+        refresh_from: str,
+    ) -> bool:
+        """読み直す日付より前のキャッシュ済みの日付の行位置がシート上で変わっていないか
+
+        読み直す日付以降は再書き込みで行数が変わりうるため、読み直す日付は先頭行のみ比較する。
+        """
+        if refresh_from not in index or index[refresh_from].first_row != cached_index[refresh_from].first_row:
+            return False
+        return all(index.get(d) == r for d, r in cached_index.items() if d < refresh_from)
+
+    def _load_fingerprint(self) -> RecordFingerprint | None:
+        """資産レコードのフィンガープリントを読み込む（読み込めない場合は None）
+
+        書き込み側はレコードの保存前にフィンガープリントを削除するため、
+        存在しない場合（保存中・保存失敗時）はシートを読み取る。
+        """
+        if self.fingerprint_store is None:
+            return None
+        try:
+            return self.fingerprint_store.load()
+        except Exception:
+            logger.warning("資産レコードのフィンガープリントを読み込めないためシートを読み取ります", exc_info=True)
+            return None
+
+    @staticmethod
+    def _load_synced_version(conn: sqlite3.Connection) -> str | None:
+        """前回の同期時点のフィンガープリントを読み込む"""
+        row = conn.execute("SELECT value FROM sync_state WHERE key = ?", (_FINGERPRINT_VERSION_KEY,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _save_synced_version(conn: sqlite3.Connection, version: str | None) -> None:
+        """同期時点のフィンガープリントを保存する（不明な場合は削除し、次回はシートを読み取る）"""
+        if version is None:
+            conn.execute("DELETE FROM sync_state WHERE key = ?", (_FINGERPRINT_VERSION_KEY,))
+        else:
+            conn.execute("INSERT OR REPLACE INTO sync_state VALUES (?, ?)", (_FINGERPRINT_VERSION_KEY, version))
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """SQLite に接続し、スキーマを作成する（ブロック終了時にコミットして切断）"""
+        conn = sqlite3.connect(self.cache_path)
+        try:
+            conn.executescript(_SCHEMA)
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _load_cached_index(conn: sqlite3.Connection) -> dict[str, DateRowRange]:
+        """キャッシュ済みの日付インデックスを読み込む"""
+        rows = conn.execute("SELECT date, first_row, last_row FROM sheet_index ORDER BY date")
+        return {d: DateRowRange(first_row, last_row) for d, first_row, last_row in rows}
+
+    @staticmethod
+    def _write(
+        conn: sqlite3.Connection,
+        index: dict[str, DateRowRange],
+        columns: AssetRecordColumns,
+        refresh_dates: list[str],
+        full: bool,
+    ) -> None:
+        """取得した日付の行と日付インデックスをキャッシュに書き込む（1 トランザクション）"""
+        if full:
+            conn.execute("DELETE FROM assets")
+            conn.execute("DELETE FROM sheet_index")
+            conn.execute("DELETE FROM sync_state")
+        elif refresh_dates:
+            conn.execute("DELETE FROM assets WHERE date >= ?", (min(refresh_dates),))
+
+        refresh = set(refresh_dates)
+        c = columns.columns
+        conn.executemany(
+            "INSERT OR REPLACE INTO assets VALUES (?, ?, ?, ?, ?)",
+            (
+                row
+                for row in zip(
+                    c["date"], c["product"], c["asset_valuation"], c["cumulative_contributions"], c["gains_or_losses"]
+                )
+                if row[0] in refresh
+            ),
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO sheet_index VALUES (?, ?, ?)",
+            ((d, index[d].first_row, index[d].last_row) for d in refresh_dates),
+        )
+
+    def _query(self, where: str, params: tuple = ()) -> dict[date, dict[str, AssetEvaluation]]:
+        """条件に一致する資産レコードを日付別の商品別マッピングで取得する
+
+        Raises:
+            AssetRetrievalFailed: 資産情報が見つからない場合
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT date, product, asset_valuation, cumulative_contributions, gains_or_losses "
+                f"FROM assets {where} ORDER BY date",
+                params,
+            ).fetchall()
+
+        if not rows:
+            raise AssetRetrievalFailed.no_assets_in_spreadsheet()
+
+        assets: dict[date, dict[str, AssetEvaluation]] = {}
+        for d, product, asset_valuation, cumulative_contributions, gains_or_losses in rows:
+            assets.setdefault(date.fromisoformat(d), {})[product] = AssetEvaluation(
+                asset_valuation=asset_valuation,
+                cumulative_contributions=cumulative_contributions,
+                gains_or_losses=gains_or_losses,
+            )
+        return assets
@@ -1,13 +1,9 @@
 """サマリ通知ハンドラー"""
 
+from src import infrastructure
 from src.application import SummaryNotificationService
 from src.config.settings import get_logger, get_settings
 from src.domain import IAssetRepository, INotifier
-from src.infrastructure import (
-    GoogleSheetAssetRepository,
-    LineNotifier,
-    get_ssm_json_parameter,
-)
 
 settings = get_settings()
 logger = get_logger()
@@ -23,25 +19,66 @@ def main(
         asset_repository: 資産リポジトリ (テスト時に Mock 注入可能)
         notifier: 通知クライアント (テスト時に Mock 注入可能)
     """
+    # 実装の生成に必要な SSM パラメータを 1 回の API 呼び出しでまとめて取得
+    parameter_names = []
+    if asset_repository is None and settings.asset_record_store != "s3":
+        parameter_names.append(settings.spreadsheet_parameter_name)
+    if notifier is None:
+        parameter_names.append(settings.line_message_parameter_name)
+    parameters = infrastructure.get_ssm_json_parameters(parameter_names, decrypt=True)
+
     # 資産リポジトリが指定されていない場合のみ実装を使用
     if asset_repository is None:
-        spreadsheet_parameter = get_ssm_json_parameter(name=settings.spreadsheet_parameter_name, decrypt=True)
-        asset_repository = GoogleSheetAssetRepository(
-            spreadsheet_id=spreadsheet_parameter["spreadsheet_id"],
-            sheet_name=spreadsheet_parameter["sheet_name"],
-            credentials=spreadsheet_parameter["credentials"],
-        )
+        asset_repository = _create_asset_repository(parameters)
 
     # 通知クライアントが指定されていない場合のみ実装を使用
     if notifier is None:
-        line_message_parameter = get_ssm_json_parameter(name=settings.line_message_parameter_name, decrypt=True)
-        notifier = LineNotifier(
+        line_message_parameter = parameters[settings.line_message_parameter_name]
+        notifier = infrastructure.LineNotifier(
             url=line_message_parameter["url"],
             token=line_message_parameter["token"],
         )
 
     # サマリ通知サービス実行
-    service = SummaryNotificationService(asset_repository=asset_repository, notifier=notifier)
+    service = SummaryNotificationService(
+        asset_repository=asset_repository,
+        notifier=notifier,
+        monte_carlo_paths=settings.monte_carlo_paths,
+    )
     service.send_summary()
 
     logger.info("サマリ通知処理が完了しました")
+
+
+def _create_asset_repository(parameters: dict[str, dict]) -> IAssetRepository:
+    """設定に応じた資産リポジトリを生成する
+
+    Args:
+        parameters: パラメータ名 → SSM パラメータの辞書
+
+    Returns:
+        IAssetRepository: asset_record_store が s3 の場合は S3 列指向ストア、それ以外は Google Spreadsheet。
+        asset_cache_path が指定されている場合は Google Spreadsheet を SQLite キャッシュ経由で参照する
+        （data_bucket_name が指定されている場合、フィンガープリントが変わっていなければシートを読み取らない）
+    """
+    if settings.asset_record_store == "s3":
+        return infrastructure.S3AssetRepository(bucket=settings.data_bucket_name)
+
+    spreadsheet_parameter = parameters[settings.spreadsheet_parameter_name]
+    repository = infrastructure.GoogleSheetAssetRepository(
+        spreadsheet_id=spreadsheet_parameter["spreadsheet_id"],
+        sheet_name=spreadsheet_parameter["sheet_name"],
+        credentials=spreadsheet_parameter["credentials"],
+    )
+    if settings.asset_cache_path:
+        fingerprint_store = (
+            infrastructure.AssetRecordFingerprintStore(bucket=settings.data_bucket_name)
+            if settings.data_bucket_name
+            else None
+        )
+        return infrastructure.SqliteCachedAssetRepository(
+            source=repository,
+            cache_path=settings.asset_cache_path,
+            fingerprint_store=fingerprint_store,
+        )
+    return repository
@@ -1,7 +1,7 @@
 from datetime import date
 
 from src.application import format_summary_message
-from src.domain import AssetEvaluation, OpsIndicators
+from src.domain import AssetEvaluation, OpsIndicators, ProjectionBands
 
 
 class TestFormatSummaryMessage:
@@ -81,3 +81,17 @@ class TestFormatSummaryMessage:
         result = format_summary_message(total, indicators, [])
 
         assert "資産評価額推移" not in result
+
+    def test_format_summary_message__contains_projection_bands(self):
+        """分布が指定された場合、パーセンタイル別の想定受取額が含まれる"""
+        total = AssetEvaluation(cumulative_contributions=900_000, gains_or_losses=300_000, asset_valuation=1_200_000)
+        indicators = OpsIndicators(
+            operation_years=9.34,
+            actual_yield_rate=0.036,
+            total_amount_at_60age=15_000_000,
+        )
+        bands = ProjectionBands(percentiles={95: 20_000_000, 5: 9_000_000, 50: 14_000_000}, paths=10_000)
+
+        result = format_summary_message(total, indicators, [], bands)
+
+        assert "想定受取額(60歳)の分布\n5%: 9,000,000円\n50%: 14,000,000円\n95%: 20,000,000円\n" in result
@@ -1,8 +1,10 @@
-from datetime import date
+from datetime import UTC, date, datetime, timedelta
 
 import pytest
 
-from src.application import SummaryNotificationService
+from src import domain
+from src.application import SummaryNotificationService, summary_notification_service
+from src.config.settings import get_metrics
 from src.domain import AssetEvaluation, AssetRetrievalFailed
 from tests.fixtures.mocks import MockAssetRepository, MockNotifier
 
@@ -116,6 +118,131 @@ class TestSummaryNotificationService:
         assert "2026-02-13: 595,000円 -2,000円" in message_text
         assert "2026-02-12: 597,000円 -" in message_text
 
+    def test_send_summary__message_contains_projection_bands(self, sample_assets):
+        """シミュレーション経路数を指定した場合、想定受取額の分布が含まれる"""
+        # given
+        history = {
+            date(2026, 1, 1) + timedelta(days=i): {
+                "商品A": AssetEvaluation(
+                    cumulative_contributions=900_000,
+                    gains_or_losses=300_000 + 1_000 * i * (-1) ** i,
+                    asset_valuation=1_200_000 + 1_000 * i * (-1) ** i,
+                ),
+            }
+            for i in range(30)
+        }
+        repo = MockAssetRepository(assets=sample_assets, history=history)
+        notifier = MockNotifier()
+        service = SummaryNotificationService(asset_repository=repo, notifier=notifier, monte_carlo_paths=1_000)
+
+        # when
+        service.send_summary()
+
+        # then
+        message_text = notifier.messages_sent[0]
+        assert "想定受取額(60歳)の分布" in message_text
+        assert "50%:" in message_text
+
+    def test_send_summary__skips_projection_without_history(self, sample_assets):
+        """資産履歴が不足している場合、分布を含めずに送信する"""
+        # given
+        repo = MockAssetRepository(assets=sample_assets)
+        notifier = MockNotifier()
+        service = SummaryNotificationService(asset_repository=repo, notifier=notifier, monte_carlo_paths=1_000)
+
+        # when
+        service.send_summary()
+
+        # then
+        assert "想定受取額(60歳)の分布" not in notifier.messages_sent[0]
+
+    def test_send_summary__skips_projection_when_history_retrieval_fails(self, sample_assets, mocker):
+        """資産履歴の取得に失敗した場合、分布を含めずに送信する"""
+        # given
+        repo = MockAssetRepository(assets=sample_assets)
+        mocker.patch.object(repo, "get_asset_history", side_effect=AssetRetrievalFailed.during_fetching())
+        notifier = MockNotifier()
+        service = SummaryNotificationService(asset_repository=repo, notifier=notifier, monte_carlo_paths=1_000)
+
+        # when
+        service.send_summary()
+
+        # then
+        assert len(notifier.messages_sent) == 1
+        assert "想定受取額(60歳)の分布" not in notifier.messages_sent[0]
+
+    def test_send_summary__skips_projection_when_simulation_fails(self, sample_assets):
+        """評価額が 0 の日を含むなど、分布を計算できない場合も分布を含めずに送信する"""
+        # given
+        history = {
+            date(2026, 1, 1) + timedelta(days=i): {
+                "商品A": AssetEvaluation(
+                    cumulative_contributions=0,
+                    gains_or_losses=0,
+                    asset_valuation=0 if i % 2 else 1_000,
+                ),
+            }
+            for i in range(30)
+        }
+        repo = MockAssetRepository(assets=sample_assets, history=history)
+        notifier = MockNotifier()
+        service = SummaryNotificationService(asset_repository=repo, notifier=notifier, monte_carlo_paths=1_000)
+
+        # when
+        service.send_summary()
+
+        # then
+        assert len(notifier.messages_sent) == 1
+        assert "想定受取額(60歳)の分布" not in notifier.messages_sent[0]
+
+    def test_send_summary__uses_japan_date_as_base_date(self, sample_assets, mocker):
+        """運用指標と想定受取額の分布は、実行環境の時刻によらず日本時間の日付を基準日とする"""
+
+        # given
+        class _FixedDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                # UTC では 2026-02-14、日本時間では 2026-02-15
+                return datetime(2026, 2, 14, 15, 30, tzinfo=UTC).astimezone(tz)
+
+        mocker.patch("src.application.summary_notification_service.datetime", _FixedDatetime)
+        calculate_indicators = mocker.spy(summary_notification_service, "calculate_indicators")
+        simulate = mocker.spy(domain, "simulate_total_amount_at_60age")
+        history = {
+            date(2026, 1, 1) + timedelta(days=i): {
+                "商品A": AssetEvaluation(
+                    cumulative_contributions=900_000,
+                    gains_or_losses=300_000 + 1_000 * i * (-1) ** i,
+                    asset_valuation=1_200_000 + 1_000 * i * (-1) ** i,
+                ),
+            }
+            for i in range(30)
+        }
+        repo = MockAssetRepository(assets=sample_assets, history=history)
+        service = SummaryNotificationService(asset_repository=repo, notifier=MockNotifier(), monte_carlo_paths=100)
+
+        # when
+        service.send_summary()
+
+        # then
+        assert calculate_indicators.call_args.kwargs["today"] == date(2026, 2, 15)
+        assert simulate.call_args.kwargs["today"] == date(2026, 2, 15)
+
+    def test_send_summary__records_indicator_calculation_duration(self, sample_assets):
+        """運用指標の計算時間をメトリクスとして記録する"""
+        # given
+        metrics = get_metrics()
+        metrics.clear_metrics()
+        repo = MockAssetRepository(assets=sample_assets)
+        service = SummaryNotificationService(asset_repository=repo, notifier=MockNotifier())
+
+        # when
+        service.send_summary()
+
+        # then
+        assert len(metrics.metric_set["IndicatorCalculationDuration"]["Value"]) == 1
+        metrics.clear_metrics()
+
 
 class TestCalculateWeeklyValuations:
     def test_calculate_weekly_valuations__returns_descending_order(self):
@@ -1,7 +1,15 @@
-from datetime import date
+from datetime import date, timedelta
 
-from src.domain import AssetEvaluation, calculate_indicators
+import numpy as np
+
+from src.domain import (
+    AssetEvaluation,
+    calculate_indicator_series,
+    calculate_indicator_series_from_history,
+    calculate_indicators,
+)
 from src.domain.indicators_calculator import (
+    ANNUAL_CONTRIBUTION,
     calculate_annual_yield_rate,
     calculate_total_amount_at_60age,
     calculate_year_diff,
@@ -75,3 +83,48 @@ class TestCalculateIndicators:
         assert result.actual_yield_rate > 0
         assert result.total_amount_at_60age > 1_200_000
         assert isinstance(result.total_amount_at_60age, int)
+
+
+class TestCalculateIndicatorSeries:
+    def test_calculate_indicator_series__matches_scalar_calculation(self):
+        """各日付の計算結果が calculate_indicators と一致する"""
+        dates = [date(2024, 1, 1) + timedelta(days=i) for i in range(0, 730, 7)]
+        contributions = np.linspace(2_000_000, 2_500_000, len(dates)).astype(np.int64)
+        gains = np.linspace(100_000, 900_000, len(dates)).astype(np.int64)
+
+        result = calculate_indicator_series(dates, contributions + gains, contributions, gains)
+
+        assert len(result) == len(dates)
+        for i, today in enumerate(dates):
+            expected = calculate_indicators(
+                AssetEvaluation(
+                    cumulative_contributions=int(contributions[i]),
+                    gains_or_losses=int(gains[i]),
+                    asset_valuation=int(contributions[i] + gains[i]),
+                ),
+                today=today,
+            )
+            assert result.at(i) == expected
+
+    def test_calculate_indicator_series__zero_yield_uses_limit(self):
+        """利回りが 0 の日は年間積立額 × 60歳までの年数 + 資産評価額になる"""
+        result = calculate_indicator_series([date(2026, 10, 1)], [1_000_000], [1_000_000], [0])
+
+        assert result.actual_yield_rate[0] == 0
+        assert result.total_amount_at_60age[0] == int(ANNUAL_CONTRIBUTION * 20.01) + 1_000_000
+
+    def test_calculate_indicator_series_from_history__sorted_by_date(self):
+        """日付 → 総資産情報のマッピングから日付昇順の時系列を計算できる"""
+        history = {
+            date(2026, 2, 6): AssetEvaluation(
+                cumulative_contributions=900_000, gains_or_losses=310_000, asset_valuation=1_210_000
+            ),
+            date(2026, 2, 5): AssetEvaluation(
+                cumulative_contributions=900_000, gains_or_losses=300_000, asset_valuation=1_200_000
+            ),
+        }
+
+        result = calculate_indicator_series_from_history(history)
+
+        assert result.dates.tolist() == [date(2026, 2, 5), date(2026, 2, 6)]
+        assert result.at(0) == calculate_indicators(history[date(2026, 2, 5)], today=date(2026, 2, 5))
@@ -0,0 +1,72 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from src.domain import ReturnParameters, estimate_return_parameters, simulate_total_amount_at_60age
+from src.domain.indicators_calculator import ANNUAL_CONTRIBUTION
+
+
+class TestEstimateReturnParameters:
+    def test_estimate_return_parameters__recovers_drift_and_volatility(self):
+        """一定の分布に従う日次の評価額からドリフトとボラティリティを推定できる"""
+        rng = np.random.default_rng(0)
+        days = 3_000
+        log_returns = rng.normal(0.05 / 365, 0.15 / np.sqrt(365), days - 1)
+        valuation = 1_000_000 * np.exp(np.concatenate([[0.0], np.cumsum(log_returns)]))
+        dates = [date(2016, 10, 1) + timedelta(days=i) for i in range(days)]
+
+        result = estimate_return_parameters(dates, valuation, np.full(days, 1_000_000))
+
+        assert result.volatility == pytest.approx(0.15, rel=0.05)
+        assert result.drift == pytest.approx(np.log(valuation[-1] / valuation[0]) / (days - 1) * 365)
+
+    def test_estimate_return_parameters__excludes_contributions(self):
+        """拠出による評価額の増加は収益率に含めない"""
+        dates = [date(2026, 1, 1), date(2026, 1, 2), date(2026, 1, 3)]
+        valuation = [1_000_000, 1_020_000, 1_040_000]
+        contributions = [1_000_000, 1_020_000, 1_040_000]
+
+        result = estimate_return_parameters(dates, valuation, contributions)
+
+        assert result.drift == pytest.approx(0.0)
+        assert result.volatility == pytest.approx(0.0)
+
+    def test_estimate_return_parameters__too_few_records_raises(self):
+        """記録が 3 件未満の場合は ValueError"""
+        with pytest.raises(ValueError):
+            estimate_return_parameters([date(2026, 1, 1), date(2026, 1, 2)], [1, 1], [1, 1])
+
+
+class TestSimulateTotalAmountAt60age:
+    def test_simulate__zero_volatility_matches_closed_form(self):
+        """ボラティリティ 0 の場合、全経路が月次複利の確定値と一致する"""
+        parameters = ReturnParameters(drift=0.03, volatility=0.0)
+        today = date(2026, 10, 1)
+
+        result = simulate_total_amount_at_60age(1_000_000, parameters, today, paths=100, chunk_size=30)
+
+        steps = round(20.01 * 12)
+        dt = 20.01 / steps
+        growth = np.exp(0.03 * dt * np.arange(steps + 1))
+        expected = 1_000_000 * growth[-1] + ANNUAL_CONTRIBUTION * dt * growth[:-1].sum()
+        assert all(v == pytest.approx(expected, abs=1) for v in result.percentiles.values())
+
+    def test_simulate__percentiles_are_ordered(self):
+        """パーセンタイルは昇順に並ぶ"""
+        parameters = ReturnParameters(drift=0.03, volatility=0.15)
+
+        result = simulate_total_amount_at_60age(1_000_000, parameters, date(2026, 10, 1), paths=5_000, seed=1)
+
+        values = [result.percentiles[p] for p in sorted(result.percentiles)]
+        assert values == sorted(values)
+        assert result.paths == 5_000
+
+    def test_simulate__chunk_size_does_not_change_distribution(self):
+        """経路の分割数によらず同じ乱数列から同じ分布が得られる"""
+        parameters = ReturnParameters(drift=0.03, volatility=0.15)
+
+        whole = simulate_total_amount_at_60age(1_000_000, parameters, date(2026, 10, 1), 2_000, 2_000, seed=1)
+        chunked = simulate_total_amount_at_60age(1_000_000, parameters, date(2026, 10, 1), 2_000, 300, seed=1)
+
+        assert whole == chunked
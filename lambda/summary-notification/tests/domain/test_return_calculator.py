@@ -0,0 +1,74 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from src.domain import calculate_xirr, calculate_xirr_series
+
+
+def _make_history(rate: float, years: int, monthly: int = 20_000) -> tuple[list[date], np.ndarray, np.ndarray]:
+    """毎月1日に拠出し、一定の年率で成長する日次の資産履歴を生成"""
+    start = date(2016, 10, 1)
+    dates = [start + timedelta(days=i) for i in range(years * 365)]
+    contributions = np.zeros(len(dates))
+    valuation = np.zeros(len(dates))
+    total = 0.0
+    for i, d in enumerate(dates):
+        if i > 0:
+            valuation[i] = valuation[i - 1] * (1 + rate) ** (1 / 365)
+        if d.day == 1:
+            total += monthly
+            valuation[i] += monthly
+        contributions[i] = total
+    return dates, contributions, valuation
+
+
+class TestCalculateXirr:
+    def test_calculate_xirr__single_contribution(self):
+        """一括拠出が1年で10%増えた場合の収益率は10%"""
+        result = calculate_xirr([date(2025, 1, 1), date(2026, 1, 1)], [1_000_000, 1_000_000], 1_100_000)
+
+        assert result.rate == pytest.approx(0.1)
+
+    def test_calculate_xirr__monthly_contributions(self):
+        """毎月拠出した場合も一定の成長率を復元できる"""
+        dates, contributions, valuation = _make_history(rate=0.05, years=10)
+
+        result = calculate_xirr(dates, contributions, valuation[-1])
+
+        assert result.rate == pytest.approx(0.05, abs=1e-9)
+
+    def test_calculate_xirr__negative_return(self):
+        """マイナスの収益率も計算できる"""
+        dates, contributions, valuation = _make_history(rate=-0.1, years=3)
+
+        result = calculate_xirr(dates, contributions, valuation[-1], guess=5.0)
+
+        assert result.rate == pytest.approx(-0.1, abs=1e-9)
+
+    def test_calculate_xirr__warm_start_converges_quickly(self):
+        """前日の結果を初期値にすると数回の反復で収束する"""
+        dates, contributions, valuation = _make_history(rate=0.05, years=10)
+        previous = calculate_xirr(dates[:-1], contributions[:-1], valuation[-2])
+
+        result = calculate_xirr(dates, contributions, valuation[-1], guess=previous.rate)
+
+        assert result.iterations <= 3
+
+    def test_calculate_xirr__no_prior_contribution_raises(self):
+        """最終日より前の拠出がない場合は ValueError"""
+        with pytest.raises(ValueError):
+            calculate_xirr([date(2026, 1, 1)], [1_000_000], 1_000_000)
+
+
+class TestCalculateXirrSeries:
+    def test_calculate_xirr_series__matches_each_day(self):
+        """各日付の値が、その日までの履歴で計算した収益率と一致する"""
+        dates, contributions, valuation = _make_history(rate=0.03, years=2)
+
+        result = calculate_xirr_series(dates, contributions, valuation)
+
+        assert np.isnan(result[0])
+        for i in (40, 365, len(dates) - 1):
+            expected = calculate_xirr(dates[: i + 1], contributions[: i + 1], valuation[i]).rate
+            assert result[i] == pytest.approx(expected, abs=1e-9)
@@ -1,4 +1,7 @@
 from .mock_asset_repository import MockAssetRepository
 from .mock_notifier import MockNotifier
+from .mock_s3_client import MockS3Client
+from .mock_spreadsheet import MockSpreadsheet
+from .mock_worksheet import MockWorksheet
 
-__all__ = ["MockAssetRepository", "MockNotifier"]
+__all__ = ["MockAssetRepository", "MockNotifier", "MockS3Client", "MockSpreadsheet", "MockWorksheet"]
@@ -8,17 +8,19 @@ from src.domain import AssetEvaluation, AssetRetrievalFailed, IAssetRepository
 class MockAssetRepository(IAssetRepository):
     """テスト用 Mock 資産リポジトリ
 
-    get_latest_assets() / get_weekly_assets() の呼び出しを記録し、テストで検証可能にする
+    get_latest_assets() / get_weekly_assets() / get_asset_history() の呼び出しを記録し、テストで検証可能にする
     """
 
     def __init__(
         self,
         assets: dict[str, AssetEvaluation] | None = None,
         weekly_assets: dict[date, dict[str, AssetEvaluation]] | None = None,
+        history: dict[date, dict[str, AssetEvaluation]] | None = None,
         should_fail: bool = False,
     ) -> None:
         self.assets = assets
         self.weekly_assets = weekly_assets or {}
+        self.history = history or {}
         self.should_fail = should_fail
         self.get_called = False
 
@@ -33,3 +35,7 @@ class MockAssetRepository(IAssetRepository):
     def get_weekly_assets(self) -> dict[date, dict[str, AssetEvaluation]]:
         self.get_called = True
         return self.weekly_assets
+
+    def get_asset_history(self, days: int) -> dict[date, dict[str, AssetEvaluation]]:
+        self.get_called = True
+        return self.history
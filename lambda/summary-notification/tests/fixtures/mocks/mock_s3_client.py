@@ -0,0 +1,48 @@
+"""テスト用 Mock S3 クライアント"""
+
+import io
+
+
+class _NoSuchKey(Exception):
+    """S3 の NoSuchKey 例外の代替"""
+
+
+class _Exceptions:
+    NoSuchKey = _NoSuchKey
+
+
+class _Paginator:
+    def __init__(self, client: "MockS3Client") -> None:
+        self.client = client
+
+    def paginate(self, Bucket: str, Prefix: str) -> list[dict]:
+        keys = sorted(k for b, k in self.client.objects if b == Bucket and k.startswith(Prefix))
+        return [{"Contents": [{"Key": k} for k in keys]}]
+
+
+class MockS3Client:
+    """boto3 S3 クライアントのインメモリ Mock 実装
+
+    オブジェクトを (バケット, キー) → バイト列で保持し、API 呼び出しを記録してテストで検証可能にする
+    """
+
+    exceptions = _Exceptions
+
+    def __init__(self) -> None:
+        self.objects: dict[tuple[str, str], bytes] = {}
+        self.api_calls: list[str] = []
+
+    def get_paginator(self, operation_name: str) -> _Paginator:
+        self.api_calls.append(operation_name)
+        return _Paginator(self)
+
+    def get_object(self, Bucket: str, Key: str) -> dict:
+        self.api_calls.append("get_object")
+        if (Bucket, Key) not in self.objects:
+            raise _NoSuchKey(Key)
+        return {"Body": io.BytesIO(self.objects[(Bucket, Key)])}
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes, **kwargs) -> dict:
+        self.api_calls.append("put_object")
+        self.objects[(Bucket, Key)] = Body
+        return {}
@@ -0,0 +1,47 @@
+"""テスト用 Mock Worksheet"""
+
+from gspread.utils import a1_range_to_grid_range
+
+
+class MockWorksheet:
+    """gspread.Worksheet のインメモリ Mock 実装
+
+    シートの値を 2 次元リストで保持し、API 呼び出し回数を記録してテストで検証可能にする
+    """
+
+    def __init__(self, values: list[list[str]], title: str = "assets", row_count: int = 1000) -> None:
+        """Mock Worksheet を初期化
+
+        Args:
+            values: ヘッダー行を含むシートの値
+            title: シート名
+            row_count: シートの行数
+        """
+        self.values = values
+        self.title = title
+        self.row_count = row_count
+        self.api_calls: list[str] = []
+
+    def row_values(self, row: int) -> list[str]:
+        self.api_calls.append("row_values")
+        return list(self.values[row - 1]) if row <= len(self.values) else []
+
+    def col_values(self, col: int) -> list[str]:
+        self.api_calls.append("col_values")
+        return [row[col - 1] for row in self.values if len(row) >= col]
+
+    def get(self, range_name: str) -> list[list[str]]:
+        self.api_calls.append("get")
+        return self._read_range(range_name)
+
+    def batch_get(self, ranges: list[str]) -> list[list[list[str]]]:
+        self.api_calls.append("batch_get")
+        return [self._read_range(range_name) for range_name in ranges]
+
+    def _read_range(self, range_name: str) -> list[list[str]]:
+        grid = a1_range_to_grid_range(range_name)
+        start_row = grid.get("startRowIndex", 0)
+        end_row = grid.get("endRowIndex", len(self.values))
+        start_col = grid.get("startColumnIndex", 0)
+        end_col = grid.get("endColumnIndex")
+        return [list(row[start_col:end_col]) for row in self.values[start_row:end_row]]
@@ -0,0 +1,188 @@
+from datetime import date
+
+import pytest
+
+from src.domain import AssetEvaluation, AssetRetrievalFailed
+from src.infrastructure import GoogleSheetAssetRepository
+from tests.fixtures.mocks import MockSpreadsheet, MockWorksheet
+
+HEADERS = ["date", "product", "asset_valuation", "cumulative_contributions", "gains_or_losses"]
+
+
+def _make_rows(dates: list[str], products: list[str]) -> list[list[str]]:
+    """日付 × 商品のシート行を生成"""
+    return [[d, p, "110000", "100000", "10000"] for d in dates for p in products]
+
+
+def _make_index(values: list[list[str]]) -> list[list[str]]:
+    """シート行から日付インデックスシートの行を生成"""
+    index: dict[str, list[int]] = {}
+    for row_number, row in enumerate(values[1:], start=2):
+        index.setdefault(row[0], [row_number, row_number])[1] = row_number
+    return [["date", "first_row", "last_row"], *([d, str(f), str(last)] for d, (f, last) in sorted(index.items()))]
+
+
+@pytest.fixture
+def make_repository(mocker):
+    """MockSpreadsheet を使う GoogleSheetAssetRepository を生成するファクトリ"""
+
+    def _make(values: list[list[str]], index_values: list[list[str]] | None = None) -> GoogleSheetAssetRepository:
+        worksheets = {"assets": MockWorksheet(values)}
+        if index_values is not None:
+            worksheets["assets_index"] = MockWorksheet(index_values)
+        client = mocker.patch("src.infrastructure.google_sheet_asset_repository.get_spreadsheet_client")
+        client.return_value.open_by_key.return_value = MockSpreadsheet(worksheets)
+        return GoogleSheetAssetRepository(spreadsheet_id="dummy", sheet_name="assets", credentials={})
+
+    return _make
+
+
+class TestGetLatestAssets:
+    def test_get_latest_assets__returns_latest_date_products(self, make_repository):
+        """最新日付の商品別資産情報を取得できる"""
+        values = [HEADERS, *_make_rows(["2026-02-12", "2026-02-13"], ["商品A", "商品B"])]
+        values[-1] = ["2026-02-13", "商品B", "220000", "200000", "20000"]
+        repo = make_repository(values)
+
+        result = repo.get_latest_assets()
+
+        assert result == {
+            "商品A": AssetEvaluation(cumulative_contributions=100_000, gains_or_losses=10_000, asset_valuation=110_000),
+            "商品B": AssetEvaluation(cumulative_contributions=200_000, gains_or_losses=20_000, asset_valuation=220_000),
+        }
+
+    def test_get_latest_assets__no_rows_raises(self, make_repository):
+        """データ行がない場合 AssetRetrievalFailed が発生する"""
+        repo = make_repository([HEADERS])
+
+        with pytest.raises(AssetRetrievalFailed):
+            repo.get_latest_assets()
+
+
+class TestGetWeeklyAssets:
+    def test_get_weekly_assets__groups_trailing_seven_days(self, make_repository):
+        """直近カレンダー7日分が日付別にグルーピングされる"""
+        dates = [f"2026-02-{day:02d}" for day in range(1, 15)]
+        repo = make_repository([HEADERS, *_make_rows(dates, ["商品A", "商品B"])])
+
+        result = repo.get_weekly_assets()
+
+        assert sorted(result.keys()) == [date(2026, 2, day) for day in range(8, 15)]
+        assert all(set(products.keys()) == {"商品A", "商品B"} for products in result.values())
+
+    def test_get_weekly_assets__single_ranged_read(self, make_repository):
+        """対象行はヘッダー・date 列の取得に加えて 1 回の範囲読み取りで取得される"""
+        dates = [f"2026-01-{day:02d}" for day in range(1, 32)]
+        repo = make_repository([HEADERS, *_make_rows(dates, ["商品A", "商品B", "商品C"])])
+
+        repo.get_weekly_assets()
+
+        assert repo.worksheet.api_calls == ["row_values", "col_values", "get"]
+
+    def test_get_weekly_assets__excludes_out_of_window_rows_within_range(self, make_repository):
+        """範囲内に混在する対象期間外の行は除外される"""
+        values = [
+            HEADERS,
+            *_make_rows(["2026-02-13"], ["商品A"]),
+            *_make_rows(["2026-01-01"], ["商品A"]),
+            *_make_rows(["2026-02-14"], ["商品A"]),
+        ]
+        repo = make_repository(values)
+
+        result = repo.get_weekly_assets()
+
+        assert sorted(result.keys()) == [date(2026, 2, 13), date(2026, 2, 14)]
+
+
+class TestSnapshot:
+    def test_latest_and_weekly__share_single_read(self, make_repository):
+        """最新・週次の両クエリが 1 回のシート読み取りで処理される"""
+        dates = [f"2026-02-{day:02d}" for day in range(1, 15)]
+        repo = make_repository([HEADERS, *_make_rows(dates, ["商品A"])])
+
+        latest = repo.get_latest_assets()
+        weekly = repo.get_weekly_assets()
+
+        assert repo.worksheet.api_calls == ["row_values", "col_values", "get"]
+        assert weekly[date(2026, 2, 14)] == latest
+
+    def test_weekly__not_affected_by_caller_mutation(self, make_repository):
+        """返却値を変更してもスナップショットは変化しない"""
+        repo = make_repository([HEADERS, *_make_rows(["2026-02-14"], ["商品A"])])
+
+        repo.get_weekly_assets().clear()
+
+        assert list(repo.get_weekly_assets().keys()) == [date(2026, 2, 14)]
+
+
+class TestDateIndex:
+    def test_weekly__reads_via_index_with_constant_calls(self, make_repository):
+        """日付インデックスがある場合、履歴件数に関わらずインデックス読み取りと範囲読み取りのみで取得する"""
+        dates = [f"2025-{month:02d}-{day:02d}" for month in range(1, 13) for day in range(1, 29)]
+        values = [HEADERS, *_make_rows(dates, ["商品A", "商品B"])]
+        repo = make_repository(values, index_values=_make_index(values))
+
+        result = repo.get_weekly_assets()
+
+        assert sorted(result.keys()) == [date(2025, 12, day) for day in range(22, 29)]
+        assert repo.date_index.spreadsheet.api_calls == ["values_get"]
+        assert repo.worksheet.api_calls == ["batch_get"]
+
+    def test_weekly__falls_back_when_index_is_stale(self, make_repository):
+        """インデックスがシートの内容と一致しない場合は date 列から取得する"""
+        values = [HEADERS, *_make_rows(["2026-02-13", "2026-02-14"], ["商品A", "商品B"])]
+        index_values = _make_index(values)
+        values.pop(1)
+        repo = make_repository(values, index_values=index_values)
+
+        result = repo.get_weekly_assets()
+
+        assert set(result[date(2026, 2, 13)].keys()) == {"商品B"}
+        assert set(result[date(2026, 2, 14)].keys()) == {"商品A", "商品B"}
+        assert "col_values" in repo.worksheet.api_calls
+
+    def test_latest__falls_back_when_rows_exist_after_index_tail(self, make_repository):
+        """インデックスの保存に失敗して最新日付の行がインデックスにない場合は date 列から取得する"""
+        values = [HEADERS, *_make_rows(["2026-02-13"], ["商品A", "商品B"])]
+        index_values = _make_index(values)
+        values.extend(_make_rows(["2026-02-16"], ["商品A", "商品B"]))
+        repo = make_repository(values, index_values=index_values)
+
+        repo.get_latest_assets()
+
+        assert max(repo.get_weekly_assets()) == date(2026, 2, 16)
+        assert "col_values" in repo.worksheet.api_calls
+
+
+class TestGetAssetHistory:
+    def test_get_asset_history__reads_requested_days(self, make_repository):
+        """指定日数分の資産情報を日付インデックス経由で取得できる"""
+        dates = [f"2026-01-{day:02d}" for day in range(1, 32)]
+        values = [HEADERS, *_make_rows(dates, ["商品A"])]
+        repo = make_repository(values, index_values=_make_index(values))
+
+        result = repo.get_asset_history(days=20)
+
+        assert sorted(result.keys()) == [date(2026, 1, day) for day in range(12, 32)]
+
+
+class TestRowParsing:
+    def test_latest__resolves_columns_by_header(self, make_repository):
+        """列の並びがヘッダーと異なる順序でもヘッダー名で値を取得できる"""
+        headers = ["product", "gains_or_losses", "date", "cumulative_contributions", "asset_valuation"]
+        values = [headers, ["商品A", "10000", "2026-02-13", "100000", "110000", "メモ"]]
+        repo = make_repository(values)
+
+        result = repo.get_latest_assets()
+
+        assert result == {
+            "商品A": AssetEvaluation(cumulative_contributions=100_000, gains_or_losses=10_000, asset_valuation=110_000)
+        }
+
+    def test_latest__non_numeric_value_raises(self, make_repository):
+        """数値列に数値以外の値がある場合 AssetRetrievalFailed が発生する"""
+        values = [HEADERS, ["2026-02-13", "商品A", "110,000", "100000", "10000"]]
+        repo = make_repository(values)
+
+        with pytest.raises(AssetRetrievalFailed):
+            repo.get_latest_assets()
@@ -0,0 +1,80 @@
+from datetime import date, timedelta
+
+import pytest
+from shared.domain.asset_record_object import AssetRecord
+from shared.infrastructure.s3_asset_record_store import AssetRecordColumns, S3AssetRecordStore
+
+from src.domain import AssetEvaluation, AssetRetrievalFailed
+from src.infrastructure import S3AssetRepository
+from tests.fixtures.mocks import MockS3Client
+
+BUCKET = "test-bucket"
+
+
+def _make_records(start: date, days: int, products: list[str]) -> list[AssetRecord]:
+    """連続した日付 × 商品の資産レコードを生成"""
+    return [
+        AssetRecord(
+            date=start + timedelta(days=i),
+            product=p,
+            asset_valuation=110_000 + i,
+            cumulative_contributions=100_000,
+            gains_or_losses=10_000 + i,
+        )
+        for i in range(days)
+        for p in products
+    ]
+
+
+@pytest.fixture
+def store() -> S3AssetRecordStore:
+    """Mock S3 クライアントを使う列指向ストア"""
+    return S3AssetRecordStore(BUCKET, client=MockS3Client())
+
+
+def _save(store: S3AssetRecordStore, records: list[AssetRecord]) -> None:
+    """レコードを年単位のパーティションに保存する"""
+    for year in sorted({r.date.year for r in records}):
+        store.write_year(year, AssetRecordColumns.from_records([r for r in records if r.date.year == year]))
+
+
+class TestS3AssetRepository:
+    def test_get_latest_assets__returns_latest_date_products(self, store):
+        """最新日付の商品別資産情報を取得できる"""
+        _save(store, _make_records(date(2026, 2, 1), 14, ["商品A", "商品B"]))
+        repo = S3AssetRepository(BUCKET, store=store)
+
+        result = repo.get_latest_assets()
+
+        assert result == {
+            p: AssetEvaluation(cumulative_contributions=100_000, gains_or_losses=10_013, asset_valuation=110_013)
+            for p in ["商品A", "商品B"]
+        }
+
+    def test_get_weekly_assets__single_partition_read(self, store):
+        """直近カレンダー7日分を最新年のパーティション 1 回の読み取りで取得する"""
+        _save(store, _make_records(date(2025, 6, 1), 300, ["商品A"]))
+        store.client.api_calls.clear()
+        repo = S3AssetRepository(BUCKET, store=store)
+
+        result = repo.get_weekly_assets()
+        repo.get_latest_assets()
+
+        assert sorted(result.keys()) == [date(2026, 3, 21) + timedelta(days=i) for i in range(7)]
+        assert store.client.api_calls == ["list_objects_v2", "get_object"]
+
+    def test_get_weekly_assets__spans_year_boundary(self, store):
+        """対象期間が年をまたぐ場合は前年のパーティションも読み取る"""
+        _save(store, _make_records(date(2025, 12, 28), 7, ["商品A"]))
+        repo = S3AssetRepository(BUCKET, store=store)
+
+        result = repo.get_weekly_assets()
+
+        assert sorted(result.keys()) == [date(2025, 12, 28) + timedelta(days=i) for i in range(7)]
+
+    def test_get_latest_assets__empty_store_raises(self, store):
+        """レコードが存在しない場合 AssetRetrievalFailed が発生する"""
+        repo = S3AssetRepository(BUCKET, store=store)
+
+        with pytest.raises(AssetRetrievalFailed):
+            repo.get_latest_assets()
@@ -0,0 +1,198 @@
+from datetime import date
+
+import pytest
+from shared.infrastructure.asset_record_fingerprint import RecordFingerprint
+
+from src.domain import AssetEvaluation
+from src.infrastructure import GoogleSheetAssetRepository, SqliteCachedAssetRepository
+from tests.fixtures.mocks import MockSpreadsheet, MockWorksheet
+
+HEADERS = ["date", "product", "asset_valuation", "cumulative_contributions", "gains_or_losses"]
+
+
+def _make_rows(dates: list[str], products: list[str], valuation: str = "110000") -> list[list[str]]:
+    """日付 × 商品のシート行を生成"""
+    return [[d, p, valuation, "100000", "10000"] for d in dates for p in products]
+
+
+def _make_index(values: list[list[str]]) -> list[list[str]]:
+    """シート行から日付インデックスシートの行を生成"""
+    index: dict[str, list[int]] = {}
+    for row_number, row in enumerate(values[1:], start=2):
+        index.setdefault(row[0], [row_number, row_number])[1] = row_number
+    return [["date", "first_row", "last_row"], *([d, str(f), str(last)] for d, (f, last) in sorted(index.items()))]
+
+
+@pytest.fixture
+def spreadsheet() -> MockSpreadsheet:
+    """2 週間分の資産レコードと日付インデックスを持つ MockSpreadsheet"""
+    dates = [f"2026-02-{day:02d}" for day in range(1, 15)]
+    values = [HEADERS, *_make_rows(dates, ["商品A", "商品B"])]
+    return MockSpreadsheet(
+        {
+            "assets": MockWorksheet(values, title="assets"),
+            "assets_index": MockWorksheet(_make_index(values), title="assets_index"),
+        }
+    )
+
+
+@pytest.fixture
+def make_repository(mocker, tmp_path):
+    """同一のキャッシュファイルを使う SqliteCachedAssetRepository を生成するファクトリ"""
+    cache_path = str(tmp_path / "asset_records.sqlite3")
+
+    def _make(spreadsheet: MockSpreadsheet, fingerprint_store=None) -> SqliteCachedAssetRepository:
+        client = mocker.patch("src.infrastructure.google_sheet_asset_repository.get_spreadsheet_client")
+        client.return_value.open_by_key.return_value = spreadsheet
+        source = GoogleSheetAssetRepository(spreadsheet_id="dummy", sheet_name="assets", credentials={})
+        return SqliteCachedAssetRepository(source=source, cache_path=cache_path, fingerprint_store=fingerprint_store)
+
+    return _make
+
+
+class FakeFingerprintStore:
+    """AssetRecordFingerprintStore の代替（読み込み結果を差し替える）"""
+
+    def __init__(self, fingerprint: RecordFingerprint | None) -> None:
+        self.fingerprint = fingerprint
+
+    def load(self) -> RecordFingerprint | None:
+        return self.fingerprint
+
+
+def _reset_api_calls(spreadsheet: MockSpreadsheet) -> None:
+    spreadsheet.api_calls.clear()
+    for worksheet in spreadsheet.worksheets.values():
+        worksheet.api_calls.clear()
+
+
+def _append(spreadsheet: MockSpreadsheet, rows: list[list[str]]) -> None:
+    """シートに行を追記し、日付インデックスを更新する"""
+    values = spreadsheet.worksheets["assets"].values
+    values.extend(rows)
+    spreadsheet.worksheets["assets_index"].values = _make_index(values)
+
+
+class TestColdStart:
+    def test_cold__populates_cache_with_single_call(self, make_repository, spreadsheet):
+        """キャッシュが空の場合、1 回の API 呼び出しで全件を取得してキャッシュする"""
+        repo = make_repository(spreadsheet)
+
+        weekly = repo.get_weekly_assets()
+        latest = repo.get_latest_assets()
+
+        assert sorted(weekly.keys()) == [date(2026, 2, day) for day in range(8, 15)]
+        assert latest == weekly[date(2026, 2, 14)]
+        assert spreadsheet.api_calls == ["values_batch_get"]
+        assert spreadsheet.worksheets["assets"].api_calls == []
+
+    def test_cold__falls_back_to_sheet_without_index(self, make_repository, spreadsheet):
+        """日付インデックスがない場合はキャッシュを使用せずシートから取得する"""
+        del spreadsheet.worksheets["assets_index"]
+        repo = make_repository(spreadsheet)
+
+        result = repo.get_weekly_assets()
+
+        assert sorted(result.keys()) == [date(2026, 2, day) for day in range(8, 15)]
+        assert "col_values" in spreadsheet.worksheets["assets"].api_calls
+
+
+class TestWarmStart:
+    def test_warm__fetches_only_rows_from_last_cached_date(self, make_repository, spreadsheet):
+        """ウォームスタートではキャッシュ済みの最新日付以降の行のみを 1 回の API 呼び出しで取得する"""
+        make_repository(spreadsheet).get_weekly_assets()
+        _append(spreadsheet, _make_rows(["2026-02-15"], ["商品A", "商品B"], valuation="120000"))
+        _reset_api_calls(spreadsheet)
+
+        repo = make_repository(spreadsheet)
+        latest = repo.get_latest_assets()
+        weekly = repo.get_weekly_assets()
+
+        assert spreadsheet.api_calls == ["values_batch_get"]
+        assert latest["商品A"] == AssetEvaluation(
+            asset_valuation=120_000, cumulative_contributions=100_000, gains_or_losses=10_000
+        )
+        assert sorted(weekly.keys()) == [date(2026, 2, day) for day in range(9, 16)]
+
+    def test_warm__reflects_rewritten_latest_date(self, make_repository, spreadsheet):
+        """キャッシュ済みの最新日付が再書き込みされた場合も反映される"""
+        make_repository(spreadsheet).get_latest_assets()
+        values = spreadsheet.worksheets["assets"].values
+        del values[-2:]
+        _append(spreadsheet, _make_rows(["2026-02-14"], ["商品A", "商品B", "商品C"]))
+
+        latest = make_repository(spreadsheet).get_latest_assets()
+
+        assert set(latest.keys()) == {"商品A", "商品B", "商品C"}
+
+    def test_warm__reads_rows_appended_without_index_update(self, make_repository, spreadsheet):
+        """インデックスの保存に失敗して追記した行がインデックスにない場合も、追記した行を取得する"""
+        make_repository(spreadsheet).get_weekly_assets()
+        spreadsheet.worksheets["assets"].values.extend(_make_rows(["2026-02-15"], ["商品A", "商品B"]))
+
+        latest = make_repository(spreadsheet).get_weekly_assets()
+
+        assert max(latest) == date(2026, 2, 15)
+
+    def test_warm__rebuilds_when_rows_shift(self, make_repository, spreadsheet):
+        """キャッシュ済みの日付の行位置が変わった場合はキャッシュを再構築する"""
+        make_repository(spreadsheet).get_weekly_assets()
+        values = spreadsheet.worksheets["assets"].values
+        del values[1:3]
+        _append(spreadsheet, [])
+
+        weekly = make_repository(spreadsheet).get_weekly_assets()
+
+        assert sorted(weekly.keys()) == [date(2026, 2, day) for day in range(8, 15)]
+        assert all(set(products.keys()) == {"商品A", "商品B"} for products in weekly.values())
+
+
+class TestFingerprint:
+    def test_fingerprint__skips_sheet_read_when_unchanged(self, make_repository, spreadsheet):
+        """フィンガープリントが前回の同期時から変わっていない場合はシートを読み取らない"""
+        store = FakeFingerprintStore(RecordFingerprint(date="2026-02-14", fingerprint="abc"))
+        make_repository(spreadsheet, store).get_weekly_assets()
+        _reset_api_calls(spreadsheet)
+
+        weekly = make_repository(spreadsheet, store).get_weekly_assets()
+
+        assert spreadsheet.api_calls == []
+        assert sorted(weekly.keys()) == [date(2026, 2, day) for day in range(8, 15)]
+
+    def test_fingerprint__reads_sheet_when_changed(self, make_repository, spreadsheet):
+        """フィンガープリントが変わった場合はシートを読み取る"""
+        store = FakeFingerprintStore(RecordFingerprint(date="2026-02-14", fingerprint="abc"))
+        make_repository(spreadsheet, store).get_weekly_assets()
+        _append(spreadsheet, _make_rows(["2026-02-15"], ["商品A", "商品B"]))
+        store.fingerprint = RecordFingerprint(date="2026-02-15", fingerprint="abc")
+        _reset_api_calls(spreadsheet)
+
+        latest = make_repository(spreadsheet, store).get_latest_assets()
+
+        assert spreadsheet.api_calls == ["values_batch_get"]
+        assert set(latest.keys()) == {"商品A", "商品B"}
+
+    def test_fingerprint__reads_sheet_when_missing(self, make_repository, spreadsheet):
+        """フィンガープリントが存在しない場合（書き込み中など）はシートを読み取る"""
+        store = FakeFingerprintStore(RecordFingerprint(date="2026-02-14", fingerprint="abc"))
+        make_repository(spreadsheet, store).get_weekly_assets()
+        store.fingerprint = None
+        _reset_api_calls(spreadsheet)
+
+        make_repository(spreadsheet, store).get_weekly_assets()
+
+        assert spreadsheet.api_calls == ["values_batch_get"]
+
+    def test_fingerprint__rereads_from_overwritten_past_date(self, make_repository, spreadsheet):
+        """過去日付が同じ件数で上書きされた場合は、最後に保存された日付以降を読み直す"""
+        store = FakeFingerprintStore(RecordFingerprint(date="2026-02-14", fingerprint="abc"))
+        make_repository(spreadsheet, store).get_weekly_assets()
+        for row in spreadsheet.worksheets["assets"].values:
+            if row[0] == "2026-02-10":
+                row[2] = "130000"
+        store.fingerprint = RecordFingerprint(date="2026-02-10", fingerprint="def")
+
+        weekly = make_repository(spreadsheet, store).get_weekly_assets()
+
+        assert weekly[date(2026, 2, 10)]["商品A"].asset_valuation == 130_000
+        assert weekly[date(2026, 2, 14)]["商品A"].asset_valuation == 110_000
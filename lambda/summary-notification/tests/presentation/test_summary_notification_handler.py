@@ -1,3 +1,7 @@
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 
 from src.domain import AssetEvaluation, AssetRetrievalFailed
@@ -58,3 +62,28 @@ def test_main__asset_not_found_raises():
     # when, then
     with pytest.raises(AssetRetrievalFailed):
         main(asset_repository=repo, notifier=notifier)
+
+
+def test_handler_import__defers_heavy_dependencies():
+    """ハンドラーの import 時に外部ライブラリ（boto3, gspread, NumPy）を読み込まない
+
+    コールドスタート時間を抑えるため、これらは実装の参照時に読み込む
+    """
+    # given
+    code = (
+        "import sys\n"
+        "import src.handler\n"
+        "print(','.join(m for m in ('boto3', 'gspread', 'numpy', 'requests') if m in sys.modules))\n"
+    )
+
+    # when
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[2],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # then
+    assert result.stdout.strip() == ""
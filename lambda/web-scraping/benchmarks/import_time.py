@@ -0,0 +1,74 @@
+"""web-scraping Lambda ハンドラーの import 時間のベンチマーク
+
+`python -X importtime -c "import src.handler"` を別プロセスとして実行し、
+ハンドラーモジュールの読み込みにかかる時間（コールドスタートの INIT フェーズに相当）と、
+累積時間の大きいモジュールを表示する。
+
+Usage:
+    cd lambda/web-scraping
+    uv run python -m benchmarks.import_time [--top N] [--repeat N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+FUNCTION_ROOT = Path(__file__).resolve().parent.parent
+FUNCTION_ENV = {
+    "SCRAPING_PARAMETER_NAME": "dummy",
+    "SPREADSHEET_PARAMETER_NAME": "dummy",
+    "DATA_BUCKET_NAME": "dummy",
+}
+TARGET_MODULE = "src.handler"
+
+
+def measure() -> list[tuple[str, int, int]]:
+    """ハンドラーを import し、-X importtime の出力を解析する
+
+    Returns:
+        list[tuple[str, int, int]]: (モジュール名, 自身の時間[us], 累積時間[us]) のリスト
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {TARGET_MODULE}"],
+        cwd=FUNCTION_ROOT,
+        env={**os.environ, "POWERTOOLS_SERVICE_NAME": FUNCTION_ROOT.name, **FUNCTION_ENV},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|", 2)
+        entries.append((name.strip(), int(self_us), int(cumulative_us)))
+    return entries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=10, help="表示する上位モジュール数")
+    parser.add_argument("--repeat", type=int, default=3, help="計測回数（中央値を表示）")
+    args = parser.parse_args()
+
+    runs = [measure() for _ in range(args.repeat)]
+    totals = [next(c for name, _, c in entries if name == TARGET_MODULE) for entries in runs]
+    median_ms = statistics.median(totals) / 1000
+    print(f"== {FUNCTION_ROOT.name}: import {TARGET_MODULE} {median_ms:.1f} ms (median of {args.repeat})")
+
+    # ライブラリ単位（トップレベルパッケージ）の累積時間で集計する
+    by_package: dict[str, int] = {}
+    for name, _, cumulative in runs[totals.index(statistics.median_low(totals))]:
+        if "." not in name:
+            by_package[name] = max(by_package.get(name, 0), cumulative)
+    print(f"{'cumulative[ms]':>15}  package")
+    for name, cumulative in sorted(by_package.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"{cumulative / 1000:>15.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
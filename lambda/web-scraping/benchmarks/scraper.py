@@ -0,0 +1,162 @@
+"""資産評価額照会ページのスクレイピングのベンチマーク
+
+記録済みの資産評価額照会ページ（tests/fixtures/pages/assets.html）の商品ブロックを複製して
+商品数 1 / 10 / 100 のページを生成し、IScraper 実装ごとに工程別の実行時間とピークメモリを計測する。
+実サイトにはアクセスせず、ページはローカルの代替 HTTP サーバーから返す。
+
+- HttpScraper: ログイン / 遷移 / 抽出 / ログアウトの各工程
+- SeleniumScraper: Chrome なしで計測できる page_source 取得後の解析・抽出工程（Selenium/offline）。
+  --chrome-binary 指定時は Chrome を起動し、代替サーバーに対する全工程も計測する（SeleniumScraper*）
+
+Usage:
+    cd lambda/web-scraping
+    uv run python -m benchmarks.scraper [--repeat N] [--chrome-binary PATH --chromedriver PATH]
+"""
+
+import argparse
+import copy
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+os.environ.setdefault("POWERTOOLS_LOG_LEVEL", "WARNING")
+
+from lxml import html as lxml_html  # noqa: E402
+
+from src.domain import ScrapingParams  # noqa: E402
+from src.infrastructure.asset_page_parser import extract_product_assets, parse_html  # noqa: E402
+from src.infrastructure.http_scraper import HttpScraper  # noqa: E402
+from tests.fixtures.stand_in_site import PAGES_DIR, StandInSite  # noqa: E402
+
+PRODUCT_COUNTS = [1, 10, 100]
+CREDENTIALS = {"userId": "user", "password": "secret", "birthDate": "19800101"}
+
+
+def build_asset_page(product_count: int) -> str:
+    """記録済みページの商品ブロックを複製し、指定した商品数の資産評価額照会ページを生成する"""
+    document = lxml_html.fromstring((PAGES_DIR / "assets.html").read_text(encoding="utf-8"))
+    product_info = document.get_element_by_id("prodInfo")
+    template = product_info[0]
+    for product in list(product_info):
+        product_info.remove(product)
+    for i in range(product_count):
+        product = copy.deepcopy(template)
+        product.find_class("infoHdWrap00")[0].text = f"プロダクト_{i + 1}"
+        product_info.append(product)
+    return lxml_html.tostring(document, encoding="unicode", doctype="<!DOCTYPE html>")
+
+
+def measure(func: Callable[[], object]) -> tuple[float, float]:
+    """関数の実行時間[ms]とピークメモリ[KB]を計測する"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed_ms, peak / 1024
+
+
+def scraping_params(site: StandInSite) -> ScrapingParams:
+    return ScrapingParams(
+        login_user_id=CREDENTIALS["userId"],
+        login_password=CREDENTIALS["password"],
+        login_birthdate=CREDENTIALS["birthDate"],
+        start_url=f"{site.url}/login",
+        user_agent="benchmark",
+    )
+
+
+def bench_http_scraper(site: StandInSite) -> dict[str, tuple[float, float]]:
+    """HttpScraper の工程別の計測値"""
+    scraper = HttpScraper(scraping_params=scraping_params(site))
+    pages = {}
+    results = {
+        "login": measure(lambda: pages.setdefault("top", scraper._login())),
+        "navigate": measure(lambda: pages.setdefault("assets", scraper._navigate_to_asset_page(pages["top"]))),
+        "extract": measure(lambda: scraper._extract_asset_valuation(pages["assets"])),
+        "logout": measure(lambda: scraper._logout(pages["assets"])),
+    }
+    scraper.session.close()
+    return results
+
+
+def bench_page_source_extraction(page_source: str) -> dict[str, tuple[float, float]]:
+    """SeleniumScraper が page_source 取得後に行う解析・抽出の計測値"""
+    documents = []
+    return {
+        "parse": measure(lambda: documents.append(parse_html(page_source))),
+        "extract": measure(lambda: extract_product_assets(documents[0])),
+    }
+
+
+def bench_selenium_scraper(site: StandInSite, chrome_binary: str, chromedriver: str) -> dict[str, tuple[float, float]]:
+    """SeleniumScraper の工程別の計測値（Chrome を起動して代替サーバーにアクセスする）"""
+    from src.infrastructure.selenium_scraper import SeleniumScraper
+
+    scrapers = []
+    results = {
+        "launch": measure(
+            lambda: scrapers.append(
+                SeleniumScraper(
+                    scraping_params=scraping_params(site),
+                    chrome_binary_location=chrome_binary,
+                    chrome_driver_path=chromedriver,
+                )
+            )
+        )
+    }
+    scraper = scrapers[0]
+    scraper.driver.get(scraper.start_url)
+    results["login"] = measure(scraper._login)
+    results["navigate"] = measure(scraper._navigate_to_asset_page)
+    results["extract"] = measure(scraper._extract_asset_valuation)
+    results["logout"] = measure(scraper._logout)
+    scraper._close_driver()
+    return results
+
+
+def report(name: str, runs: list[dict[str, tuple[float, float]]]) -> None:
+    """工程別に実行時間の中央値とピークメモリの最大値を表示する"""
+    for stage in runs[0]:
+        times = [run[stage][0] for run in runs]
+        peaks = [run[stage][1] for run in runs]
+        print(f"  {name:<16} {stage:<9} {statistics.median(times):>9.2f} {max(peaks):>10.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="計測回数（実行時間は中央値を表示）")
+    parser.add_argument("--chrome-binary", help="Chrome バイナリのパス（指定時は SeleniumScraper の全工程を計測）")
+    parser.add_argument("--chromedriver", default="/opt/chromedriver", help="ChromeDriver のパス")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as corpus_dir:
+        for product_count in PRODUCT_COUNTS:
+            page_path = Path(corpus_dir) / f"assets_{product_count}.html"
+            page_source = build_asset_page(product_count)
+            page_path.write_text(page_source, encoding="utf-8")
+
+            print(f"== products={product_count} ({len(page_source.encode()) / 1024:.1f} KB)")
+            print(f"  {'scraper':<16} {'stage':<9} {'time[ms]':>9} {'peak[KB]':>10}")
+            with StandInSite(credentials=CREDENTIALS) as site:
+                site.pages["/assets"] = str(page_path)
+                report("HttpScraper", [bench_http_scraper(site) for _ in range(args.repeat)])
+                report("Selenium/offline", [bench_page_source_extraction(page_source) for _ in range(args.repeat)])
+                if args.chrome_binary:
+                    runs = [
+                        bench_selenium_scraper(site, args.chrome_binary, args.chromedriver) for _ in range(args.repeat)
+                    ]
+                    report("SeleniumScraper*", runs)
+            print()
+
+    if args.chrome_binary:
+        print("* Chrome を起動して代替サーバーに対して計測した全工程")
+
+
+if __name__ == "__main__":
+    main()
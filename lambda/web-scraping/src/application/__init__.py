@@ -1,5 +1,8 @@
+from .multi_account_scraping_service import AccountScrapingResult, MultiAccountScrapingService
 from .web_scraping_service import WebScrapingService
 
 __all__ = [
+    "AccountScrapingResult",
+    "MultiAccountScrapingService",
     "WebScrapingService",
 ]
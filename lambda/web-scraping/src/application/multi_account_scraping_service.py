@@ -0,0 +1,105 @@
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from typing import NamedTuple
+
+from src.config.settings import get_logger
+from src.domain import AssetEvaluation, FailureRecord, IArtifactRepository, IScraper, ScrapingFailed
+
+from .web_scraping_service import WebScrapingService
+
+logger = get_logger()
+
+
+class AccountScrapingResult(NamedTuple):
+    """アカウントごとのスクレイピング結果"""
+
+    # アカウント名 → 商品別の資産評価情報（取得に成功したアカウントのみ）
+    products: dict[str, dict[str, AssetEvaluation]]
+    # アカウント名 → 発生した例外（取得に失敗したアカウントのみ）
+    failures: dict[str, Exception]
+
+
+class MultiAccountScrapingService:
+    """複数アカウントの資産評価情報を並行して取得するサービス
+
+    アカウントごとにスクレイパー（ブラウザ・HTTP セッション）を生成し、
+    1 アカウントの失敗が他のアカウントの取得に影響しないよう、失敗はアカウント単位で記録する。
+    失敗の記録は全アカウントの取得後に 1 回の書き込みでエラーアーティファクトのインデックスに追加する。
+    """
+
+    def __init__(
+        self,
+        scraper_factories: dict[str, Callable[[], IScraper]],
+        artifact_repository: IArtifactRepository,
+        max_workers: int = 2,
+        deadline: float | None = None,
+    ) -> None:
+        """サービスを初期化
+
+        Args:
+            scraper_factories: アカウント名 → スクレイパーを生成する関数
+            artifact_repository: エラーアーティファクトの保存先
+            max_workers: 同時に取得するアカウント数の上限（同時に起動するブラウザ数の上限）
+            deadline: 実行の期限（time.monotonic() 基準、エラーアーティファクトのアップロードの打ち切りに使用）
+        """
+        self.scraper_factories = scraper_factories
+        self.artifact_repository = artifact_repository
+        self.max_workers = max_workers
+        self.deadline = deadline
+
+    def scrape(self) -> AccountScrapingResult:
+        """全アカウントの資産評価情報を取得する
+
+        Returns:
+            AccountScrapingResult: アカウントごとの取得結果と失敗
+        """
+        workers = max(min(self.max_workers, len(self.scraper_factories)), 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                account_name: executor.submit(self._scrape_account, account_name, factory)
+                for account_name, factory in self.scraper_factories.items()
+            }
+
+        products: dict[str, dict[str, AssetEvaluation]] = {}
+        failures: dict[str, Exception] = {}
+        for account_name, future in futures.items():
+            try:
+                products[account_name] = future.result()
+            except Exception as e:
+                failures[account_name] = e
+
+        if failures:
+            self._record_failures(failures)
+        return AccountScrapingResult(products=products, failures=failures)
+
+    def _record_failures(self, failures: dict[str, Exception]) -> None:
+        """失敗の記録をエラーアーティファクトのインデックスに追加する（失敗した場合はログのみ出力する）"""
+        occurred_at = datetime.now(UTC)
+        records = [
+            FailureRecord(
+                occurred_at=occurred_at,
+                account=account_name,
+                error=str(error),
+                error_screenshot_key=error.error_screenshot_key if isinstance(error, ScrapingFailed) else None,
+                error_html_key=error.error_html_key if isinstance(error, ScrapingFailed) else None,
+            )
+            for account_name, error in failures.items()
+        ]
+        try:
+            self.artifact_repository.record_failures(records)
+        except Exception:
+            logger.warning("スクレイピング失敗の記録の保存に失敗しました。", exc_info=True)
+
+    def _scrape_account(self, account_name: str, factory: Callable[[], IScraper]) -> dict[str, AssetEvaluation]:
+        """1 アカウントのスクレイパーを生成し、資産評価情報を取得する"""
+        try:
+            service = WebScrapingService(
+                scraper=factory(),
+                artifact_repository=self.artifact_repository,
+                deadline=self.deadline,
+            )
+            return service.scrape()
+        except Exception:
+            logger.exception("アカウントのスクレイピングに失敗しました", extra={"account": account_name})
+            raise
@@ -1,4 +1,5 @@
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 
 from src.config.settings import get_logger
 from src.domain import (
@@ -10,15 +11,21 @@ from src.domain import (
 
 logger = get_logger()
 
+# エラーアーティファクトのアップロードを打ち切った後、元の例外の送出と他の処理に残す時間（秒）
+DEADLINE_MARGIN_SECONDS = 3.0
+
 
 class WebScrapingService:
     def __init__(
         self,
         scraper: IScraper,
         artifact_repository: IArtifactRepository,
+        deadline: float | None = None,
     ) -> None:
         self.scraper: IScraper = scraper
         self.artifact_repository: IArtifactRepository = artifact_repository
+        # 実行の期限（time.monotonic() 基準）。エラーアーティファクトのアップロードはこの期限より前に打ち切る
+        self.deadline = deadline
 
     def scrape(self) -> dict[str, AssetEvaluation]:
         try:
@@ -28,19 +35,48 @@ class WebScrapingService:
             raise
 
     def _upload_error_artifacts(self, e: ScrapingFailed) -> None:
-        """エラーアーティファクトを S3 にアップロードする"""
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        """エラーアーティファクトを S3 に並行してアップロードする
 
+        アップロードは実行の期限より前に打ち切り、失敗した場合もログのみ出力する。
+        エラーアーティファクトの保存によって元のスクレイピングの例外が隠れないようにするため。
+        """
+        # 例外の属性名 → ローカルパス
+        uploads: dict[str, str] = {}
         if e.tmp_screenshot_path:
-            logger.info("エラー画像のアップロード開始")
-            key = f"errors/{timestamp}.png"
-            self.artifact_repository.save_error_artifact(key=key, file_path=e.tmp_screenshot_path)
-            logger.info("エラー画像をアップロードしました。", extra={"error_screenshot_key": key})
-            e.error_screenshot_key = key
-
+            uploads["error_screenshot_key"] = e.tmp_screenshot_path
         if e.tmp_html_path:
-            logger.info("エラーになった資産情報 HTML ファイルのアップロード開始")
-            key = f"errors/{timestamp}.html"
-            self.artifact_repository.save_error_artifact(key=key, file_path=e.tmp_html_path)
-            logger.info("資産情報 HTML ファイルをアップロードしました。", extra={"error_html_key": key})
-            e.error_html_key = key
+            uploads["error_html_key"] = e.tmp_html_path
+        if not uploads:
+            return
+
+        logger.info("エラーアーティファクトのアップロード開始", extra={"file_paths": list(uploads.values())})
+        executor = ThreadPoolExecutor(max_workers=len(uploads))
+        futures = {
+            executor.submit(self.artifact_repository.save_error_artifact, file_path=path): (attr, path)
+            for attr, path in uploads.items()
+        }
+        done, not_done = wait(futures, timeout=self._remaining_upload_time())
+        # 期限までに完了しなかったアップロードは待たずに元の例外の送出を優先する
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        for future in done:
+            attr, path = futures[future]
+            error = future.exception()
+            if error is None:
+                setattr(e, attr, future.result())
+                logger.info("エラーアーティファクトをアップロードしました。", extra={attr: future.result()})
+            else:
+                logger.warning(
+                    "エラーアーティファクトのアップロードに失敗しました。", extra={"file_path": path}, exc_info=error
+                )
+        if not_done:
+            logger.warning(
+                "期限までにエラーアーティファクトのアップロードが完了しませんでした。",
+                extra={"file_paths": [futures[future][1] for future in not_done]},
+            )
+
+    def _remaining_upload_time(self) -> float | None:
+        """エラーアーティファクトのアップロードに使える残り時間（秒、期限がない場合は None）"""
+        if self.deadline is None:
+            return None
+        return max(self.deadline - time.monotonic() - DEADLINE_MARGIN_SECONDS, 0.0)
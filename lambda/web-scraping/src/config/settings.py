@@ -1,4 +1,7 @@
+from typing import Literal
+
 from shared.config.base_settings import BaseEnvSettings, get_logger  # noqa: F401
+from shared.config.metrics import get_metrics, measure_stage, record_metric  # noqa: F401
 
 
 class EnvSettings(BaseEnvSettings):
@@ -16,6 +19,31 @@ class EnvSettings(BaseEnvSettings):
     # データ保存用 S3 バケット名
     data_bucket_name: str
 
+    # 資産レコードの保存先（s3 の場合は S3 を正とし、Google Spreadsheet にもミラーする）
+    asset_record_store: Literal["sheet", "s3"] = "sheet"
+
+    # 前回保存した資産レコードと内容が同じ場合に保存を省略するか（休日など評価額が更新されない日）
+    # 内容の比較に使用するフィンガープリントは設定に関わらず data_bucket_name に記録する
+    skip_unchanged_asset_records: bool = False
+
+    # スクレイパーの種類（http の場合はブラウザを使用せずに取得し、失敗した場合は Selenium で取得し直す）
+    scraper_type: Literal["selenium", "http"] = "selenium"
+
+    # ウォームスタート間で Chrome を再利用するか（アカウントが 1 件の場合のみ有効）
+    reuse_chrome_driver: bool = False
+
+    # 同時にスクレイピングするアカウント数の上限（同時に起動する Chrome の数の上限）
+    scraping_max_workers: int = 2
+
+    # 画面遷移ごとの待機のタイムアウト（秒）
+    scraping_wait_timeout: float = 10.0
+
+    # 抽出に不要なリソース（画像・フォント・計測タグ等）を読み込まないか
+    chrome_block_resources: bool = False
+
+    # ページ読み込みの完了を待つ基準（eager の場合は DOMContentLoaded の時点で完了とする）
+    chrome_page_load_strategy: Literal["normal", "eager"] = "normal"
+
 
 def get_settings(settings_instance: EnvSettings | None = None) -> EnvSettings:
     """設定インスタンスを取得する
@@ -6,8 +6,11 @@ from shared.domain.asset_record_object import AssetRecord
 from shared.domain.exceptions import AssetRecordError
 
 from .artifact_interface import IArtifactRepository
+from .artifact_object import FailureRecord
 from .exceptions import (
+    AccountScrapingFailed,
     ArtifactUploadError,
+    LoginRejected,
     ScrapingFailed,
     WebScrapingFailed,
 )
@@ -19,12 +22,15 @@ __all__ = [
     "AssetEvaluation",
     "ScrapingParams",
     "AssetRecord",
+    "FailureRecord",
     # Interfaces
     "IScraper",
     "IArtifactRepository",
     "IAssetRecordRepository",
     # Exceptions
+    "AccountScrapingFailed",
     "ArtifactUploadError",
+    "LoginRejected",
     "ScrapingFailed",
     "WebScrapingFailed",
     "AssetRecordError",
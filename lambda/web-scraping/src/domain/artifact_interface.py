@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from .artifact_object import FailureRecord
+
 
 class IArtifactRepository(ABC):
     """アーティファクトリポジトリ抽象クラス"""
@@ -9,11 +11,22 @@ class IArtifactRepository(ABC):
         pass
 
     @abstractmethod
-    def save_error_artifact(self, key: str, file_path: str) -> None:
+    def save_error_artifact(self, file_path: str) -> str:
         """エラーアーティファクトを保存する
         Args:
-            key (str): オブジェクトのキー
             file_path (str): 保存するファイルのパス
+        Returns:
+            str: 保存したオブジェクトのキー（同一内容のファイルは同じキーになる）
+        Raises:
+            ArtifactUploadError: 保存失敗時
+        """
+        pass
+
+    @abstractmethod
+    def record_failures(self, records: list[FailureRecord]) -> None:
+        """スクレイピング失敗の記録をインデックスに追加する
+        Args:
+            records (list[FailureRecord]): 追加する失敗の記録
         Raises:
             ArtifactUploadError: 保存失敗時
         """
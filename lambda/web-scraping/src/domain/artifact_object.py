@@ -0,0 +1,13 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class FailureRecord(BaseModel):
+    """スクレイピング失敗の記録（エラーアーティファクトのインデックスの 1 件）"""
+
+    occurred_at: datetime
+    account: str
+    error: str
+    error_screenshot_key: str | None = None
+    error_html_key: str | None = None
@@ -45,31 +45,43 @@ class ScrapingFailed(WebScrapingFailed):
     def during_login(
         cls,
         tmp_screenshot_path: str | None = None,
+        tmp_html_path: str | None = None,
     ) -> Self:
         """ログイン処理中にエラーが発生した場合の例外を生成
 
         Args:
             tmp_screenshot_path: エラー時のスクリーンショット画像のローカルパス
+            tmp_html_path: エラー時の HTML ファイルのローカルパス（ブラウザを使用しない場合）
 
         Returns:
             ScrapingFailed: 生成された例外インスタンス
         """
-        return cls("ログイン処理に失敗しました", tmp_screenshot_path=tmp_screenshot_path)
+        return cls(
+            "ログイン処理に失敗しました",
+            tmp_screenshot_path=tmp_screenshot_path,
+            tmp_html_path=tmp_html_path,
+        )
 
     @classmethod
     def during_page_fetch(
         cls,
         tmp_screenshot_path: str | None = None,
+        tmp_html_path: str | None = None,
     ) -> Self:
         """ページ取得処理中にエラーが発生した場合の例外を生成
 
         Args:
             tmp_screenshot_path: エラー時のスクリーンショット画像のローカルパス
+            tmp_html_path: エラー時の HTML ファイルのローカルパス（ブラウザを使用しない場合）
 
         Returns:
             ScrapingFailed: 生成された例外インスタンス
         """
-        return cls("資産評価額照会ページの取得に失敗しました", tmp_screenshot_path=tmp_screenshot_path)
+        return cls(
+            "資産評価額照会ページの取得に失敗しました",
+            tmp_screenshot_path=tmp_screenshot_path,
+            tmp_html_path=tmp_html_path,
+        )
 
     @classmethod
     def during_extraction(
@@ -85,3 +97,40 @@ class ScrapingFailed(WebScrapingFailed):
             ScrapingFailed: 生成された例外インスタンス
         """
         return cls("資産情報の抽出に失敗しました", tmp_html_path=tmp_html_path)
+
+
+class LoginRejected(ScrapingFailed):
+    """ログイン情報が受け付けられなかったことによるログイン失敗
+
+    ログイン情報の誤りは取得し直しても解消せず、ログインの試行を重ねるとアカウントがロックされうるため、
+    代替スクレイパーでの取得し直しを行わない。
+    """
+
+    pass
+
+
+class AccountScrapingFailed(WebScrapingFailed):
+    """複数アカウントのうち一部または全てのアカウントのスクレイピングエラー
+
+    取得に成功したアカウントの資産レコードは保存済みであることを表す。
+
+    Attributes:
+        message (str): エラーメッセージ
+        failures (dict[str, Exception]): アカウント名 → 発生した例外
+    """
+
+    def __init__(self, message: str, failures: dict[str, Exception]):
+        super().__init__(message)
+        self.failures = failures
+
+    @classmethod
+    def for_accounts(cls, failures: dict[str, Exception]) -> Self:
+        """失敗したアカウントの例外をまとめた例外を生成
+
+        Args:
+            failures: アカウント名 → 発生した例外
+
+        Returns:
+            AccountScrapingFailed: 生成された例外インスタンス
+        """
+        return cls(f"{len(failures)} 件のアカウントのスクレイピングに失敗しました: {list(failures)}", failures=failures)
@@ -1,17 +1,21 @@
+import time
+
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
-from src.config.settings import get_logger
-from src.domain import ArtifactUploadError, AssetRecordError, ScrapingFailed
+from src.config.settings import get_logger, get_metrics
+from src.domain import AccountScrapingFailed, ArtifactUploadError, AssetRecordError, ScrapingFailed
 from src.presentation.asset_collection_handler import main
 
 logger = get_logger()
+metrics = get_metrics()
 
 
 @logger.inject_lambda_context
+@metrics.log_metrics(capture_cold_start_metric=True)
 def handler(event: dict, context: LambdaContext) -> str | None:
     """Lambda handler エントリーポイント"""
     try:
-        main()
+        main(deadline=time.monotonic() + context.get_remaining_time_in_millis() / 1000)
         return "Success"
     except ScrapingFailed as e:
         logger.exception(
@@ -22,6 +26,21 @@ def handler(event: dict, context: LambdaContext) -> str | None:
             },
         )
         raise
+    except AccountScrapingFailed as e:
+        logger.exception(
+            "一部のアカウントのスクレイピングでエラーが発生しました。",
+            extra={
+                "failed_accounts": {
+                    name: {
+                        "error": str(error),
+                        "error_screenshot_key": getattr(error, "error_screenshot_key", None),
+                        "error_html_key": getattr(error, "error_html_key", None),
+                    }
+                    for name, error in e.failures.items()
+                },
+            },
+        )
+        raise
     except ArtifactUploadError:
         logger.exception("エラーアーティファクトの保存に失敗しました。")
         raise
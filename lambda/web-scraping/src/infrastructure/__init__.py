@@ -1,12 +1,45 @@
-from shared.infrastructure.ssm_parameter import get_ssm_json_parameter
+from typing import TYPE_CHECKING
 
-from .google_sheet_asset_record_repository import GoogleSheetAssetRecordRepository
-from .s3_artifact_repository import S3ArtifactRepository
-from .selenium_scraper import SeleniumScraper
+from shared.config.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from shared.infrastructure.asset_record_fingerprint import AssetRecordFingerprintStore
+    from shared.infrastructure.ssm_parameter import get_ssm_json_parameter, get_ssm_json_parameters
+
+    from .fallback_scraper import FallbackScraper
+    from .fingerprinted_asset_record_repository import FingerprintedAssetRecordRepository
+    from .google_sheet_asset_record_repository import GoogleSheetAssetRecordRepository
+    from .http_scraper import HttpScraper
+    from .s3_artifact_repository import S3ArtifactRepository
+    from .s3_asset_record_repository import S3AssetRecordRepository
+    from .selenium_scraper import SeleniumScraper
+
+# 外部ライブラリ（selenium, boto3, gspread, google-auth, lxml）に依存するため、参照時に読み込む
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "AssetRecordFingerprintStore": "shared.infrastructure.asset_record_fingerprint",
+        "FallbackScraper": ".fallback_scraper",
+        "FingerprintedAssetRecordRepository": ".fingerprinted_asset_record_repository",
+        "GoogleSheetAssetRecordRepository": ".google_sheet_asset_record_repository",
+        "HttpScraper": ".http_scraper",
+        "S3ArtifactRepository": ".s3_artifact_repository",
+        "S3AssetRecordRepository": ".s3_asset_record_repository",
+        "SeleniumScraper": ".selenium_scraper",
+        "get_ssm_json_parameter": "shared.infrastructure.ssm_parameter",
+        "get_ssm_json_parameters": "shared.infrastructure.ssm_parameter",
+    },
+)
 
 __all__ = [
+    "AssetRecordFingerprintStore",
+    "FallbackScraper",
+    "FingerprintedAssetRecordRepository",
     "GoogleSheetAssetRecordRepository",
+    "HttpScraper",
     "S3ArtifactRepository",
+    "S3AssetRecordRepository",
     "SeleniumScraper",
     "get_ssm_json_parameter",
+    "get_ssm_json_parameters",
 ]
@@ -0,0 +1,83 @@
+"""資産評価額照会ページの HTML 解析
+
+ブラウザを使用するスクレイパーと使用しないスクレイパーで同じ解析処理を共有する。
+"""
+
+from lxml import html as lxml_html
+
+from src.domain import AssetEvaluation
+
+# 資産評価額照会ページの要素
+PRODUCT_INFO_ID = "prodInfo"
+PRODUCT_CLASSES = ("infoDetailUnit_02", "pc_mb30")
+PRODUCT_NAME_CLASS = "infoHdWrap00"
+TOTAL_CLASS = "total"
+
+
+def _has_classes_xpath(*classes: str) -> str:
+    """指定したクラスを全て持つ要素の XPath 条件"""
+    return " and ".join(f"contains(concat(' ', normalize-space(@class), ' '), ' {c} ')" for c in classes)
+
+
+_PRODUCTS_XPATH = f".//*[{_has_classes_xpath(*PRODUCT_CLASSES)}]"
+_PRODUCT_NAME_XPATH = f".//*[{_has_classes_xpath(PRODUCT_NAME_CLASS)}]"
+_TOTAL_XPATH = f"//*[{_has_classes_xpath(TOTAL_CLASS)}]"
+
+
+def parse_html(page_source: str) -> lxml_html.HtmlElement:
+    """HTML 文字列を解析する"""
+    return lxml_html.fromstring(page_source)
+
+
+def is_asset_page(document: lxml_html.HtmlElement) -> bool:
+    """資産評価額照会ページか（合計欄の有無で判定する）"""
+    return bool(document.xpath(_TOTAL_XPATH))
+
+
+def extract_product_assets(document: lxml_html.HtmlElement) -> dict[str, AssetEvaluation]:
+    """資産評価額照会ページから商品別資産を抽出する
+
+    Args:
+        document: 解析済みの資産評価額照会ページ
+
+    Returns:
+        dict[str, AssetEvaluation]: 商品別資産情報
+
+    Raises:
+        ValueError: ページの構造が想定と異なる場合
+    """
+    product_info = document.get_element_by_id(PRODUCT_INFO_ID, None)
+    if product_info is None:
+        msg = f"商品情報の要素が見つかりません: id={PRODUCT_INFO_ID}"
+        raise ValueError(msg)
+
+    assets_each_product: dict[str, AssetEvaluation] = {}
+    for product in product_info.xpath(_PRODUCTS_XPATH):
+        # ブラウザは tbody を補った DOM を返すが、HTTP で取得した HTML には tbody がない場合がある
+        table_rows = _first(product, ".//table").xpath("./tr | ./tbody/tr")
+        contribution_cells = table_rows[2].xpath(".//td")
+        gains_cells = table_rows[5].xpath(".//td")
+
+        product_assets = AssetEvaluation.from_html_strings(
+            cumulative_contributions_str=_text(contribution_cells[-1]),
+            gains_or_losses_str=_text(gains_cells[-1]),
+            asset_valuation_str=_text(contribution_cells[2]),
+        )
+        product_name = _text(_first(product, _PRODUCT_NAME_XPATH))
+        assets_each_product[product_name] = product_assets
+
+    return assets_each_product
+
+
+def _first(element: lxml_html.HtmlElement, xpath: str) -> lxml_html.HtmlElement:
+    """XPath に一致する最初の要素（見つからない場合は ValueError）"""
+    found = element.xpath(xpath)
+    if not found:
+        msg = f"要素が見つかりません: xpath={xpath}"
+        raise ValueError(msg)
+    return found[0]
+
+
+def _text(element: lxml_html.HtmlElement) -> str:
+    """要素の表示テキスト（空白を正規化する）"""
+    return " ".join(element.text_content().split())
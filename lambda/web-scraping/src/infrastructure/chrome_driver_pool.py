@@ -0,0 +1,249 @@
+"""Headless Chrome の起動・終了とコンテナ内での再利用
+
+Chrome のプロファイル等の一時ディレクトリは 1 つの親ディレクトリにまとめ、終了時に削除する。
+タイムアウト等で終了処理が実行されなかった一時ディレクトリは、次回の起動時に削除する。
+複数アカウントを並行して取得する場合、一時ディレクトリは作成と同時に使用中として登録し、
+別スレッドで起動中の Chrome の一時ディレクトリを削除しないようにする。
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+from functools import cache
+from typing import NamedTuple
+
+from selenium import webdriver
+
+from src.config.settings import get_logger, measure_stage
+
+logger = get_logger()
+
+PROFILE_DIR_PREFIX = "chrome-profile-"
+
+# リソースを読み込まない場合に遮断する URL パターン（資産情報の抽出には HTML のみを使用する）
+BLOCKED_URL_PATTERNS = [
+    # 画像
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.svg",
+    "*.webp",
+    "*.ico",
+    # フォント
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.otf",
+    # アクセス解析・広告
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+]
+
+# 起動中・起動済みの Chrome が使用している一時ディレクトリ（古い一時ディレクトリの削除対象から除外する）
+_active_profile_dirs: set[str] = set()
+_active_profile_dirs_lock = threading.Lock()
+
+
+class ChromeSession(NamedTuple):
+    """起動した Chrome と一時ディレクトリ"""
+
+    driver: webdriver.Chrome
+    profile_dir: str
+
+
+@measure_stage("BrowserBoot")
+def launch_chrome(
+    binary_location: str,
+    driver_path: str,
+    user_agent: str,
+    block_resources: bool = False,  # noqa: FBT001, FBT002
+    page_load_strategy: str = "normal",
+) -> ChromeSession:
+    """Headless Chrome を起動する
+
+    Args:
+        binary_location: Chrome バイナリのパス
+        driver_path: ChromeDriver のパス
+        user_agent: User-Agent
+        block_resources: True の場合、抽出に不要なリソース（画像・フォント・計測タグ等）を読み込まない
+        page_load_strategy: ページ読み込みの完了を待つ基準（"normal" または "eager"）
+
+    Returns:
+        ChromeSession: 起動した Chrome と一時ディレクトリ（暗黙的な待機は設定しない。要素の待機は PageNavigator で行う）
+    """
+    remove_stale_profile_dirs()
+    with _active_profile_dirs_lock:
+        profile_dir = tempfile.mkdtemp(prefix=PROFILE_DIR_PREFIX)
+        _active_profile_dirs.add(profile_dir)
+
+    chrome_options = webdriver.ChromeOptions()
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-dev-tools")
+    chrome_options.add_argument("--no-zygote")
+    chrome_options.add_argument("--window-size=1280x1696")
+    chrome_options.add_argument(f"--user-data-dir={os.path.join(profile_dir, 'user-data')}")
+    chrome_options.add_argument(f"--data-path={os.path.join(profile_dir, 'data')}")
+    chrome_options.add_argument(f"--disk-cache-dir={os.path.join(profile_dir, 'cache')}")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--hide-scrollbars")
+    chrome_options.add_argument("--enable-logging")
+    chrome_options.add_argument("--log-level=0")
+    chrome_options.add_argument("--v=99")
+    chrome_options.add_argument("--single-process")
+    chrome_options.add_argument(f"--user-agent={user_agent}")
+    # eager の場合は DOMContentLoaded の時点で読み込み完了とする（要素の待機は PageNavigator で行う）
+    chrome_options.page_load_strategy = page_load_strategy
+    if block_resources:
+        chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
+    # ref: https://github.com/umihico/docker-selenium-lambda/blob/main/main.py
+    chrome_options.binary_location = binary_location
+    service = webdriver.ChromeService(driver_path)
+    try:
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+    except Exception:
+        _release_profile_dir(profile_dir)
+        raise
+
+    if block_resources:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+
+    return ChromeSession(driver=driver, profile_dir=profile_dir)
+
+
+def close_chrome(session: ChromeSession) -> None:
+    """Chrome を終了し、一時ディレクトリを削除する"""
+    try:
+        session.driver.quit()
+    except Exception:
+        logger.warning("Chrome の終了処理中に問題が発生しました。")
+    _release_profile_dir(session.profile_dir)
+
+
+def _release_profile_dir(profile_dir: str) -> None:
+    """一時ディレクトリの使用中の登録を解除して削除する"""
+    with _active_profile_dirs_lock:
+        _active_profile_dirs.discard(profile_dir)
+    shutil.rmtree(profile_dir, ignore_errors=True)
+
+
+def remove_stale_profile_dirs() -> None:
+    """終了処理が実行されなかった Chrome の一時ディレクトリを削除する
+
+    一時ディレクトリの作成・登録と同じロックの下で削除し、起動中の Chrome の一時ディレクトリは削除しない。
+    """
+    temp_dir = tempfile.gettempdir()
+    with _active_profile_dirs_lock:
+        for name in os.listdir(temp_dir):
+            path = os.path.join(temp_dir, name)
+            if name.startswith(PROFILE_DIR_PREFIX) and path not in _active_profile_dirs:
+                logger.info("古い Chrome の一時ディレクトリを削除します", extra={"path": path})
+                shutil.rmtree(path, ignore_errors=True)
+
+
+class ChromeDriverPool:
+    """ウォームスタート間で Chrome を再利用するプール（コンテナ内で 1 プロセスを保持）
+
+    取得時にヘルスチェックを行い、応答しない場合は起動し直す。
+    返却時は Cookie とキャッシュを削除して空白ページに戻し、前回のセッションを持ち越さない。
+    """
+
+    def __init__(
+        self,
+        binary_location: str,
+        driver_path: str,
+        user_agent: str,
+        block_resources: bool = False,  # noqa: FBT001, FBT002
+        page_load_strategy: str = "normal",
+    ) -> None:
+        """プールを初期化
+
+        Args:
+            binary_location: Chrome バイナリのパス
+            driver_path: ChromeDriver のパス
+            user_agent: User-Agent
+            block_resources: True の場合、抽出に不要なリソースを読み込まない
+            page_load_strategy: ページ読み込みの完了を待つ基準
+        """
+        self.binary_location = binary_location
+        self.driver_path = driver_path
+        self.user_agent = user_agent
+        self.block_resources = block_resources
+        self.page_load_strategy = page_load_strategy
+        self._session: ChromeSession | None = None
+
+    def acquire(self) -> webdriver.Chrome:
+        """利用可能な Chrome を取得する（起動済みで応答する場合は再利用する）"""
+        if self._session is not None:
+            if self._is_healthy(self._session.driver):
+                logger.info("起動済みの Chrome を再利用します")
+                return self._session.driver
+            logger.warning("起動済みの Chrome が応答しないため起動し直します")
+            self._discard()
+
+        self._session = launch_chrome(
+            self.binary_location,
+            self.driver_path,
+            self.user_agent,
+            block_resources=self.block_resources,
+            page_load_strategy=self.page_load_strategy,
+        )
+        return self._session.driver
+
+    def release(self, discard: bool = False) -> None:  # noqa: FBT001, FBT002
+        """Chrome を返却する
+
+        Args:
+            discard: True の場合は再利用せずに終了する（エラー発生時など状態が不明な場合）
+        """
+        if self._session is None:
+            return
+        if discard or not self._reset(self._session.driver):
+            self._discard()
+
+    def _discard(self) -> None:
+        if self._session is not None:
+            close_chrome(self._session)
+            self._session = None
+
+    @staticmethod
+    def _is_healthy(driver: webdriver.Chrome) -> bool:
+        try:
+            return driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    @staticmethod
+    def _reset(driver: webdriver.Chrome) -> bool:
+        """セッションを初期状態に戻す（失敗した場合は False）"""
+        try:
+            for handle in driver.window_handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(driver.window_handles[0])
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            driver.get("about:blank")
+            return True
+        except Exception:
+            logger.warning("Chrome のセッションの初期化に失敗したため終了します。")
+            return False
+
+
+@cache
+def get_chrome_driver_pool(
+    binary_location: str,
+    driver_path: str,
+    user_agent: str,
+    block_resources: bool = False,  # noqa: FBT001, FBT002
+    page_load_strategy: str = "normal",
+) -> ChromeDriverPool:
+    """コンテナ内で共有する ChromeDriverPool を取得する（起動オプションごとに 1 つ）"""
+    return ChromeDriverPool(binary_location, driver_path, user_agent, block_resources, page_load_strategy)
@@ -0,0 +1,44 @@
+"""代替スクレイパー付きスクレイパー実装"""
+
+from collections.abc import Callable
+
+from src.config.settings import get_logger
+from src.domain import AssetEvaluation, IScraper, LoginRejected, ScrapingFailed
+
+logger = get_logger()
+
+
+class FallbackScraper(IScraper):
+    """主スクレイパーが失敗した場合に代替スクレイパーで取得し直す IScraper 実装
+
+    代替スクレイパー（ブラウザ起動など生成コストが高いもの）は、主スクレイパーが失敗した場合のみ生成する。
+    ログイン情報が受け付けられなかった場合は、ログインの試行を重ねないよう取得し直さない。
+    """
+
+    def __init__(self, primary: IScraper, fallback: Callable[[], IScraper]) -> None:
+        """スクレイパーを初期化
+
+        Args:
+            primary: 主スクレイパー
+            fallback: 代替スクレイパーを生成する関数
+        """
+        self.primary = primary
+        self.fallback = fallback
+
+    def fetch_asset_valuation(self) -> dict[str, AssetEvaluation]:
+        """資産評価情報を取得する
+
+        Returns:
+            dict[str, AssetEvaluation]: 商品別の資産評価情報
+
+        Raises:
+            LoginRejected: 主スクレイパーでログイン情報が受け付けられなかった場合
+            ScrapingFailed: 代替スクレイパーでも取得に失敗した場合
+        """
+        try:
+            return self.primary.fetch_asset_valuation()
+        except LoginRejected:
+            raise
+        except ScrapingFailed:
+            logger.warning("スクレイピングに失敗したため代替スクレイパーで取得し直します", exc_info=True)
+        return self.fallback().fetch_asset_valuation()
@@ -0,0 +1,91 @@
+"""保存した資産レコードのフィンガープリントを記録するリポジトリ実装"""
+
+from aws_lambda_powertools.metrics import MetricUnit
+from shared.infrastructure.asset_record_fingerprint import (
+    AssetRecordFingerprintStore,
+    RecordFingerprint,
+    compute_fingerprint,
+)
+
+from src.config.settings import get_logger, record_metric
+from src.domain import AssetRecord, AssetRecordError, IAssetRecordRepository
+
+logger = get_logger()
+
+
+class FingerprintedAssetRecordRepository(IAssetRecordRepository):
+    """保存した資産レコードのフィンガープリントを記録する IAssetRecordRepository 実装
+
+    読み取り側はフィンガープリントが変わっていなければシートの読み取りを省略できる。
+    skip_unchanged が有効な場合、前回保存したレコードと内容が同じ日（休日など評価額が更新されない日）は
+    保存先（Google Spreadsheet 等）への API 呼び出しを行わない。
+    この場合、対象日付のレコードは保存されない（読み取り側は最新日付として前回保存した日付を参照する）。
+    """
+
+    def __init__(
+        self,
+        inner: IAssetRecordRepository,
+        fingerprint_store: AssetRecordFingerprintStore,
+        skip_unchanged: bool = False,  # noqa: FBT001, FBT002
+    ) -> None:
+        """リポジトリを初期化
+
+        Args:
+            inner: 保存先のリポジトリ
+            fingerprint_store: 前回保存したレコードのフィンガープリントのストア
+            skip_unchanged: 前回保存したレコードと内容が同じ場合に保存を省略するか
+        """
+        self.inner = inner
+        self.fingerprint_store = fingerprint_store
+        self.skip_unchanged = skip_unchanged
+
+    def save_daily_records(self, records: list[AssetRecord], product_prefixes: list[str] | None = None) -> None:
+        """資産レコードを保存し、フィンガープリントを記録する
+
+        保存する場合は、保存中の失敗で古いフィンガープリントが残らないよう、
+        フィンガープリントを削除してから保存し、保存後に新しいフィンガープリントを書き込む。
+
+        Args:
+            records: 保存する資産レコードのリスト
+            product_prefixes: 置き換える既存レコードの商品名の接頭辞（None の場合は対象日付の全レコードを置き換える）
+
+        Raises:
+            AssetRecordError: レコード保存失敗時
+        """
+        if not records:
+            return
+
+        target_date = str(records[0].date)
+        fingerprint = compute_fingerprint(records)
+        if self.skip_unchanged and self._is_unchanged(fingerprint, target_date):
+            record_metric("AssetRecordWriteSkipped", MetricUnit.Count, 1)
+            return
+
+        try:
+            self.fingerprint_store.invalidate()
+        except Exception as e:
+            raise AssetRecordError(f"資産レコードのフィンガープリントの削除に失敗しました: {e}") from e
+
+        self.inner.save_daily_records(records, product_prefixes)
+
+        try:
+            self.fingerprint_store.save(RecordFingerprint(date=target_date, fingerprint=fingerprint))
+        except Exception:
+            # 次回は内容を比較できずに保存し直すだけのため、ログのみ出力する
+            logger.warning("資産レコードのフィンガープリントの保存に失敗しました", exc_info=True)
+
+    def _is_unchanged(self, fingerprint: str, target_date: str) -> bool:
+        """前回保存したレコードと内容が同じか（フィンガープリントを読み込めない場合は False）"""
+        try:
+            previous = self.fingerprint_store.load()
+        except Exception:
+            logger.warning("資産レコードのフィンガープリントを読み込めないため保存します", exc_info=True)
+            return False
+
+        if previous is not None and previous.fingerprint == fingerprint:
+            logger.info(
+                "前回保存した資産レコードから変化がないため保存を省略します",
+                extra={"date": target_date, "previous_date": previous.date},
+            )
+            return True
+        return False
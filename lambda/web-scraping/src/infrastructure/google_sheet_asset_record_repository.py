@@ -1,9 +1,10 @@
 """Google Spreadsheet を使った資産レコードリポジトリ実装"""
 
-import gspread
-from google.oauth2.service_account import Credentials
+from gspread.utils import ValueRenderOption
+from shared.infrastructure.google_sheet_client import get_spreadsheet_client
+from shared.infrastructure.sheet_date_index import DateRowRange, SheetDateIndex
 
-from src.config.settings import get_logger
+from src.config.settings import get_logger, measure_stage
 from src.domain import AssetRecord, AssetRecordError, IAssetRecordRepository
 
 logger = get_logger()
@@ -14,29 +15,44 @@ SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 class GoogleSheetAssetRecordRepository(IAssetRecordRepository):
     """Google Spreadsheet を使った IAssetRecordRepository 実装"""
 
-    def __init__(self, spreadsheet_id: str, sheet_name: str, credentials: dict) -> None:
+    HEADER_ROW = 1
+
+    def __init__(
+        self,
+        spreadsheet_id: str,
+        sheet_name: str,
+        credentials: dict,
+        overwrite_in_place: bool = True,
+    ) -> None:
         """Google Spreadsheet クライアントを初期化
 
         Args:
             spreadsheet_id: スプレッドシートID
             sheet_name: シート名
             credentials: サービスアカウント認証情報
+            overwrite_in_place: 同一日付の既存行と件数が一致する場合に行を上書きするか
+                (False の場合は常に削除して末尾に追記する)
         """
-        creds = Credentials.from_service_account_info(credentials, scopes=SCOPES)
-        client = gspread.authorize(creds)
-        spreadsheet = client.open_by_key(spreadsheet_id)
-        self.worksheet = spreadsheet.worksheet(sheet_name)
+        client = get_spreadsheet_client(credentials, SCOPES)
+        self.spreadsheet = client.open_by_key(spreadsheet_id)
+        self.worksheet = self.spreadsheet.worksheet(sheet_name)
+        self.date_index = SheetDateIndex(self.spreadsheet, sheet_name)
+        self.overwrite_in_place = overwrite_in_place
 
-    def save_daily_records(self, records: list[AssetRecord]) -> None:
+    def save_daily_records(self, records: list[AssetRecord], product_prefixes: list[str] | None = None) -> None:
         """日次の資産レコードをスプレッドシートに保存する
 
         冪等性の実現方法:
-        1. シート内から対象日付の既存行を検索（date カラム一致）
-        2. 既存行があれば削除
-        3. 新しいレコードを末尾に追記
+        1. 日付インデックスから対象日付の既存行範囲を特定
+           (product_prefixes 指定時は、既存行のうち接頭辞に一致しない商品の行を読み取り、保存するレコードに加える)
+        2. 既存行と件数が一致する場合は、既存行を 1 回の範囲更新で上書き
+           (行の並びが変わらないため、日付インデックスは date 列から再構築した場合のみ保存)
+        3. 件数が異なる場合は、既存行の削除と末尾への追記を 1 回の batch_update で実行し、
+           日付インデックスを更新
 
         Args:
             records: 保存する資産レコードのリスト
+            product_prefixes: 置き換える既存レコードの商品名の接頭辞（None の場合は対象日付の全レコードを置き換える）
 
         Raises:
             AssetRecordError: レコード保存失敗時
@@ -46,36 +62,174 @@ class GoogleSheetAssetRecordRepository(IAssetRecordRepository):
 
         try:
             target_date = str(records[0].date)
-            self._delete_existing_rows(target_date)
-            self._append_records(records)
+            index, rebuilt = self._load_index(target_date)
+            existing = index.get(target_date)
+            if product_prefixes is not None and existing is not None:
+                records = self._read_kept_records(existing, product_prefixes) + records
+            if self.overwrite_in_place and existing is not None and existing.count == len(records):
+                self._overwrite_rows(existing, records)
+                save_index = rebuilt
+            else:
+                index = self._upsert_rows(target_date, records, index)
+                save_index = True
+            if save_index:
+                with measure_stage("SheetIndexSave"):
+                    self.date_index.save(index)
             logger.info("資産レコードを保存しました", extra={"date": target_date, "count": len(records)})
         except AssetRecordError:
             raise
         except Exception as e:
             raise AssetRecordError(f"資産レコードの保存に失敗しました: {e}") from e
 
-    def _delete_existing_rows(self, target_date: str) -> None:
-        """対象日付の既存行を削除する"""
+    @measure_stage("SheetLookup")
+    def _load_index(self, target_date: str) -> tuple[dict[str, DateRowRange], bool]:
+        """日付インデックスを読み込む
+
+        インデックスが未作成、またはシートの内容と一致しない場合は date 列から再構築する。
+
+        Returns:
+            tuple[dict[str, DateRowRange], bool]: 日付インデックスと、date 列から再構築したか
+        """
+        index = self.date_index.load()
+        if index is not None and self._is_consistent(target_date, index):
+            return index, False
+
         date_column = self.worksheet.col_values(1)
-        rows_to_delete = [i + 1 for i, val in enumerate(date_column) if val == target_date]
-
-        # 下の行から削除（インデックスがずれないように）
-        for row_index in reversed(rows_to_delete):
-            self.worksheet.delete_rows(row_index)
-
-        if rows_to_delete:
-            logger.info("既存行を削除しました", extra={"date": target_date, "count": len(rows_to_delete)})
-
-    def _append_records(self, records: list[AssetRecord]) -> None:
-        """レコードを末尾に追記する"""
-        rows = [
-            [
-                str(record.date),
-                record.product,
-                record.asset_valuation,
-                record.cumulative_contributions,
-                record.gains_or_losses,
-            ]
-            for record in records
+        logger.info("日付インデックスを date 列から構築します", extra={"rows": len(date_column)})
+        return SheetDateIndex.build(date_column[self.HEADER_ROW :], header_row=self.HEADER_ROW), True
+
+    def _is_consistent(self, target_date: str, index: dict[str, DateRowRange]) -> bool:
+        """インデックスがシートの内容と一致するか 1 回の読み取りで検証する
+
+        削除対象の範囲と追記位置を誤らないよう、以下を確認する。
+        - 対象日付の範囲内がすべて対象日付であり、直後の行が対象日付でない
+        - インデックス上の最終行がその行範囲の日付であり、その直後の行が空である
+          （削除と追記により、最終行の日付は最新日付とは限らない）
+        """
+        if not index:
+            return False
+
+        target_range = index.get(target_date)
+        last_date, last_range = max(index.items(), key=lambda item: item[1].last_row)
+
+        ranges = [f"A{last_range.last_row}:A{last_range.last_row + 1}"]
+        if target_range is not None:
+            ranges.append(f"A{target_range.first_row}:A{target_range.last_row + 1}")
+        results = self.worksheet.batch_get(ranges)
+
+        tail = [row[0] if row else "" for row in results[0]]
+        if tail[:1] != [last_date] or (len(tail) > 1 and tail[1]):
+            return False
+
+        if target_range is None:
+            return True
+
+        dates = [row[0] if row else "" for row in results[1]]
+        in_range, after = dates[: target_range.count], dates[target_range.count :]
+        return (
+            len(in_range) == target_range.count and all(d == target_date for d in in_range) and target_date not in after
+        )
+
+    def _read_kept_records(self, row_range: DateRowRange, product_prefixes: list[str]) -> list[AssetRecord]:
+        """既存行のうち、商品名がいずれの接頭辞にも一致しない行（置き換えずに残す行）を読み取る"""
+        rows = self.worksheet.get(
+            f"A{row_range.first_row}:E{row_range.last_row}",
+            value_render_option=ValueRenderOption.unformatted,
+        )
+        prefixes = tuple(product_prefixes)
+        return [self._to_record(row) for row in rows if not str(row[1]).startswith(prefixes)]
+
+    def read_all_records(self) -> list[AssetRecord]:
+        """シート上の全ての資産レコードを 1 回の読み取りで取得する（S3 ストアへの既存履歴の移行に使用）
+
+        Raises:
+            AssetRecordError: レコード取得失敗時
+        """
+        try:
+            rows = self.worksheet.get(f"A{self.HEADER_ROW + 1}:E", value_render_option=ValueRenderOption.unformatted)
+        except Exception as e:
+            raise AssetRecordError(f"資産レコードの取得に失敗しました: {e}") from e
+        return [self._to_record(row) for row in rows if row and row[0]]
+
+    @measure_stage("SheetOverwrite")
+    def _overwrite_rows(self, row_range: DateRowRange, records: list[AssetRecord]) -> None:
+        """既存行を 1 回の範囲更新で上書きする"""
+        self.worksheet.update(
+            values=[self._to_row(r) for r in records],
+            range_name=f"A{row_range.first_row}:E{row_range.last_row}",
+            value_input_option="RAW",
+        )
+        logger.info("既存行を上書きしました", extra={"date": str(records[0].date), "count": row_range.count})
+
+    def _upsert_rows(
+        self,
+        target_date: str,
+        records: list[AssetRecord],
+        index: dict[str, DateRowRange],
+    ) -> dict[str, DateRowRange]:
+        """対象日付の既存行削除とレコード追記を 1 回の batch_update で実行し、更新後のインデックスを返す"""
+        requests: list[dict] = []
+
+        existing = index.get(target_date)
+        if existing is not None:
+            requests.append(
+                {
+                    "deleteDimension": {
+                        "range": {
+                            "sheetId": self.worksheet.id,
+                            "dimension": "ROWS",
+                            "startIndex": existing.first_row - 1,
+                            "endIndex": existing.last_row,
+                        }
+                    }
+                }
+            )
+            index = SheetDateIndex.remove(index, target_date)
+
+        requests.append(
+            {
+                "appendCells": {
+                    "sheetId": self.worksheet.id,
+                    "rows": [{"values": [self._to_cell(v) for v in self._to_row(r)]} for r in records],
+                    "fields": "userEnteredValue",
+                }
+            }
+        )
+
+        with measure_stage("SheetDeleteAndAppend"):
+            self.spreadsheet.batch_update({"requests": requests})
+        if existing is not None:
+            logger.info("既存行を削除しました", extra={"date": target_date, "count": existing.count})
+
+        last_row = max((r.last_row for r in index.values()), default=self.HEADER_ROW)
+        index[target_date] = DateRowRange(last_row + 1, last_row + len(records))
+        return index
+
+    @staticmethod
+    def _to_record(row: list) -> AssetRecord:
+        """シートの行（UNFORMATTED_VALUE で読み取った値）をレコードに変換する"""
+        return AssetRecord(
+            date=row[0],
+            product=row[1],
+            asset_valuation=int(row[2]),
+            cumulative_contributions=int(row[3]),
+            gains_or_losses=int(row[4]),
+        )
+
+    @staticmethod
+    def _to_row(record: AssetRecord) -> list[str | int]:
+        """レコードをシートの行に変換する"""
+        return [
+            str(record.date),
+            record.product,
+            record.asset_valuation,
+            record.cumulative_contributions,
+            record.gains_or_losses,
         ]
-        self.worksheet.append_rows(rows, value_input_option="RAW")
+
+    @staticmethod
+    def _to_cell(value: str | int) -> dict:
+        """値を入力値のまま（RAW）書き込む CellData に変換する"""
+        if isinstance(value, int):
+            return {"userEnteredValue": {"numberValue": value}}
+        return {"userEnteredValue": {"stringValue": value}}
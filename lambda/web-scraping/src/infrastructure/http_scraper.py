@@ -0,0 +1,175 @@
+"""ブラウザを使用しないスクレイパー実装
+
+ログインフォームの送信と資産評価額照会ページの取得を HTTP リクエストで直接行い、
+lxml で HTML を解析する。Chrome を起動しないため、実行時間とメモリ使用量を大きく削減できる。
+"""
+
+import os
+from typing import NamedTuple
+from urllib.parse import urljoin
+
+import requests
+from lxml import html as lxml_html
+
+from src.config.settings import get_logger, measure_stage
+from src.domain import AssetEvaluation, IScraper, LoginRejected, ScrapingFailed, ScrapingParams
+
+from .asset_page_parser import extract_product_assets, is_asset_page, parse_html
+
+logger = get_logger()
+
+ASSET_PAGE_LINK_ID = "mainMenu01"
+LOGOUT_LINK_XPATH = "//a[normalize-space()='ログアウト']"
+LOGIN_FORM_XPATH = "//form[.//input[@name='userId']]"
+
+
+class _Page(NamedTuple):
+    """取得したページ"""
+
+    url: str
+    source: str
+    document: lxml_html.HtmlElement
+
+
+class HttpScraper(IScraper):
+    """requests と lxml を使った IScraper 実装"""
+
+    def __init__(self, scraping_params: ScrapingParams, timeout: float = 10, error_artifact_dir: str = "/tmp") -> None:
+        """スクレイパーを初期化
+
+        Args:
+            scraping_params: スクレイピングパラメータ
+            timeout: リクエストごとのタイムアウト（秒）
+            error_artifact_dir: エラー時の HTML の保存先ディレクトリ
+        """
+        self.user_id = scraping_params.login_user_id
+        self.password = scraping_params.login_password
+        self.birthdate = scraping_params.login_birthdate
+        self.start_url = scraping_params.start_url
+        self.timeout = timeout
+        self.error_artifact_dir = error_artifact_dir
+        # 同一ホストへの接続を使い回す（Keep-Alive）
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = scraping_params.user_agent
+
+    def fetch_asset_valuation(self) -> dict[str, AssetEvaluation]:
+        """資産評価情報を取得する
+
+        Returns:
+            dict[str, AssetEvaluation]: 商品別の資産評価情報
+        """
+        logger.info("資産評価情報の取得開始")
+        try:
+            top_page = self._login()
+            asset_page = self._navigate_to_asset_page(top_page)
+            products = self._extract_asset_valuation(asset_page)
+            self._logout(asset_page)
+        finally:
+            self.session.close()
+        logger.info("資産評価情報の取得完了")
+        return products
+
+    def _request(self, method: str, url: str, **kwargs) -> _Page:
+        response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+        response.raise_for_status()
+        return _Page(url=response.url, source=response.text, document=parse_html(response.text))
+
+    @measure_stage("Login")
+    def _login(self) -> _Page:
+        page = None
+        try:
+            logger.info("ログイン処理開始")
+            page = self._request("GET", self.start_url)
+            forms = page.document.xpath(LOGIN_FORM_XPATH)
+            if not forms:
+                msg = "ログインフォームが見つかりません"
+                raise ValueError(msg)
+            form = forms[0]
+
+            fields = {name: value for name, value in form.form_values()}
+            fields.update({"userId": self.user_id, "password": self.password, "birthDate": self.birthdate})
+            # 送信ボタンに name がある場合はブラウザと同様に送信値に含める
+            for button in form.xpath(".//*[@id='btnLogin'][@name]"):
+                fields[button.get("name")] = button.get("value", "")
+
+            action = urljoin(page.url, form.get("action") or "")
+            method = (form.get("method") or "GET").upper()
+            if method == "POST":
+                page = self._request("POST", action, data=fields)
+            else:
+                page = self._request("GET", action, params=fields)
+
+            # ログアウトリンクがなければログイン失敗とし、ログインフォームが再表示された場合はログイン情報の誤りとする
+            if not page.document.xpath(LOGOUT_LINK_XPATH):
+                if page.document.xpath(LOGIN_FORM_XPATH):
+                    raise LoginRejected.during_login(tmp_html_path=self._save_html(page, "error_login.html"))
+                msg = "ログアウトリンクが見つかりません"
+                raise ValueError(msg)
+            logger.info("ログイン処理完了")
+            return page
+        except LoginRejected:
+            raise
+        except Exception as e:
+            raise ScrapingFailed.during_login(tmp_html_path=self._save_html(page, "error_login.html")) from e
+
+    @measure_stage("Navigation")
+    def _navigate_to_asset_page(self, top_page: _Page) -> _Page:
+        """資産評価額照会ページへ遷移する"""
+        page = top_page
+        try:
+            logger.info("資産評価額照会ページへの遷移開始")
+            links = top_page.document.xpath(f"//*[@id='{ASSET_PAGE_LINK_ID}']/ancestor-or-self::a[@href][1]")
+            href = links[0].get("href") if links else None
+            if not href or href.startswith("javascript:"):
+                msg = f"資産評価額照会ページへのリンクが見つかりません: id={ASSET_PAGE_LINK_ID}"
+                raise ValueError(msg)
+
+            page = self._request("GET", urljoin(top_page.url, href))
+            if not is_asset_page(page.document):
+                msg = "資産評価額照会ページの合計欄が見つかりません"
+                raise ValueError(msg)
+            logger.info("資産評価額照会ページへの遷移完了")
+            return page
+        except Exception as e:
+            html_path = self._save_html(page, "error_asset_valuation.html")
+            self._logout(top_page)
+            raise ScrapingFailed.during_page_fetch(tmp_html_path=html_path) from e
+
+    @measure_stage("Extraction")
+    def _extract_asset_valuation(self, asset_page: _Page) -> dict[str, AssetEvaluation]:
+        """資産評価額照会ページから商品別の資産情報を抽出する"""
+        try:
+            logger.info("資産情報の抽出開始")
+            products = extract_product_assets(asset_page.document)
+            logger.info(
+                "商品別の資産評価額の抽出完了",
+                extra={"product_count": len(products), "product_names": list(products.keys())},
+            )
+            return products
+        except Exception as e:
+            html_path = self._save_html(asset_page, "error_extraction.html")
+            self._logout(asset_page)
+            raise ScrapingFailed.during_extraction(tmp_html_path=html_path) from e
+
+    def _logout(self, page: _Page) -> None:
+        try:
+            logger.info("ログアウト処理開始")
+            link = page.document.xpath(LOGOUT_LINK_XPATH)[0]
+            self._request("GET", urljoin(page.url, link.get("href")))
+            logger.info("ログアウト処理完了")
+        except Exception:
+            # ログアウト失敗はログのみ出力して無視
+            logger.warning("ログアウト処理中に問題が発生しました。")
+
+    def _save_html(self, page: _Page | None, file_name: str) -> str | None:
+        """エラー時のページを HTML ファイルとして保存する（保存できない場合は None）"""
+        if page is None:
+            return None
+        html_path = os.path.join(self.error_artifact_dir, file_name)
+        try:
+            with open(html_path, "w", encoding="utf-8") as f:
+                f.write(page.source)
+            return html_path
+        except Exception as write_error:
+            logger.warning("HTML ファイルの保存に失敗しました。", error=str(write_error))
+            return None
@@ -0,0 +1,95 @@
+"""明示的な待機による画面遷移
+
+WebDriver 全体に暗黙的な待機を設定すると、要素が存在しないことの確認（ログイン失敗の判定や
+エラー時のログアウト）のたびにタイムアウトまで待たされる。
+ここでは遷移ごとに待機する条件を指定し、既知のエラー画面を検出した時点で待機を打ち切る。
+"""
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as ec
+from selenium.webdriver.support.wait import WebDriverWait
+
+Locator = tuple[str, str]
+
+DEFAULT_TIMEOUT_SECONDS = 10.0
+DEFAULT_POLL_FREQUENCY_SECONDS = 0.1
+
+
+class ErrorPageDetected(Exception):
+    """待機中に既知のエラー画面を検出した"""
+
+    def __init__(self, locator: Locator) -> None:
+        super().__init__(f"エラー画面を検出しました: {locator}")
+        self.locator = locator
+
+
+class PageNavigator:
+    """遷移ごとの明示的な待機を提供する"""
+
+    def __init__(
+        self,
+        driver: WebDriver,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        poll_frequency: float = DEFAULT_POLL_FREQUENCY_SECONDS,
+    ) -> None:
+        """初期化
+
+        Args:
+            driver: WebDriver（暗黙的な待機は 0 秒であること）
+            timeout: 待機のタイムアウト（秒）
+            poll_frequency: 条件を確認する間隔（秒）
+        """
+        self.driver = driver
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+
+    def wait_for(
+        self,
+        locator: Locator,
+        error_locators: tuple[Locator, ...] = (),
+        timeout: float | None = None,
+    ) -> WebElement:
+        """要素が表示されるまで待機する
+
+        Args:
+            locator: 待機する要素
+            error_locators: 検出した時点で失敗とするエラー画面の要素
+            timeout: タイムアウト（秒、省略時は初期化時の値）
+
+        Returns:
+            WebElement: 表示された要素
+
+        Raises:
+            ErrorPageDetected: エラー画面の要素を検出した場合
+            TimeoutException: タイムアウトまでに要素が表示されなかった場合
+        """
+
+        def _condition(driver: WebDriver) -> WebElement | bool:
+            for error_locator in error_locators:
+                if driver.find_elements(*error_locator):
+                    raise ErrorPageDetected(error_locator)
+            found = driver.find_elements(*locator)
+            return found[0] if found else False
+
+        return self._wait(timeout).until(_condition, message=f"要素が表示されませんでした: {locator}")
+
+    def wait_for_page_change(self, element: WebElement, timeout: float | None = None) -> None:
+        """遷移前の画面の要素が破棄される（次の画面に遷移する）まで待機する
+
+        Raises:
+            TimeoutException: タイムアウトまでに遷移しなかった場合
+        """
+        self._wait(timeout).until(ec.staleness_of(element), message="画面が遷移しませんでした")
+
+    def find(self, locator: Locator) -> WebElement | None:
+        """待機せずに要素を取得する（存在しない場合は None）"""
+        found = self.driver.find_elements(*locator)
+        return found[0] if found else None
+
+    def _wait(self, timeout: float | None) -> WebDriverWait:
+        return WebDriverWait(
+            self.driver,
+            self.timeout if timeout is None else timeout,
+            poll_frequency=self.poll_frequency,
+        )
@@ -1,14 +1,46 @@
-"""S3 アーティファクトリポジトリ実装"""
+"""S3 アーティファクトリポジトリ実装
 
+エラーアーティファクトは内容のハッシュをキーとして保存し、同一内容のファイル
+（サイトのレイアウト変更により毎日同じエラー画面になる場合など）は再アップロードしない。
+失敗ごとの発生日時・エラー内容・アーティファクトのキーは JSON のインデックスに記録し、
+1 回の読み取りで失敗の履歴を確認できるようにする。
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import mimetypes
 import os
 
-import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+from shared.infrastructure.aws_clients import get_client
 
 from src.config.settings import get_logger
-from src.domain import ArtifactUploadError, IArtifactRepository
+from src.domain import ArtifactUploadError, FailureRecord, IArtifactRepository
 
 logger = get_logger()
 
+# 内容のハッシュをキーとするエラーアーティファクトの保存先
+OBJECTS_PREFIX = "errors/objects/"
+
+# スクレイピング失敗のインデックス
+INDEX_KEY = "errors/index.json"
+
+# インデックスに保持する失敗の記録の上限（古いものから削除する）
+MAX_INDEX_ENTRIES = 500
+
+# 圧縮して保存するファイルの拡張子（テキスト形式は gzip で数分の一になる）
+COMPRESSED_EXTENSIONS = (".html",)
+
+# 大きなページはマルチパートアップロードで分割して並行して送信する
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4,
+)
+
 
 class S3ArtifactRepository(IArtifactRepository):
     """S3 アーティファクトリポジトリ実装"""
@@ -16,31 +48,93 @@ class S3ArtifactRepository(IArtifactRepository):
     def __init__(self, bucket: str) -> None:
         """S3 クライアントを初期化
 
-        環境変数 ENV が "local" または "test" の場合、LocalStack の endpoint を使用
+        クライアントはコンテナ内で共有する（ENV が "local" または "test" の場合は LocalStack を使用）
 
         Args:
             bucket: S3 バケット名
         """
-        if os.environ.get("ENV") in ["local", "test"]:
-            self.client = boto3.client("s3", endpoint_url=os.environ["LOCAL_STACK_CONTAINER_URL"])
-        else:
-            self.client = boto3.client("s3")
+        self.client = get_client("s3")
         self.bucket = bucket
 
-    def save_error_artifact(self, key: str, file_path: str) -> None:
+    def save_error_artifact(self, file_path: str) -> str:
         """エラーアーティファクトを S3 に保存する
 
+        キーは内容の SHA-256 とし、同一内容のオブジェクトが保存済みの場合はアップロードを省略する。
+        HTML は gzip で圧縮し、Content-Encoding を付与して保存する（ダウンロード時に展開される）。
+
         Args:
-            key: S3オブジェクトのキー
             file_path: 保存するファイルのパス
 
+        Returns:
+            str: 保存したオブジェクトのキー
+
         Raises:
             ArtifactUploadError: S3 へのファイルアップロード失敗時
         """
+        key = None
         try:
-            self.client.upload_file(file_path, self.bucket, key)
+            with open(file_path, "rb") as f:
+                content = f.read()
+            key = f"{OBJECTS_PREFIX}{hashlib.sha256(content).hexdigest()}{os.path.splitext(file_path)[1]}"
+
+            if self._exists(key):
+                logger.info("同一内容のエラーアーティファクトが保存済みのためアップロードを省略します", key=key)
+                return key
+
+            extra_args = {"ContentType": mimetypes.guess_type(file_path)[0] or "application/octet-stream"}
+            if file_path.endswith(COMPRESSED_EXTENSIONS):
+                content = gzip.compress(content)
+                extra_args["ContentEncoding"] = "gzip"
+            self.client.upload_fileobj(
+                io.BytesIO(content), self.bucket, key, ExtraArgs=extra_args, Config=TRANSFER_CONFIG
+            )
             logger.info("S3 へのファイルアップロード成功", bucket=self.bucket, key=key)
+            return key
+        except Exception as e:
+            raise ArtifactUploadError(
+                f"S3 へのファイルアップロードに失敗しました。bucket={self.bucket}, key={key}, file_path={file_path}"
+            ) from e
+
+    def record_failures(self, records: list[FailureRecord]) -> None:
+        """スクレイピング失敗の記録をインデックスに追加する
+
+        インデックスは発生日時の昇順に並べ、上限を超えた古い記録は削除する。
+
+        Args:
+            records: 追加する失敗の記録
+
+        Raises:
+            ArtifactUploadError: インデックスの読み書き失敗時
+        """
+        if not records:
+            return
+
+        try:
+            entries = self._read_index()
+            entries.extend(record.model_dump(mode="json") for record in records)
+            entries.sort(key=lambda entry: entry["occurred_at"])
+            body = json.dumps(entries[-MAX_INDEX_ENTRIES:], ensure_ascii=False).encode("utf-8")
+            self.client.put_object(Bucket=self.bucket, Key=INDEX_KEY, Body=body, ContentType="application/json")
+            logger.info("スクレイピング失敗の記録をインデックスに追加しました", key=INDEX_KEY, count=len(records))
         except Exception as e:
             raise ArtifactUploadError(
-                f"S3 へのファイルアップロードに失敗しました。bucket={self.bucket}, key={key}"
+                f"エラーアーティファクトのインデックスの保存に失敗しました。bucket={self.bucket}, key={INDEX_KEY}"
             ) from e
+
+    def _exists(self, key: str) -> bool:
+        """オブジェクトが保存済みか（HEAD は PUT より安価なため、アップロード前に確認する）"""
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=key)
+            return True
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NotFound"):
+                return False
+            raise
+
+    def _read_index(self) -> list[dict]:
+        """インデックスを読み込む（存在しない場合は空）"""
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=INDEX_KEY)
+        except self.client.exceptions.NoSuchKey:
+            return []
+        return json.loads(response["Body"].read())
@@ -0,0 +1,85 @@
+"""S3 列指向ストアを使った資産レコードリポジトリ実装"""
+
+from collections.abc import Callable
+
+from shared.infrastructure.s3_asset_record_store import AssetRecordColumns, S3AssetRecordStore
+
+from src.config.settings import get_logger
+from src.domain import AssetRecord, AssetRecordError, IAssetRecordRepository
+
+logger = get_logger()
+
+
+class S3AssetRecordRepository(IAssetRecordRepository):
+    """S3 の列指向ストアを正とし、任意でミラー先（Google Spreadsheet 等）にも保存する IAssetRecordRepository 実装"""
+
+    def __init__(
+        self,
+        bucket: str,
+        mirror: IAssetRecordRepository | None = None,
+        store: S3AssetRecordStore | None = None,
+        backfill: Callable[[], list[AssetRecord]] | None = None,
+    ) -> None:
+        """リポジトリを初期化
+
+        Args:
+            bucket: S3 バケット名
+            mirror: 閲覧用に同じレコードを保存するリポジトリ
+            store: 列指向ストア（テスト時に注入可能）
+            backfill: ストアが空の場合に、既存の履歴（S3 を正とする前に保存したレコード）を取得する関数
+        """
+        self.store = store if store is not None else S3AssetRecordStore(bucket)
+        self.mirror = mirror
+        self.backfill = backfill
+
+    def save_daily_records(self, records: list[AssetRecord], product_prefixes: list[str] | None = None) -> None:
+        """日次の資産レコードを対象年のパーティションに保存する
+
+        冪等性の実現方法:
+        1. 対象年のパーティションを読み込む
+           （ストアにパーティションがない場合は、backfill で取得した既存の履歴を年ごとに書き込む）
+        2. 対象日付の行（product_prefixes 指定時はそのいずれかで始まる商品の行）を新しいレコードで置き換える
+           （日付昇順を維持）
+        3. パーティションを書き戻し、ミラー先にも保存する
+
+        Args:
+            records: 保存する資産レコードのリスト
+            product_prefixes: 置き換える既存レコードの商品名の接頭辞（None の場合は対象日付の全レコードを置き換える）
+
+        Raises:
+            AssetRecordError: レコード保存失敗時
+        """
+        if not records:
+            return
+
+        target_date = records[0].date
+        try:
+            partition = self.store.read_year(target_date.year)
+            if len(partition) == 0 and self.backfill is not None and not self.store.list_years():
+                partition = self._backfill(target_date.year)
+            updated = partition.replace_date(
+                str(target_date), AssetRecordColumns.from_records(records), product_prefixes
+            )
+            self.store.write_year(target_date.year, updated)
+            logger.info(
+                "資産レコードを S3 に保存しました",
+                extra={"date": str(target_date), "count": len(records), "partition_rows": len(updated)},
+            )
+        except Exception as e:
+            raise AssetRecordError(f"資産レコードの S3 への保存に失敗しました: {e}") from e
+
+        if self.mirror is not None:
+            self.mirror.save_daily_records(records, product_prefixes)
+
+    def _backfill(self, target_year: int) -> AssetRecordColumns:
+        """既存の履歴を年ごとのパーティションに書き込み、対象年のパーティションを返す
+
+        S3 を正とする前の履歴がないと、サマリ通知側が切り替え後に保存したレコードしか読めないため、
+        最初の保存時に 1 回だけ実行する。
+        """
+        history = AssetRecordColumns.from_records(self.backfill())
+        years = sorted({int(d[:4]) for d in history.dates})
+        for year in years:
+            self.store.write_year(year, history.slice_dates(f"{year:04d}-01-01", f"{year:04d}-12-31"))
+        logger.info("既存の資産レコードを S3 に移行しました", extra={"rows": len(history), "years": years})
+        return history.slice_dates(f"{target_year:04d}-01-01", f"{target_year:04d}-12-31")
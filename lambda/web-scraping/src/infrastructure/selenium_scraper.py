@@ -1,13 +1,20 @@
-from tempfile import mkdtemp
+import os
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 
-from src.config.settings import get_logger
+from src.config.settings import get_logger, measure_stage
 from src.domain import AssetEvaluation, IScraper, ScrapingFailed, ScrapingParams
 
+from .asset_page_parser import extract_product_assets, parse_html
+from .chrome_driver_pool import close_chrome, get_chrome_driver_pool, launch_chrome
+from .page_navigator import DEFAULT_TIMEOUT_SECONDS, PageNavigator
+
 logger = get_logger()
 
+LOGIN_FORM_LOCATOR = (By.NAME, "userId")
+LOGOUT_LINK_LOCATOR = (By.LINK_TEXT, "ログアウト")
+
 
 class SeleniumScraper(IScraper):
     """Selenium WebDriverを提供するクラス"""
@@ -17,44 +24,67 @@ class SeleniumScraper(IScraper):
         scraping_params: ScrapingParams,
         chrome_binary_location: str = "/opt/chrome/chrome",
         chrome_driver_path: str = "/opt/chromedriver",
+        reuse_driver: bool = False,
+        wait_timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        block_resources: bool = False,
+        page_load_strategy: str = "normal",
+        error_artifact_dir: str = "/tmp",
     ) -> None:
+        """スクレイパーを初期化し、Chrome を起動する
+
+        Args:
+            scraping_params: スクレイピングパラメータ
+            chrome_binary_location: Chrome バイナリのパス
+            chrome_driver_path: ChromeDriver のパス
+            reuse_driver: True の場合、ウォームスタート間で Chrome を再利用する
+            wait_timeout: 画面遷移ごとの待機のタイムアウト（秒）
+            block_resources: True の場合、抽出に不要なリソース（画像・フォント・計測タグ等）を読み込まない
+            page_load_strategy: ページ読み込みの完了を待つ基準（"normal" または "eager"）
+            error_artifact_dir: エラー時のスクリーンショット・HTML の保存先ディレクトリ
+        """
         self.chrome_binary_location = chrome_binary_location
         self.chrome_driver_path = chrome_driver_path
         self.user_agent = scraping_params.user_agent
+        self.block_resources = block_resources
+        self.page_load_strategy = page_load_strategy
+        self.error_artifact_dir = error_artifact_dir
+        self.driver_pool = (
+            get_chrome_driver_pool(
+                chrome_binary_location, chrome_driver_path, self.user_agent, block_resources, page_load_strategy
+            )
+            if reuse_driver
+            else None
+        )
         self.driver = self._get_driver()
+        self.navigator = PageNavigator(self.driver, timeout=wait_timeout)
         self.user_id = scraping_params.login_user_id
         self.password = scraping_params.login_password
         self.birthdate = scraping_params.login_birthdate
         self.start_url = scraping_params.start_url
 
     def _get_driver(self) -> webdriver.Chrome:
-        chrome_options = webdriver.ChromeOptions()
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-dev-tools")
-        chrome_options.add_argument("--no-zygote")
-        chrome_options.add_argument("--window-size=1280x1696")
-        chrome_options.add_argument(f"--user-data-dir={mkdtemp()}")
-        chrome_options.add_argument(f"--data-path={mkdtemp()}")
-        chrome_options.add_argument(f"--disk-cache-dir={mkdtemp()}")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--hide-scrollbars")
-        chrome_options.add_argument("--enable-logging")
-        chrome_options.add_argument("--log-level=0")
-        chrome_options.add_argument("--v=99")
-        chrome_options.add_argument("--single-process")
-        chrome_options.add_argument(f"--user-agent={self.user_agent}")
-
-        # ref: https://github.com/umihico/docker-selenium-lambda/blob/main/main.py
-        chrome_options.binary_location = self.chrome_binary_location
-        service = webdriver.ChromeService(self.chrome_driver_path)
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-
-        # スクレイピング全体通して暗黙的に待機する時間を10秒に設定
-        driver.implicitly_wait(10)
-
-        return driver
+        if self.driver_pool is not None:
+            return self.driver_pool.acquire()
+
+        self._session = launch_chrome(
+            self.chrome_binary_location,
+            self.chrome_driver_path,
+            self.user_agent,
+            block_resources=self.block_resources,
+            page_load_strategy=self.page_load_strategy,
+        )
+        return self._session.driver
+
+    def _close_driver(self, discard: bool = False) -> None:  # noqa: FBT001, FBT002
+        """Chrome を終了する（再利用する場合はプールに返却する）
+
+        Args:
+            discard: True の場合は再利用せずに終了する
+        """
+        if self.driver_pool is not None:
+            self.driver_pool.release(discard=discard)
+        else:
+            close_chrome(self._session)
 
     def fetch_asset_valuation(self) -> dict[str, AssetEvaluation]:
         """資産評価情報を取得する
@@ -63,20 +93,22 @@ class SeleniumScraper(IScraper):
             dict[str, AssetEvaluation]: 商品別の資産評価情報
         """
         logger.info("資産評価情報の取得開始")
-        self.driver.get(self.start_url)
+        with measure_stage("StartPage"):
+            self.driver.get(self.start_url)
 
         self._login()
         self._navigate_to_asset_page()
         products = self._extract_asset_valuation()
         self._logout()
-        self.driver.quit()
+        self._close_driver()
         logger.info("資産評価情報の取得完了")
         return products
 
+    @measure_stage("Login")
     def _login(self) -> None:
         try:
             logger.info("ログイン処理開始")
-            input_user_id = self.driver.find_element(By.NAME, "userId")
+            input_user_id = self.navigator.wait_for(LOGIN_FORM_LOCATOR)
             input_password = self.driver.find_element(By.NAME, "password")
             input_birthdate = self.driver.find_element(By.NAME, "birthDate")
             input_user_id.send_keys(self.user_id)
@@ -85,81 +117,76 @@ class SeleniumScraper(IScraper):
 
             btn_login = self.driver.find_element(By.ID, "btnLogin")
             btn_login.submit()
+            self.navigator.wait_for_page_change(btn_login)
 
-            # ログアウトボタンがなければログイン失敗とする
-            self.driver.find_element(By.LINK_TEXT, "ログアウト")
+            # ログアウトボタンがなければログイン失敗とする（ログイン画面が再表示された時点で失敗と判定する）
+            self.navigator.wait_for(LOGOUT_LINK_LOCATOR, error_locators=(LOGIN_FORM_LOCATOR,))
             logger.info("ログイン処理完了")
 
         except Exception as e:
-            screenshot_path = "/tmp/error_login.png"
+            screenshot_path = os.path.join(self.error_artifact_dir, "error_login.png")
             self.driver.save_screenshot(screenshot_path)
-            self.driver.quit()
+            self._close_driver(discard=True)
             raise ScrapingFailed.during_login(tmp_screenshot_path=screenshot_path) from e
 
+    @measure_stage("Navigation")
     def _navigate_to_asset_page(self) -> None:
         """資産評価額照会ページへ遷移する"""
         try:
             logger.info("資産評価額照会ページへの遷移開始")
-            link_asset_valuation = self.driver.find_element(By.ID, "mainMenu01")
+            link_asset_valuation = self.navigator.wait_for((By.ID, "mainMenu01"))
             link_asset_valuation.click()
 
-            # 資産評価額照会ページの読み込み完了を確認
-            self.driver.find_element(By.CLASS_NAME, "total")
+            # 資産評価額照会ページの読み込み完了を確認（セッション切れでログイン画面に戻った場合は即座に失敗とする）
+            self.navigator.wait_for((By.CLASS_NAME, "total"), error_locators=(LOGIN_FORM_LOCATOR,))
             logger.info("資産評価額照会ページへの遷移完了")
         except Exception as e:
-            screenshot_path = "/tmp/error_asset_valuation.png"
+            screenshot_path = os.path.join(self.error_artifact_dir, "error_asset_valuation.png")
             self.driver.save_screenshot(screenshot_path)
             self._logout()
-            self.driver.quit()
+            self._close_driver(discard=True)
             raise ScrapingFailed.during_page_fetch(tmp_screenshot_path=screenshot_path) from e
 
+    @measure_stage("Extraction")
     def _extract_asset_valuation(self) -> dict[str, AssetEvaluation]:
         """資産評価額照会ページから商品別の資産情報を抽出する
 
         Returns:
             dict[str, AssetEvaluation]: 商品別の資産評価情報
         """
+        page_source = None
         try:
             logger.info("資産情報の抽出開始")
-            products_assets = self._extract_product_assets()
+            # 要素ごとに WebDriver を呼び出さず、ページの HTML を 1 回だけ取得してローカルで解析する
+            page_source = self.driver.page_source
+            products_assets = self._extract_product_assets(page_source)
             logger.info("資産情報の抽出完了")
             return products_assets
         except Exception as e:
-            html_path = "/tmp/error_extraction.html"
+            html_path = os.path.join(self.error_artifact_dir, "error_extraction.html")
             try:
                 with open(html_path, "w", encoding="utf-8") as f:
-                    f.write(self.driver.page_source)
+                    f.write(page_source if page_source is not None else self.driver.page_source)
             except Exception as write_error:
                 logger.warning("HTML ファイルの保存に失敗しました。", error=str(write_error))
                 html_path = None
             self._logout()
-            self.driver.quit()
+            self._close_driver(discard=True)
             raise ScrapingFailed.during_extraction(tmp_html_path=html_path) from e
 
-    def _extract_product_assets(self) -> dict[str, AssetEvaluation]:
+    def _extract_product_assets(self, page_source: str) -> dict[str, AssetEvaluation]:
         """商品別資産を抽出する
 
+        Args:
+            page_source: 資産評価額照会ページの HTML
+
         Returns:
             dict[str, AssetEvaluation]: 商品別資産情報
         """
         logger.info("商品別の資産評価額の抽出開始")
 
-        product_info = self.driver.find_element(By.ID, "prodInfo")
-        products = product_info.find_elements(By.CSS_SELECTOR, ".infoDetailUnit_02.pc_mb30")
-
-        assets_each_product: dict[str, AssetEvaluation] = {}
-        for product in products:
-            table_body = product.find_element(By.TAG_NAME, "tbody")
-            table_rows = table_body.find_elements(By.TAG_NAME, "tr")
-
-            product_assets = AssetEvaluation.from_html_strings(
-                cumulative_contributions_str=table_rows[2].find_elements(By.TAG_NAME, "td")[-1].text,
-                gains_or_losses_str=table_rows[5].find_elements(By.TAG_NAME, "td")[-1].text,
-                asset_valuation_str=table_rows[2].find_elements(By.TAG_NAME, "td")[2].text,
-            )
-
-            product_name = product.find_element(By.CLASS_NAME, "infoHdWrap00").text.strip()
-            assets_each_product[product_name] = product_assets
+        assets_each_product = extract_product_assets(parse_html(page_source))
+        for product_name, product_assets in assets_each_product.items():
             logger.debug(
                 f"商品別資産評価額情報: {product_name}.",
                 extra=product_assets.__dict__,
@@ -177,7 +204,11 @@ class SeleniumScraper(IScraper):
     def _logout(self) -> None:
         try:
             logger.info("ログアウト処理開始")
-            link_logout = self.driver.find_element(By.LINK_TEXT, "ログアウト")
+            # ログアウトリンクがない（ログインしていない）場合は待機せずに終了する
+            link_logout = self.navigator.find(LOGOUT_LINK_LOCATOR)
+            if link_logout is None:
+                logger.warning("ログアウトリンクが見つからないためログアウト処理をスキップします。")
+                return
             link_logout.click()
             logger.info("ログアウト処理完了")
         except Exception:
@@ -1,17 +1,23 @@
 """資産情報収集の Presentation 層"""
 
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 from zoneinfo import ZoneInfo
 
-from src.application import WebScrapingService
+from src import infrastructure
+from src.application import MultiAccountScrapingService
 from src.config.settings import get_logger, get_settings
-from src.domain import AssetRecord, IAssetRecordRepository, IScraper, ScrapingParams
-from src.infrastructure import (
-    GoogleSheetAssetRecordRepository,
-    S3ArtifactRepository,
-    SeleniumScraper,
-    get_ssm_json_parameter,
+from src.domain import (
+    AccountScrapingFailed,
+    AssetEvaluation,
+    AssetRecord,
+    IAssetRecordRepository,
+    IScraper,
+    ScrapingParams,
 )
 
 settings = get_settings()
@@ -21,46 +27,245 @@ logger = get_logger()
 def main(
     scraper: Optional[IScraper] = None,
     asset_record_repository: Optional[IAssetRecordRepository] = None,
+    deadline: Optional[float] = None,
 ) -> None:
     """メイン処理
 
+    スクレイピングパラメータに複数のアカウントが含まれる場合は、アカウントごとに並行して取得し、
+    取得に成功した全アカウントの資産レコードを 1 回の書き込みで保存する。
+
     Args:
         scraper (Optional[IScraper]): スクレイパー（テスト時にMockを注入可能）
         asset_record_repository (Optional[IAssetRecordRepository]): 資産レコードリポジトリ（テスト時にMockを注入可能）
+        deadline (Optional[float]): 実行の期限（time.monotonic() 基準、エラーアーティファクトの保存の打ち切りに使用）
 
     Raises:
-        ScrapingFailed: スクレイピングまたは資産情報抽出処理失敗時
-        ArtifactUploadError: エラーアーティファクトの S3 保存失敗時
+        ScrapingFailed: スクレイピングまたは資産情報抽出処理失敗時（アカウントが 1 件の場合）
+        AccountScrapingFailed: 一部または全てのアカウントのスクレイピング失敗時（アカウントが複数の場合）
         AssetRecordError: 資産レコードの保存失敗時
     """
+    # 実装の生成に必要な SSM パラメータを 1 回の API 呼び出しでまとめて取得
+    parameter_names = []
+    if scraper is None:
+        parameter_names.append(settings.scraping_parameter_name)
+    if asset_record_repository is None:
+        parameter_names.append(settings.spreadsheet_parameter_name)
+    parameters = infrastructure.get_ssm_json_parameters(parameter_names, decrypt=True)
+
     # scraperが指定されていない場合のみ実装を使用
+    scraper_factories: dict[str, Callable[[], IScraper]]
     if scraper is None:
-        scraping_parameter = get_ssm_json_parameter(name=settings.scraping_parameter_name, decrypt=True)
-        scraping_params = ScrapingParams(
-            login_user_id=scraping_parameter["login_user_id"],
-            login_password=scraping_parameter["login_password"],
-            login_birthdate=scraping_parameter["login_birthdate"],
-            start_url=scraping_parameter["start_url"],
-            user_agent=settings.user_agent,
-        )
-        scraper = SeleniumScraper(scraping_params=scraping_params)
+        scraper_factories = _create_scraper_factories(parameters[settings.scraping_parameter_name])
+    else:
+        scraper_factories = {"": lambda: scraper}
 
+    # 互いに独立したリソースを並行して初期化し、起動時間を最も遅いリソースの初期化時間に抑える
+    # （最初のアカウントのスクレイパーは Chrome の起動をリポジトリの初期化と重ねるためここで生成し、
+    #   2 件目以降は同時に起動するブラウザ数を抑えるため、アカウントごとの取得処理の中で生成する）
+    first_account = next(iter(scraper_factories))
+    factories: dict[str, Callable[[], Any]] = {
+        "artifact_repository": lambda: infrastructure.S3ArtifactRepository(settings.data_bucket_name),
+        "scraper": lambda: _prepare_scraper(scraper_factories[first_account]),
+    }
     if asset_record_repository is None:
-        spreadsheet_param = get_ssm_json_parameter(name=settings.spreadsheet_parameter_name, decrypt=True)
-        asset_record_repository = GoogleSheetAssetRecordRepository(
-            spreadsheet_id=spreadsheet_param["spreadsheet_id"],
-            sheet_name=spreadsheet_param["sheet_name"],
-            credentials=spreadsheet_param["credentials"],
+        factories["asset_record_repository"] = lambda: _create_asset_record_repository(
+            parameters[settings.spreadsheet_parameter_name]
         )
+    resources = _initialize_concurrently(factories)
+    asset_record_repository = resources.get("asset_record_repository", asset_record_repository)
+    scraper_factories = {**scraper_factories, first_account: resources["scraper"]}
 
-    artifact_repository = S3ArtifactRepository(settings.data_bucket_name)
-
-    web_scraping_service = WebScrapingService(
-        scraper=scraper,
-        artifact_repository=artifact_repository,
+    scraping_service = MultiAccountScrapingService(
+        scraper_factories=scraper_factories,
+        artifact_repository=resources["artifact_repository"],
+        max_workers=settings.scraping_max_workers,
+        deadline=deadline,
     )
-    products = web_scraping_service.scrape()
+    result = scraping_service.scrape()
 
+    # 取得に成功した全アカウントの資産レコードを 1 回の書き込みで保存する
+    # （再実行で一部のアカウントのみ取得できた場合に、先の実行で保存した他のアカウントの行を消さないよう、
+    #   置き換える既存レコードは取得に成功したアカウントの商品に限る）
     today = datetime.now(ZoneInfo("Asia/Tokyo")).date()
-    records = AssetRecord.from_asset_evaluations(target_date=today, products=products)
-    asset_record_repository.save_daily_records(records)
+    records = [
+        record
+        for account_name, products in result.products.items()
+        for record in AssetRecord.from_asset_evaluations(
+            target_date=today, products=_qualify_product_names(account_name, products)
+        )
+    ]
+    if records:
+        asset_record_repository.save_daily_records(records, _product_prefixes(result.products))
+
+    if result.failures:
+        # アカウントが 1 件の場合は従来どおりスクレイピングの例外をそのまま送出する
+        if len(scraper_factories) == 1:
+            raise next(iter(result.failures.values()))
+        raise AccountScrapingFailed.for_accounts(result.failures)
+
+
+def _parse_accounts(scraping_parameter: dict) -> dict[str, ScrapingParams]:
+    """スクレイピングパラメータからアカウント名 → ScrapingParams を生成する
+
+    パラメータは 1 アカウント分のログイン情報、または accounts キーにアカウントごとのログイン情報
+    （name でアカウント名を指定する）のリストを持つ。1 アカウント分の場合、アカウント名は空文字とする。
+
+    Raises:
+        ValueError: アカウント名が未指定または重複している場合
+    """
+    if "accounts" not in scraping_parameter:
+        return {"": _to_scraping_params(scraping_parameter)}
+
+    accounts: dict[str, ScrapingParams] = {}
+    for account in scraping_parameter["accounts"]:
+        name = account.get("name", "")
+        if not name or name in accounts:
+            msg = f"アカウント名が未指定または重複しています: name={name!r}"
+            raise ValueError(msg)
+        accounts[name] = _to_scraping_params(account)
+    return accounts
+
+
+def _to_scraping_params(account: dict) -> ScrapingParams:
+    return ScrapingParams(
+        login_user_id=account["login_user_id"],
+        login_password=account["login_password"],
+        login_birthdate=account["login_birthdate"],
+        start_url=account["start_url"],
+        user_agent=settings.user_agent,
+    )
+
+
+def _qualify_product_names(account_name: str, products: dict[str, AssetEvaluation]) -> dict[str, AssetEvaluation]:
+    """アカウント間で商品名が重複しないよう、商品名にアカウント名を付与する（アカウント名が空の場合はそのまま）"""
+    if not account_name:
+        return products
+    return {f"{account_name}/{product_name}": assets for product_name, assets in products.items()}
+
+
+def _product_prefixes(products_by_account: dict[str, dict[str, AssetEvaluation]]) -> list[str] | None:
+    """置き換える既存レコードの商品名の接頭辞（アカウント名が空の 1 アカウント構成では対象日付の全レコード）"""
+    if "" in products_by_account:
+        return None
+    return [f"{account_name}/" for account_name in products_by_account]
+
+
+def _create_scraper_factories(scraping_parameter: dict) -> dict[str, Callable[[], IScraper]]:
+    """アカウントごとのスクレイパーを生成する関数を作成する
+
+    並行して取得するアカウントのエラー時のファイルが互いに上書きされないよう、保存先をアカウントごとに分ける。
+    Chrome の再利用はコンテナ内に 1 プロセスを保持するため、アカウントが 1 件の場合のみ有効とする。
+    """
+    accounts = _parse_accounts(scraping_parameter)
+    reuse_driver = settings.reuse_chrome_driver and len(accounts) == 1
+
+    def _factory(scraping_params: ScrapingParams, error_artifact_dir: str) -> Callable[[], IScraper]:
+        return lambda: _create_scraper(scraping_params, reuse_driver, error_artifact_dir)
+
+    factories: dict[str, Callable[[], IScraper]] = {}
+    for i, (account_name, scraping_params) in enumerate(accounts.items()):
+        error_artifact_dir = f"/tmp/account-{i}" if account_name else "/tmp"
+        factories[account_name] = _factory(scraping_params, error_artifact_dir)
+    return factories
+
+
+def _prepare_scraper(factory: Callable[[], IScraper]) -> Callable[[], IScraper]:
+    """スクレイパーを生成し、それを返す関数を作成する
+
+    生成に失敗した場合は、他のアカウントの取得に影響しないよう、
+    例外を送出せずにアカウントの取得処理の中で送出する関数を返す。
+    """
+    try:
+        scraper = factory()
+    except Exception as e:
+        error = e
+
+        def _raise() -> IScraper:
+            raise error
+
+        return _raise
+    return lambda: scraper
+
+
+def _create_scraper(
+    scraping_params: ScrapingParams,
+    reuse_driver: bool,  # noqa: FBT001
+    error_artifact_dir: str,
+) -> IScraper:
+    """設定に応じたスクレイパーを生成する
+
+    scraper_type が selenium の場合は Chrome を起動する。
+    http の場合はブラウザを使用せずに取得し、失敗した場合のみ Chrome を起動して取得し直す。
+    """
+    os.makedirs(error_artifact_dir, exist_ok=True)
+
+    def _create_selenium_scraper() -> IScraper:
+        return infrastructure.SeleniumScraper(
+            scraping_params=scraping_params,
+            reuse_driver=reuse_driver,
+            wait_timeout=settings.scraping_wait_timeout,
+            block_resources=settings.chrome_block_resources,
+            page_load_strategy=settings.chrome_page_load_strategy,
+            error_artifact_dir=error_artifact_dir,
+        )
+
+    if settings.scraper_type == "http":
+        return infrastructure.FallbackScraper(
+            primary=infrastructure.HttpScraper(scraping_params=scraping_params, error_artifact_dir=error_artifact_dir),
+            fallback=_create_selenium_scraper,
+        )
+    return _create_selenium_scraper()
+
+
+def _create_asset_record_repository(spreadsheet_param: dict) -> IAssetRecordRepository:
+    """設定に応じた資産レコードリポジトリを生成する"""
+    sheet_repository = infrastructure.GoogleSheetAssetRecordRepository(
+        spreadsheet_id=spreadsheet_param["spreadsheet_id"],
+        sheet_name=spreadsheet_param["sheet_name"],
+        credentials=spreadsheet_param["credentials"],
+    )
+    asset_record_repository: IAssetRecordRepository = sheet_repository
+    # S3 を正とする場合、Google Spreadsheet は閲覧用のミラーとする
+    # （S3 のストアが空の場合は、最初の保存時にシート上の既存の履歴を S3 に移行する）
+    if settings.asset_record_store == "s3":
+        asset_record_repository = infrastructure.S3AssetRecordRepository(
+            bucket=settings.data_bucket_name,
+            mirror=sheet_repository,
+            backfill=sheet_repository.read_all_records,
+        )
+    # 保存したレコードのフィンガープリントを記録する（サマリ通知側はこれを参照してシートの読み取りを省略する）
+    return infrastructure.FingerprintedAssetRecordRepository(
+        inner=asset_record_repository,
+        fingerprint_store=infrastructure.AssetRecordFingerprintStore(settings.data_bucket_name),
+        skip_unchanged=settings.skip_unchanged_asset_records,
+    )
+
+
+def _initialize_concurrently(factories: dict[str, Callable[[], Any]]) -> dict[str, Any]:
+    """リソースをスレッドプールで並行して初期化する
+
+    リソースごとの初期化時間と全体の初期化時間をログに出力する。
+    いずれかの初期化に失敗した場合は、全ての初期化の完了を待ってから最初の例外を送出する。
+
+    Args:
+        factories: リソース名 → リソースを生成する関数
+
+    Returns:
+        dict[str, Any]: リソース名 → 生成したリソース
+    """
+
+    def _timed(name: str, factory: Callable[[], Any]) -> Any:
+        start = time.perf_counter()
+        try:
+            return factory()
+        finally:
+            elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+            logger.info("リソースの初期化時間", extra={"resource": name, "elapsed_ms": elapsed_ms})
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(len(factories), 1)) as executor:
+        futures = {name: executor.submit(_timed, name, factory) for name, factory in factories.items()}
+    elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+    logger.info("リソースの初期化が完了しました", extra={"elapsed_ms": elapsed_ms})
+
+    return {name: future.result() for name, future in futures.items()}
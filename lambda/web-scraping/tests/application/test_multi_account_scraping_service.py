@@ -0,0 +1,125 @@
+import threading
+import time
+
+from src.application import MultiAccountScrapingService
+from src.domain import AssetEvaluation, FailureRecord, IArtifactRepository, IScraper
+from tests.fixtures.mocks import MockSeleniumScraper
+
+PRODUCTS = {
+    "プロダクト_1": AssetEvaluation(cumulative_contributions=100_000, gains_or_losses=11_111, asset_valuation=111_111),
+}
+
+
+class _RecordingArtifactRepository(IArtifactRepository):
+    def __init__(self) -> None:
+        self.saved_keys: list[str] = []
+        self.failure_records: list[list[FailureRecord]] = []
+
+    def save_error_artifact(self, file_path: str) -> str:
+        key = f"errors/objects/{file_path.rsplit('/', 1)[-1]}"
+        self.saved_keys.append(key)
+        return key
+
+    def record_failures(self, records: list[FailureRecord]) -> None:
+        self.failure_records.append(records)
+
+
+def test_scrape__isolates_failed_account():
+    """1 アカウントの失敗は他のアカウントの取得に影響せず、失敗したアカウントの例外として記録される"""
+    # given
+    artifact_repository = _RecordingArtifactRepository()
+    service = MultiAccountScrapingService(
+        scraper_factories={
+            "本人": lambda: MockSeleniumScraper(mock_products=PRODUCTS),
+            "配偶者": lambda: MockSeleniumScraper(should_fail=True),
+        },
+        artifact_repository=artifact_repository,
+    )
+
+    # when
+    result = service.scrape()
+
+    # then
+    assert result.products == {"本人": PRODUCTS}
+    assert list(result.failures) == ["配偶者"]
+    assert artifact_repository.saved_keys == [result.failures["配偶者"].error_screenshot_key]
+
+
+def test_scrape__records_failures_in_one_write():
+    """失敗したアカウントの記録はまとめて 1 回でインデックスに追加される"""
+
+    # given
+    def _fail() -> IScraper:
+        raise RuntimeError("chrome failed to start")
+
+    artifact_repository = _RecordingArtifactRepository()
+    service = MultiAccountScrapingService(
+        scraper_factories={
+            "本人": lambda: MockSeleniumScraper(mock_products=PRODUCTS),
+            "配偶者": lambda: MockSeleniumScraper(should_fail=True),
+            "旧口座": _fail,
+        },
+        artifact_repository=artifact_repository,
+    )
+
+    # when
+    result = service.scrape()
+
+    # then
+    assert len(artifact_repository.failure_records) == 1
+    records = {r.account: r for r in artifact_repository.failure_records[0]}
+    assert set(records) == {"配偶者", "旧口座"}
+    assert records["配偶者"].error_screenshot_key == result.failures["配偶者"].error_screenshot_key
+    assert records["旧口座"].error == "chrome failed to start"
+    assert records["旧口座"].error_screenshot_key is None
+
+
+def test_scrape__records_scraper_creation_failure():
+    """スクレイパーの生成（ブラウザの起動）に失敗した場合もアカウント単位の失敗として記録される"""
+
+    # given
+    def _fail() -> IScraper:
+        raise RuntimeError("chrome failed to start")
+
+    service = MultiAccountScrapingService(
+        scraper_factories={"本人": lambda: MockSeleniumScraper(mock_products=PRODUCTS), "配偶者": _fail},
+        artifact_repository=_RecordingArtifactRepository(),
+    )
+
+    # when
+    result = service.scrape()
+
+    # then
+    assert list(result.products) == ["本人"]
+    assert isinstance(result.failures["配偶者"], RuntimeError)
+
+
+def test_scrape__bounds_concurrent_accounts():
+    """同時に取得するアカウント数は max_workers 以下に抑えられる"""
+    # given
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def _factory() -> IScraper:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return MockSeleniumScraper(mock_products=PRODUCTS)
+
+    service = MultiAccountScrapingService(
+        scraper_factories={f"account-{i}": _factory for i in range(5)},
+        artifact_repository=_RecordingArtifactRepository(),
+        max_workers=2,
+    )
+
+    # when
+    result = service.scrape()
+
+    # then
+    assert len(result.products) == 5
+    assert peak == 2
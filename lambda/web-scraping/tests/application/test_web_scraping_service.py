@@ -0,0 +1,96 @@
+import threading
+import time
+
+import pytest
+
+from src.application import WebScrapingService
+from src.domain import ArtifactUploadError, IArtifactRepository, IScraper, ScrapingFailed
+
+
+class _FailingScraper(IScraper):
+    def __init__(self, error: ScrapingFailed) -> None:
+        self.error = error
+
+    def fetch_asset_valuation(self):
+        raise self.error
+
+
+class _SlowArtifactRepository(IArtifactRepository):
+    """アップロードに時間がかかる（または失敗する）アーティファクトリポジトリ"""
+
+    def __init__(self, delay: float = 0.0, fail_keys: tuple[str, ...] = ()) -> None:
+        self.delay = delay
+        self.fail_keys = fail_keys
+        self.started: list[str] = []
+        self.release = threading.Event()
+
+    def save_error_artifact(self, file_path: str) -> str:
+        self.started.append(file_path)
+        self.release.wait(self.delay)
+        if file_path.endswith(self.fail_keys):
+            msg = f"upload failed: {file_path}"
+            raise ArtifactUploadError(msg)
+        return f"errors/objects/{file_path.rsplit('/', 1)[-1]}"
+
+    def record_failures(self, records) -> None:
+        pass
+
+
+def _scraping_failed() -> ScrapingFailed:
+    return ScrapingFailed.during_login(tmp_screenshot_path="/tmp/error.png", tmp_html_path="/tmp/error.html")
+
+
+def test_scrape__uploads_artifacts_concurrently():
+    """スクリーンショットと HTML を並行してアップロードし、S3 キーを例外に設定する"""
+    # given
+    repository = _SlowArtifactRepository(delay=0.2)
+    service = WebScrapingService(scraper=_FailingScraper(_scraping_failed()), artifact_repository=repository)
+
+    # when
+    start = time.perf_counter()
+    with pytest.raises(ScrapingFailed) as exc_info:
+        service.scrape()
+    elapsed = time.perf_counter() - start
+
+    # then
+    assert elapsed < 0.35
+    assert exc_info.value.error_screenshot_key.endswith(".png")
+    assert exc_info.value.error_html_key.endswith(".html")
+
+
+def test_scrape__upload_failure_does_not_hide_scraping_error():
+    """アップロードに失敗した場合もスクレイピングの例外を送出する"""
+    # given
+    repository = _SlowArtifactRepository(fail_keys=(".png",))
+    service = WebScrapingService(scraper=_FailingScraper(_scraping_failed()), artifact_repository=repository)
+
+    # when, then
+    with pytest.raises(ScrapingFailed, match="ログイン処理に失敗しました") as exc_info:
+        service.scrape()
+    assert exc_info.value.error_screenshot_key is None
+    assert exc_info.value.error_html_key is not None
+
+
+def test_scrape__stops_waiting_for_upload_at_deadline(monkeypatch):
+    """期限までにアップロードが完了しない場合は待たずにスクレイピングの例外を送出する"""
+    # given
+    monkeypatch.setattr("src.application.web_scraping_service.DEADLINE_MARGIN_SECONDS", 0.0)
+    repository = _SlowArtifactRepository(delay=5.0)
+    service = WebScrapingService(
+        scraper=_FailingScraper(_scraping_failed()),
+        artifact_repository=repository,
+        deadline=time.monotonic() + 0.2,
+    )
+
+    # when
+    start = time.perf_counter()
+    with pytest.raises(ScrapingFailed) as exc_info:
+        service.scrape()
+    elapsed = time.perf_counter() - start
+    repository.release.set()
+
+    # then
+    assert elapsed < 1.0
+    assert len(repository.started) == 2
+    assert exc_info.value.error_screenshot_key is None
+    assert exc_info.value.error_html_key is None
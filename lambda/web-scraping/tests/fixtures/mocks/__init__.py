@@ -1,4 +1,6 @@
 from tests.fixtures.mocks.mock_asset_record_repository import MockAssetRecordRepository
 from tests.fixtures.mocks.mock_selenium_scraper import MockSeleniumScraper
+from tests.fixtures.mocks.mock_spreadsheet import MockSpreadsheet
+from tests.fixtures.mocks.mock_worksheet import MockWorksheet
 
-__all__ = ["MockAssetRecordRepository", "MockSeleniumScraper"]
+__all__ = ["MockAssetRecordRepository", "MockSeleniumScraper", "MockSpreadsheet", "MockWorksheet"]
@@ -7,5 +7,5 @@ class MockAssetRecordRepository(IAssetRecordRepository):
     def __init__(self) -> None:
         self.saved_records: list[AssetRecord] = []
 
-    def save_daily_records(self, records: list[AssetRecord]) -> None:
+    def save_daily_records(self, records: list[AssetRecord], product_prefixes: list[str] | None = None) -> None:
         self.saved_records.extend(records)
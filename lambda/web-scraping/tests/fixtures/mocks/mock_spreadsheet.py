@@ -0,0 +1,81 @@
+"""テスト用 Mock Spreadsheet"""
+
+import json
+
+from gspread.exceptions import APIError
+from requests import Response
+
+from tests.fixtures.mocks.mock_worksheet import MockWorksheet
+
+
+def _range_not_found(range_name: str) -> APIError:
+    """存在しないシートを範囲指定した場合の APIError を生成"""
+    response = Response()
+    response.status_code = 400
+    response._content = json.dumps(
+        {"error": {"code": 400, "message": f"Unable to parse range: {range_name}", "status": "INVALID_ARGUMENT"}}
+    ).encode()
+    return APIError(response)
+
+
+class MockSpreadsheet:
+    """gspread.Spreadsheet のインメモリ Mock 実装
+
+    シート名 → MockWorksheet を保持し、values_* 系の API 呼び出しを記録してテストで検証可能にする
+    """
+
+    def __init__(self, worksheets: dict[str, MockWorksheet]) -> None:
+        """Mock Spreadsheet を初期化
+
+        Args:
+            worksheets: シート名 → MockWorksheet のマッピング
+        """
+        self.worksheets = worksheets
+        self.api_calls: list[str] = []
+
+    def worksheet(self, title: str) -> MockWorksheet:
+        return self.worksheets[title]
+
+    def add_worksheet(self, title: str, rows: int, cols: int) -> MockWorksheet:
+        self.api_calls.append("add_worksheet")
+        self.worksheets[title] = MockWorksheet([], title=title, sheet_id=len(self.worksheets))
+        return self.worksheets[title]
+
+    def values_get(self, range_name: str) -> dict:
+        self.api_calls.append("values_get")
+        worksheet, a1 = self._resolve(range_name)
+        return {"range": range_name, "values": worksheet._read_range(a1)}
+
+    def values_clear(self, range_name: str) -> dict:
+        self.api_calls.append("values_clear")
+        worksheet, _ = self._resolve(range_name)
+        worksheet.values = []
+        return {}
+
+    def values_append(self, range_name: str, params: dict, body: dict) -> dict:
+        self.api_calls.append("values_append")
+        worksheet, _ = self._resolve(range_name)
+        worksheet.values.extend([str(v) for v in row] for row in body["values"])
+        return {}
+
+    def batch_update(self, body: dict) -> dict:
+        self.api_calls.append("batch_update")
+        worksheets = {w.id: w for w in self.worksheets.values()}
+        for request in body["requests"]:
+            if "deleteDimension" in request:
+                dimension_range = request["deleteDimension"]["range"]
+                worksheet = worksheets[dimension_range["sheetId"]]
+                del worksheet.values[dimension_range["startIndex"] : dimension_range["endIndex"]]
+            elif "appendCells" in request:
+                worksheet = worksheets[request["appendCells"]["sheetId"]]
+                for row in request["appendCells"]["rows"]:
+                    cells = [next(iter(cell["userEnteredValue"].values())) for cell in row["values"]]
+                    worksheet.values.append([str(v) for v in cells])
+        return {}
+
+    def _resolve(self, range_name: str) -> tuple[MockWorksheet, str]:
+        title, a1 = range_name.rsplit("!", 1)
+        title = title.strip("'")
+        if title not in self.worksheets:
+            raise _range_not_found(range_name)
+        return self.worksheets[title], a1
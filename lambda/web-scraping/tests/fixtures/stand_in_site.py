@@ -0,0 +1,85 @@
+"""記録済みのページを返すスクレイピング対象サイトの代替 HTTP サーバー"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs
+
+PAGES_DIR = Path(__file__).parent / "pages"
+SESSION_COOKIE = "session=stand-in-session"
+
+
+class StandInSite:
+    """ログイン → 資産評価額照会 → ログアウトを再現する HTTP サーバー
+
+    Attributes:
+        credentials (dict[str, str]): ログインに成功するフォームの値
+        pages (dict[str, str]): パス → 返却するページのファイル名
+        requests (list[tuple[str, str]]): 受け付けたリクエスト (メソッド, パス)
+    """
+
+    def __init__(self, credentials: dict[str, str]) -> None:
+        self.credentials = credentials
+        self.pages = {"/login": "login.html", "/top": "top.html", "/assets": "assets.html"}
+        self.requests: list[tuple[str, str]] = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StandInSite":
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args) -> None:  # noqa: A002
+                pass
+
+            def do_GET(self) -> None:
+                site.requests.append(("GET", self.path))
+                if self.path == "/login":
+                    self._send_page("/login")
+                elif self.path == "/logout":
+                    self._redirect("/login", cookie="session=; Max-Age=0")
+                elif self.path in site.pages and SESSION_COOKIE in self.headers.get("Cookie", ""):
+                    self._send_page(self.path)
+                elif self.path in site.pages:
+                    self._redirect("/login")
+                else:
+                    self.send_error(404)
+
+            def do_POST(self) -> None:
+                site.requests.append(("POST", self.path))
+                body = self.rfile.read(int(self.headers["Content-Length"])).decode()
+                form = {key: values[0] for key, values in parse_qs(body).items()}
+                if self.path == "/login" and all(form.get(k) == v for k, v in site.credentials.items()):
+                    self._redirect("/top", cookie=SESSION_COOKIE)
+                else:
+                    self._send_page("/login")
+
+            def _send_page(self, path: str) -> None:
+                content = (PAGES_DIR / site.pages[path]).read_bytes()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def _redirect(self, location: str, cookie: str | None = None) -> None:
+                self.send_response(302)
+                self.send_header("Location", location)
+                if cookie:
+                    self.send_header("Set-Cookie", f"{cookie}; Path=/")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+        return Handler
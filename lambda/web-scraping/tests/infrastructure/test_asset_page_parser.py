@@ -0,0 +1,50 @@
+from pathlib import Path
+
+import pytest
+
+from src.domain import AssetEvaluation
+from src.infrastructure.asset_page_parser import extract_product_assets, is_asset_page, parse_html
+
+PAGES_DIR = Path(__file__).parent.parent / "fixtures" / "pages"
+
+
+def test_extract_product_assets__extracts_each_product():
+    """商品ごとの拠出金額累計・評価損益・資産評価額と商品名を抽出する"""
+    # given
+    document = parse_html((PAGES_DIR / "assets.html").read_text(encoding="utf-8"))
+
+    # when
+    products = extract_product_assets(document)
+
+    # then
+    assert is_asset_page(document) is True
+    assert products["プロダクト_1"] == AssetEvaluation(
+        cumulative_contributions=100_000, gains_or_losses=11_111, asset_valuation=111_111
+    )
+    assert list(products) == ["プロダクト_1", "プロダクト_2"]
+
+
+def test_extract_product_assets__extracts_rows_without_tbody():
+    """HTTP で取得した HTML のように tbody がない表からも抽出する"""
+    # given
+    document = parse_html((PAGES_DIR / "assets_without_tbody.html").read_text(encoding="utf-8"))
+
+    # when
+    products = extract_product_assets(document)
+
+    # then
+    assert products["プロダクト_2"] == AssetEvaluation(
+        cumulative_contributions=200_000, gains_or_losses=22_222, asset_valuation=222_222
+    )
+    assert list(products) == ["プロダクト_1", "プロダクト_2"]
+
+
+def test_extract_product_assets__raises_without_product_info():
+    """商品情報の要素がない場合は ValueError を送出する"""
+    # given
+    document = parse_html((PAGES_DIR / "top.html").read_text(encoding="utf-8"))
+
+    # when, then
+    assert is_asset_page(document) is False
+    with pytest.raises(ValueError, match="prodInfo"):
+        extract_product_assets(document)
@@ -0,0 +1,47 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+import pytest
+from shared.infrastructure import aws_clients
+
+
+@pytest.fixture
+def empty_client_cache():
+    """生成済みのクライアントを破棄し、テスト後も破棄する"""
+    aws_clients._create_client.cache_clear()
+    yield
+    aws_clients._create_client.cache_clear()
+
+
+def test_get_client__creates_clients_one_at_a_time(empty_client_cache, monkeypatch):
+    """並行して初回取得した場合も、クライアントの生成は直列化され、サービスごとに 1 度だけ行われる"""
+    # given
+    active = []
+    max_active = []
+    created = []
+
+    def _slow_client(service_name, region_name=None, endpoint_url=None):
+        active.append(service_name)
+        max_active.append(len(active))
+        time.sleep(0.05)
+        created.append(service_name)
+        active.remove(service_name)
+        return object()
+
+    monkeypatch.setattr(boto3, "client", _slow_client)
+    barrier = threading.Barrier(4)
+
+    def _get(service_name: str):
+        barrier.wait()
+        return aws_clients.get_client(service_name)
+
+    # when
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        clients = list(executor.map(_get, ["s3", "s3", "ssm", "s3"]))
+
+    # then
+    assert max(max_active) == 1
+    assert sorted(created) == ["s3", "ssm"]
+    assert clients[0] is clients[1] is clients[3]
@@ -0,0 +1,208 @@
+import os
+import tempfile
+import threading
+
+import pytest
+
+from src.infrastructure import chrome_driver_pool
+from src.infrastructure.chrome_driver_pool import PROFILE_DIR_PREFIX, ChromeDriverPool, close_chrome, launch_chrome
+
+
+class FakeChrome:
+    """webdriver.Chrome の代わりに起動・終了・操作を記録する"""
+
+    instances: list["FakeChrome"] = []
+
+    def __init__(self, service=None, options=None) -> None:
+        self.options = options
+        self.healthy = True
+        self.quit_called = False
+        self.cdp_commands: list[str] = []
+        self.window_handles = ["main"]
+        self.switch_to = self
+        FakeChrome.instances.append(self)
+
+    def implicitly_wait(self, seconds: float) -> None:
+        pass
+
+    def execute_script(self, script: str) -> int:
+        if not self.healthy:
+            raise RuntimeError("not responding")
+        return 1
+
+    def execute_cdp_cmd(self, command: str, params: dict) -> None:
+        self.cdp_commands.append(command)
+
+    def window(self, handle: str) -> None:
+        pass
+
+    def get(self, url: str) -> None:
+        pass
+
+    def quit(self) -> None:
+        self.quit_called = True
+
+
+@pytest.fixture(autouse=True)
+def fake_chrome(mocker, monkeypatch, tmp_path) -> None:
+    """Chrome を起動せず、一時ディレクトリを tmp_path に作成する"""
+    FakeChrome.instances = []
+    mocker.patch.object(chrome_driver_pool.webdriver, "Chrome", FakeChrome)
+    mocker.patch.object(chrome_driver_pool.webdriver, "ChromeService")
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    monkeypatch.setattr(chrome_driver_pool, "_active_profile_dirs", set())
+
+
+def _profile_dirs() -> list[str]:
+    return [name for name in os.listdir(tempfile.gettempdir()) if name.startswith(PROFILE_DIR_PREFIX)]
+
+
+def test_close_chrome__removes_profile_dir():
+    """Chrome の終了時に一時ディレクトリを削除する"""
+    # given
+    session = launch_chrome("/opt/chrome/chrome", "/opt/chromedriver", "agent")
+    assert _profile_dirs() == [os.path.basename(session.profile_dir)]
+
+    # when
+    close_chrome(session)
+
+    # then
+    assert session.driver.quit_called is True
+    assert _profile_dirs() == []
+
+
+def test_launch_chrome__removes_stale_profile_dirs():
+    """終了処理が実行されなかった一時ディレクトリは次回の起動時に削除する"""
+    # given
+    stale_dir = tempfile.mkdtemp(prefix=PROFILE_DIR_PREFIX)
+
+    # when
+    session = launch_chrome("/opt/chrome/chrome", "/opt/chromedriver", "agent")
+
+    # then
+    assert not os.path.exists(stale_dir)
+    assert _profile_dirs() == [os.path.basename(session.profile_dir)]
+
+
+def test_launch_chrome__keeps_profile_dir_of_concurrently_booting_chrome(mocker):
+    """並行して起動した場合、起動中の Chrome の一時ディレクトリを削除しない"""
+    # given
+    sessions = []
+    boot_calls = []
+    profile_dir_exists_after_other_launch = []
+
+    def launch() -> None:
+        sessions.append(launch_chrome("/opt/chrome/chrome", "/opt/chromedriver", "agent"))
+
+    def boot(service=None, options=None) -> FakeChrome:
+        boot_calls.append(options)
+        if len(boot_calls) == 1:
+            # 1 つ目の Chrome の起動中に、別スレッドで 2 つ目の Chrome を起動する
+            user_data_dir = next(a for a in options.arguments if a.startswith("--user-data-dir="))
+            profile_dir = os.path.dirname(user_data_dir.split("=", 1)[1])
+            other = threading.Thread(target=launch)
+            other.start()
+            other.join()
+            profile_dir_exists_after_other_launch.append(os.path.exists(profile_dir))
+        return FakeChrome(service, options)
+
+    mocker.patch.object(chrome_driver_pool.webdriver, "Chrome", side_effect=boot)
+
+    # when
+    first = threading.Thread(target=launch)
+    first.start()
+    first.join()
+
+    # then
+    assert profile_dir_exists_after_other_launch == [True]
+    assert sorted(_profile_dirs()) == sorted(os.path.basename(s.profile_dir) for s in sessions)
+    assert len(sessions) == 2
+
+
+def test_launch_chrome__releases_profile_dir_on_failure(mocker):
+    """起動に失敗した場合は一時ディレクトリを削除し、使用中の登録を解除する"""
+    # given
+    mocker.patch.object(chrome_driver_pool.webdriver, "Chrome", side_effect=RuntimeError("boot failed"))
+
+    # when
+    with pytest.raises(RuntimeError):
+        launch_chrome("/opt/chrome/chrome", "/opt/chromedriver", "agent")
+
+    # then
+    assert _profile_dirs() == []
+    assert chrome_driver_pool._active_profile_dirs == set()
+
+
+def test_pool__reuses_healthy_driver_after_reset():
+    """返却された Chrome はセッションを初期化し、次回の取得時に再利用する"""
+    # given
+    pool = ChromeDriverPool("/opt/chrome/chrome", "/opt/chromedriver", "agent")
+    first = pool.acquire()
+
+    # when
+    pool.release()
+    second = pool.acquire()
+
+    # then
+    assert second is first
+    assert len(FakeChrome.instances) == 1
+    assert "Network.clearBrowserCookies" in first.cdp_commands
+    assert first.quit_called is False
+
+
+def test_pool__relaunches_unhealthy_driver():
+    """応答しない Chrome は終了して起動し直す"""
+    # given
+    pool = ChromeDriverPool("/opt/chrome/chrome", "/opt/chromedriver", "agent")
+    first = pool.acquire()
+    pool.release()
+    first.healthy = False
+
+    # when
+    second = pool.acquire()
+
+    # then
+    assert second is not first
+    assert first.quit_called is True
+    assert len(_profile_dirs()) == 1
+
+
+def test_pool__discards_driver_on_error():
+    """エラー発生時に返却された Chrome は再利用しない"""
+    # given
+    pool = ChromeDriverPool("/opt/chrome/chrome", "/opt/chromedriver", "agent")
+    first = pool.acquire()
+
+    # when
+    pool.release(discard=True)
+    second = pool.acquire()
+
+    # then
+    assert first.quit_called is True
+    assert second is not first
+    assert len(_profile_dirs()) == 1
+
+
+def test_launch_chrome__blocks_resources_and_uses_eager_load():
+    """リソースを読み込まない設定の場合、画像を無効化して不要な URL を遮断する"""
+    # when
+    session = launch_chrome(
+        "/opt/chrome/chrome", "/opt/chromedriver", "agent", block_resources=True, page_load_strategy="eager"
+    )
+
+    # then
+    options = session.driver.options
+    assert options.page_load_strategy == "eager"
+    assert options.experimental_options["prefs"] == {"profile.managed_default_content_settings.images": 2}
+    assert session.driver.cdp_commands == ["Network.enable", "Network.setBlockedURLs"]
+
+
+def test_launch_chrome__loads_all_resources_by_default():
+    """デフォルトではリソースを遮断しない"""
+    # when
+    session = launch_chrome("/opt/chrome/chrome", "/opt/chromedriver", "agent")
+
+    # then
+    assert session.driver.options.page_load_strategy == "normal"
+    assert "prefs" not in session.driver.options.experimental_options
+    assert session.driver.cdp_commands == []
@@ -0,0 +1,61 @@
+import pytest
+
+from src.domain import AssetEvaluation, IScraper, LoginRejected
+from src.infrastructure import FallbackScraper
+from tests.fixtures.mocks import MockSeleniumScraper
+
+PRODUCTS = {
+    "プロダクト_1": AssetEvaluation(cumulative_contributions=100_000, gains_or_losses=11_111, asset_valuation=111_111),
+}
+
+
+def test_fetch_asset_valuation__does_not_create_fallback_on_success():
+    """主スクレイパーが成功した場合は代替スクレイパーを生成しない"""
+    # given
+    fallbacks = []
+
+    def _create_fallback() -> MockSeleniumScraper:
+        fallbacks.append(MockSeleniumScraper(mock_products={}))
+        return fallbacks[-1]
+
+    scraper = FallbackScraper(primary=MockSeleniumScraper(mock_products=PRODUCTS), fallback=_create_fallback)
+
+    # when
+    products = scraper.fetch_asset_valuation()
+
+    # then
+    assert products == PRODUCTS
+    assert fallbacks == []
+
+
+def test_fetch_asset_valuation__uses_fallback_on_failure():
+    """主スクレイパーが失敗した場合は代替スクレイパーで取得し直す"""
+    # given
+    primary = MockSeleniumScraper(should_fail=True)
+    fallback = MockSeleniumScraper(mock_products=PRODUCTS)
+    scraper = FallbackScraper(primary=primary, fallback=lambda: fallback)
+
+    # when
+    products = scraper.fetch_asset_valuation()
+
+    # then
+    assert primary.fetch_called is True
+    assert fallback.fetch_called is True
+    assert products == PRODUCTS
+
+
+def test_fetch_asset_valuation__does_not_retry_rejected_login():
+    """ログイン情報が受け付けられなかった場合は代替スクレイパーでログインし直さない"""
+
+    # given
+    class _RejectingScraper(IScraper):
+        def fetch_asset_valuation(self) -> dict[str, AssetEvaluation]:
+            raise LoginRejected.during_login()
+
+    fallbacks = []
+    scraper = FallbackScraper(primary=_RejectingScraper(), fallback=lambda: fallbacks.append("created"))
+
+    # when, then
+    with pytest.raises(LoginRejected):
+        scraper.fetch_asset_valuation()
+    assert fallbacks == []
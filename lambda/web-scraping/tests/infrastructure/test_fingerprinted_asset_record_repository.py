@@ -0,0 +1,70 @@
+import os
+from datetime import date
+
+from src.domain import AssetRecord
+from src.infrastructure import AssetRecordFingerprintStore, FingerprintedAssetRecordRepository
+from tests.fixtures.mocks import MockAssetRecordRepository
+
+
+def _make_records(target_date: date, asset_valuation: int = 110_000) -> list[AssetRecord]:
+    """保存対象の資産レコードを生成"""
+    return [
+        AssetRecord(
+            date=target_date,
+            product=p,
+            asset_valuation=asset_valuation,
+            cumulative_contributions=100_000,
+            gains_or_losses=asset_valuation - 100_000,
+        )
+        for p in ["商品A", "商品B"]
+    ]
+
+
+def test_save_daily_records__skips_unchanged_records(local_stack_container):
+    """前回保存したレコードと内容が同じ場合は保存を省略する"""
+    # given
+    inner = MockAssetRecordRepository()
+    store = AssetRecordFingerprintStore(bucket=os.environ["DATA_BUCKET_NAME"], prefix="fingerprint-skip")
+    repo = FingerprintedAssetRecordRepository(inner=inner, fingerprint_store=store, skip_unchanged=True)
+    repo.save_daily_records(_make_records(date(2026, 3, 13)))
+
+    # when
+    repo.save_daily_records(_make_records(date(2026, 3, 16)))
+
+    # then
+    assert [r.date for r in inner.saved_records] == [date(2026, 3, 13)] * 2
+    assert store.load().date == "2026-03-13"
+
+
+def test_save_daily_records__saves_changed_records(local_stack_container):
+    """内容が変わった場合は保存し、フィンガープリントを更新する"""
+    # given
+    inner = MockAssetRecordRepository()
+    store = AssetRecordFingerprintStore(bucket=os.environ["DATA_BUCKET_NAME"], prefix="fingerprint-changed")
+    repo = FingerprintedAssetRecordRepository(inner=inner, fingerprint_store=store, skip_unchanged=True)
+    repo.save_daily_records(_make_records(date(2026, 3, 13)))
+    previous = store.load()
+
+    # when
+    repo.save_daily_records(_make_records(date(2026, 3, 16), asset_valuation=120_000))
+
+    # then
+    assert [r.date for r in inner.saved_records] == [date(2026, 3, 13)] * 2 + [date(2026, 3, 16)] * 2
+    assert store.load().date == "2026-03-16"
+    assert store.load().fingerprint != previous.fingerprint
+
+
+def test_save_daily_records__saves_unchanged_records_when_skip_disabled(local_stack_container):
+    """保存の省略が無効な場合は内容が同じでも保存し、フィンガープリントを更新する"""
+    # given
+    inner = MockAssetRecordRepository()
+    store = AssetRecordFingerprintStore(bucket=os.environ["DATA_BUCKET_NAME"], prefix="fingerprint-always")
+    repo = FingerprintedAssetRecordRepository(inner=inner, fingerprint_store=store)
+    repo.save_daily_records(_make_records(date(2026, 3, 13)))
+
+    # when
+    repo.save_daily_records(_make_records(date(2026, 3, 16)))
+
+    # then
+    assert len(inner.saved_records) == 4
+    assert store.load().date == "2026-03-16"
@@ -0,0 +1,233 @@
+from datetime import date
+
+import pytest
+
+from src.domain import AssetRecord, AssetRecordError
+from src.infrastructure import GoogleSheetAssetRecordRepository
+from tests.fixtures.mocks import MockSpreadsheet, MockWorksheet
+
+HEADERS = ["date", "product", "asset_valuation", "cumulative_contributions", "gains_or_losses"]
+INDEX_HEADERS = ["date", "first_row", "last_row"]
+
+
+def _make_rows(dates: list[str], products: list[str]) -> list[list[str]]:
+    """日付 × 商品のシート行を生成"""
+    return [[d, p, "110000", "100000", "10000"] for d in dates for p in products]
+
+
+def _make_records(target_date: date, products: list[str], asset_valuation: int = 120_000) -> list[AssetRecord]:
+    """保存対象の資産レコードを生成"""
+    return [
+        AssetRecord(
+            date=target_date,
+            product=p,
+            asset_valuation=asset_valuation,
+            cumulative_contributions=100_000,
+            gains_or_losses=asset_valuation - 100_000,
+        )
+        for p in products
+    ]
+
+
+@pytest.fixture
+def make_repository(mocker):
+    """MockSpreadsheet を使う GoogleSheetAssetRecordRepository を生成するファクトリ"""
+
+    def _make(
+        values: list[list[str]],
+        index_values: list[list[str]] | None = None,
+        overwrite_in_place: bool = True,
+    ) -> GoogleSheetAssetRecordRepository:
+        worksheets = {"assets": MockWorksheet(values)}
+        if index_values is not None:
+            worksheets["assets_index"] = MockWorksheet(index_values, title="assets_index", sheet_id=1)
+        client = mocker.patch("src.infrastructure.google_sheet_asset_record_repository.get_spreadsheet_client")
+        client.return_value.open_by_key.return_value = MockSpreadsheet(worksheets)
+        return GoogleSheetAssetRecordRepository(
+            spreadsheet_id="dummy",
+            sheet_name="assets",
+            credentials={},
+            overwrite_in_place=overwrite_in_place,
+        )
+
+    return _make
+
+
+class TestSaveDailyRecords:
+    def test_save_daily_records__appends_and_builds_index(self, make_repository):
+        """インデックス未作成のシートに追記し、date 列からインデックスを構築する"""
+        repo = make_repository([HEADERS, *_make_rows(["2026-02-12"], ["商品A", "商品B"])])
+
+        repo.save_daily_records(_make_records(date(2026, 2, 13), ["商品A", "商品B"]))
+
+        assert [row[0] for row in repo.worksheet.values[1:]] == ["2026-02-12"] * 2 + ["2026-02-13"] * 2
+        assert repo.date_index.spreadsheet.worksheets["assets_index"].values == [
+            INDEX_HEADERS,
+            ["2026-02-12", "2", "3"],
+            ["2026-02-13", "4", "5"],
+        ]
+
+    def test_save_daily_records__replaces_same_date_using_index(self, make_repository):
+        """同一日付の既存行をインデックスの行範囲で削除し、後続の行範囲を繰り上げる"""
+        values = [HEADERS, *_make_rows(["2026-02-12", "2026-02-13"], ["商品A", "商品B"])]
+        index_values = [INDEX_HEADERS, ["2026-02-12", "2", "3"], ["2026-02-13", "4", "5"]]
+        repo = make_repository(values, index_values=index_values)
+
+        repo.save_daily_records(_make_records(date(2026, 2, 12), ["商品A", "商品B", "商品C"]))
+
+        assert "col_values" not in repo.worksheet.api_calls
+        assert [row[0] for row in repo.worksheet.values[1:]] == ["2026-02-13"] * 2 + ["2026-02-12"] * 3
+        assert repo.date_index.spreadsheet.worksheets["assets_index"].values == [
+            INDEX_HEADERS,
+            ["2026-02-12", "4", "6"],
+            ["2026-02-13", "2", "3"],
+        ]
+
+    def test_save_daily_records__uses_index_after_older_date_moved_to_tail(self, make_repository):
+        """削除と追記で古い日付が末尾に移動した後も、インデックスを再構築せずに保存する"""
+        values = [HEADERS, *_make_rows(["2026-02-12", "2026-02-13"], ["商品A", "商品B"])]
+        index_values = [INDEX_HEADERS, ["2026-02-12", "2", "3"], ["2026-02-13", "4", "5"]]
+        repo = make_repository(values, index_values=index_values)
+        repo.save_daily_records(_make_records(date(2026, 2, 12), ["商品A", "商品B", "商品C"]))
+
+        repo.save_daily_records(_make_records(date(2026, 2, 16), ["商品A"]))
+
+        assert "col_values" not in repo.worksheet.api_calls
+        assert repo.date_index.spreadsheet.worksheets["assets_index"].values[1:] == [
+            ["2026-02-12", "4", "6"],
+            ["2026-02-13", "2", "3"],
+            ["2026-02-16", "7", "7"],
+        ]
+
+    def test_save_daily_records__keeps_rows_of_other_products(self, make_repository):
+        """接頭辞を指定した場合、同一日付のうち接頭辞に一致しない商品の行は残す"""
+        values = [HEADERS, *_make_rows(["2026-02-12"], ["本人/商品A", "配偶者/商品A"])]
+        index_values = [INDEX_HEADERS, ["2026-02-12", "2", "3"]]
+        repo = make_repository(values, index_values=index_values)
+
+        repo.save_daily_records(_make_records(date(2026, 2, 12), ["本人/商品A"]), product_prefixes=["本人/"])
+
+        assert repo.worksheet.values[1:] == [
+            ["2026-02-12", "配偶者/商品A", "110000", "100000", "10000"],
+            ["2026-02-12", "本人/商品A", "120000", "100000", "20000"],
+        ]
+
+    def test_read_all_records__reads_every_row(self, make_repository):
+        """ヘッダを除く全ての行を 1 回の読み取りでレコードとして取得する"""
+        values = [HEADERS, *_make_rows(["2026-02-12", "2026-02-13"], ["商品A"]), ["", "", "", "", ""]]
+        repo = make_repository(values)
+
+        records = repo.read_all_records()
+
+        assert [(str(r.date), r.product, r.asset_valuation) for r in records] == [
+            ("2026-02-12", "商品A", 110_000),
+            ("2026-02-13", "商品A", 110_000),
+        ]
+        assert repo.worksheet.api_calls == ["get"]
+
+    def test_save_daily_records__rebuilds_empty_index(self, make_repository):
+        """インデックスに有効な行がない場合は date 列から再構築する"""
+        values = [HEADERS, *_make_rows(["2026-02-12"], ["商品A"])]
+        repo = make_repository(values, index_values=[INDEX_HEADERS, ["2026-02-12"]])
+
+        repo.save_daily_records(_make_records(date(2026, 2, 13), ["商品A"]))
+
+        assert "col_values" in repo.worksheet.api_calls
+        assert [row[0] for row in repo.worksheet.values[1:]] == ["2026-02-12", "2026-02-13"]
+
+    def test_save_daily_records__rebuilds_stale_index(self, make_repository):
+        """インデックスの行範囲がシートと一致しない場合は date 列から再構築して削除する"""
+        values = [HEADERS, *_make_rows(["2026-02-12", "2026-02-13"], ["商品A", "商品B"])]
+        index_values = [INDEX_HEADERS, ["2026-02-13", "2", "3"]]
+        repo = make_repository(values, index_values=index_values)
+
+        repo.save_daily_records(_make_records(date(2026, 2, 13), ["商品A"]))
+
+        assert [row[0] for row in repo.worksheet.values[1:]] == ["2026-02-12"] * 2 + ["2026-02-13"]
+
+    def test_save_daily_records__non_contiguous_rows_raises(self, make_repository):
+        """同一日付の行が連続していない場合は AssetRecordError が発生する"""
+        values = [
+            HEADERS,
+            *_make_rows(["2026-02-12"], ["商品A"]),
+            *_make_rows(["2026-02-13"], ["商品A"]),
+            *_make_rows(["2026-02-12"], ["商品B"]),
+        ]
+        repo = make_repository(values)
+
+        with pytest.raises(AssetRecordError):
+            repo.save_daily_records(_make_records(date(2026, 2, 14), ["商品A"]))
+
+
+class TestBatchedUpsert:
+    def test_save_daily_records__single_batch_update(self, make_repository):
+        """既存行の削除と追記が 1 回の batch_update で実行される"""
+        dates = ["2026-02-12", "2026-02-13"]
+        products = [f"商品{i}" for i in range(20)]
+        values = [HEADERS, *_make_rows(dates, products)]
+        index_values = [INDEX_HEADERS, ["2026-02-12", "2", "21"], ["2026-02-13", "22", "41"]]
+        repo = make_repository(values, index_values=index_values, overwrite_in_place=False)
+
+        repo.save_daily_records(_make_records(date(2026, 2, 13), products))
+
+        assert repo.spreadsheet.api_calls.count("batch_update") == 1
+        assert repo.worksheet.api_calls == ["batch_get"]
+        assert len(repo.worksheet.values) == 41
+        assert repo.worksheet.values[-1] == ["2026-02-13", "商品19", "120000", "100000", "20000"]
+
+    def test_save_daily_records__rebuilds_index_when_tail_has_unindexed_rows(self, make_repository):
+        """インデックス外の行が末尾にある場合は date 列から再構築して追記位置を決める"""
+        values = [HEADERS, *_make_rows(["2026-02-12", "2026-02-13"], ["商品A"])]
+        index_values = [INDEX_HEADERS, ["2026-02-12", "2", "2"]]
+        repo = make_repository(values, index_values=index_values)
+
+        repo.save_daily_records(_make_records(date(2026, 2, 14), ["商品A"]))
+
+        assert repo.spreadsheet.worksheets["assets_index"].values[1:] == [
+            ["2026-02-12", "2", "2"],
+            ["2026-02-13", "3", "3"],
+            ["2026-02-14", "4", "4"],
+        ]
+
+
+class TestOverwriteInPlace:
+    def test_save_daily_records__overwrites_rows_when_count_unchanged(self, make_repository):
+        """件数が一致する場合は既存行を上書きし、行の並びとインデックスを維持する"""
+        values = [HEADERS, *_make_rows(["2026-02-12", "2026-02-13"], ["商品A", "商品B"])]
+        index_values = [INDEX_HEADERS, ["2026-02-12", "2", "3"], ["2026-02-13", "4", "5"]]
+        repo = make_repository(values, index_values=index_values)
+
+        repo.save_daily_records(_make_records(date(2026, 2, 12), ["商品A", "商品B"], asset_valuation=130_000))
+
+        assert repo.worksheet.values[1:3] == [
+            ["2026-02-12", "商品A", "130000", "100000", "30000"],
+            ["2026-02-12", "商品B", "130000", "100000", "30000"],
+        ]
+        assert [row[0] for row in repo.worksheet.values[3:]] == ["2026-02-13"] * 2
+        assert repo.worksheet.api_calls == ["batch_get", "update"]
+        assert repo.spreadsheet.api_calls == ["values_get"]
+
+    def test_save_daily_records__saves_rebuilt_index_when_overwriting(self, make_repository):
+        """date 列からインデックスを再構築した場合は、上書き時もインデックスを保存する"""
+        values = [HEADERS, *_make_rows(["2026-02-12", "2026-02-13"], ["商品A", "商品B"])]
+        repo = make_repository(values)
+
+        repo.save_daily_records(_make_records(date(2026, 2, 13), ["商品A", "商品B"], asset_valuation=130_000))
+
+        assert repo.worksheet.api_calls == ["col_values", "update"]
+        assert repo.spreadsheet.worksheets["assets_index"].values == [
+            INDEX_HEADERS,
+            ["2026-02-12", "2", "3"],
+            ["2026-02-13", "4", "5"],
+        ]
+
+    def test_save_daily_records__falls_back_when_count_differs(self, make_repository):
+        """件数が異なる場合は削除して末尾に追記する"""
+        values = [HEADERS, *_make_rows(["2026-02-12", "2026-02-13"], ["商品A", "商品B"])]
+        index_values = [INDEX_HEADERS, ["2026-02-12", "2", "3"], ["2026-02-13", "4", "5"]]
+        repo = make_repository(values, index_values=index_values)
+
+        repo.save_daily_records(_make_records(date(2026, 2, 12), ["商品A"]))
+
+        assert "update" not in repo.worksheet.api_calls
+        assert [row[0] for row in repo.worksheet.values[1:]] == ["2026-02-13"] * 2 + ["2026-02-12"]
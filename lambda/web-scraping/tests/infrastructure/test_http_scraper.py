@@ -0,0 +1,157 @@
+import pytest
+
+from src.config.settings import get_metrics, measure_stage
+from src.domain import AssetEvaluation, LoginRejected, ScrapingFailed, ScrapingParams
+from src.infrastructure import HttpScraper
+from tests.fixtures.stand_in_site import StandInSite
+
+CREDENTIALS = {"userId": "user", "password": "secret", "birthDate": "19800101", "token": "login-token"}
+
+
+@pytest.fixture
+def site():
+    """記録済みのページを返す代替サーバー"""
+    with StandInSite(credentials=CREDENTIALS) as site:
+        yield site
+
+
+@pytest.fixture
+def metrics():
+    """記録済みのメトリクスを破棄した Metrics"""
+    metrics = get_metrics()
+    metrics.clear_metrics()
+    yield metrics
+    metrics.clear_metrics()
+
+
+def _make_scraper(site: StandInSite, password: str = "secret") -> HttpScraper:
+    return HttpScraper(
+        scraping_params=ScrapingParams(
+            login_user_id="user",
+            login_password=password,
+            login_birthdate="19800101",
+            start_url=f"{site.url}/login",
+            user_agent="test-agent",
+        ),
+    )
+
+
+def test_fetch_asset_valuation__logs_in_and_extracts_products(site):
+    """ログインフォームを送信し、資産評価額照会ページから商品別の資産情報を抽出する"""
+    # when
+    products = _make_scraper(site).fetch_asset_valuation()
+
+    # then
+    assert products == {
+        "プロダクト_1": AssetEvaluation(
+            cumulative_contributions=100_000, gains_or_losses=11_111, asset_valuation=111_111
+        ),
+        "プロダクト_2": AssetEvaluation(
+            cumulative_contributions=200_000, gains_or_losses=22_222, asset_valuation=222_222
+        ),
+    }
+    assert site.requests == [
+        ("GET", "/login"),
+        ("POST", "/login"),
+        ("GET", "/top"),
+        ("GET", "/assets"),
+        ("GET", "/logout"),
+        ("GET", "/login"),
+    ]
+
+
+def test_fetch_asset_valuation__login_failure(site):
+    """ログイン情報が受け付けられなかった場合はログイン拒否の例外を送出し、エラー時の HTML を保存する"""
+    # when, then
+    with pytest.raises(LoginRejected, match="ログイン処理に失敗しました") as exc_info:
+        _make_scraper(site, password="wrong").fetch_asset_valuation()
+
+    assert exc_info.value.tmp_html_path == "/tmp/error_login.html"
+
+
+def test_fetch_asset_valuation__extracts_table_without_tbody(site):
+    """資産評価額照会ページの表に tbody がない場合も抽出する"""
+    # given
+    site.pages["/assets"] = "assets_without_tbody.html"
+
+    # when
+    products = _make_scraper(site).fetch_asset_valuation()
+
+    # then
+    assert list(products) == ["プロダクト_1", "プロダクト_2"]
+
+
+def test_fetch_asset_valuation__page_fetch_failure(site):
+    """資産評価額照会ページを取得できない場合はページ取得失敗の例外を送出し、ログアウトする"""
+    # given
+    site.pages["/assets"] = "top.html"
+
+    # when, then
+    with pytest.raises(ScrapingFailed, match="資産評価額照会ページの取得に失敗しました"):
+        _make_scraper(site).fetch_asset_valuation()
+
+    assert ("GET", "/logout") in site.requests
+
+
+def test_fetch_asset_valuation__extraction_failure(site, tmp_path):
+    """資産情報の抽出に失敗した場合は抽出失敗の例外を送出し、エラー時の HTML を保存する"""
+    # given
+    broken_page = tmp_path / "broken_assets.html"
+    broken_page.write_text('<html><body><a href="/logout">ログアウト</a><p class="total"></p></body></html>')
+    site.pages["/assets"] = str(broken_page)
+
+    # when, then
+    with pytest.raises(ScrapingFailed, match="資産情報の抽出に失敗しました") as exc_info:
+        _make_scraper(site).fetch_asset_valuation()
+
+    assert exc_info.value.tmp_html_path == "/tmp/error_extraction.html"
+    assert ("GET", "/logout") in site.requests
+
+
+def test_fetch_asset_valuation__records_stage_durations(site, metrics):
+    """ログイン・遷移・抽出の各段階の所要時間をメトリクスとして記録する"""
+    # when
+    _make_scraper(site).fetch_asset_valuation()
+
+    # then
+    for stage in ("Login", "Navigation", "Extraction"):
+        assert metrics.metric_set[f"{stage}Duration"]["Unit"] == "Milliseconds"
+        assert len(metrics.metric_set[f"{stage}Duration"]["Value"]) == 1
+
+
+def test_fetch_asset_valuation__records_failed_stage(site, metrics):
+    """失敗した段階は所要時間に加えて失敗回数を記録する"""
+    # when
+    with pytest.raises(ScrapingFailed):
+        _make_scraper(site, password="wrong").fetch_asset_valuation()
+
+    # then
+    assert "LoginDuration" in metrics.metric_set
+    assert metrics.metric_set["LoginFailures"]["Value"] == [1]
+    assert "NavigationDuration" not in metrics.metric_set
+
+
+def test_fetch_asset_valuation__ignores_metric_recording_failure(site, metrics, mocker):
+    """メトリクスの記録に失敗しても、各段階の処理結果に影響しない"""
+    # given
+    mocker.patch.object(type(metrics), "add_metric", side_effect=RuntimeError("metrics unavailable"))
+
+    # when
+    products = _make_scraper(site).fetch_asset_valuation()
+
+    # then
+    assert products
+
+
+def test_measure_stage__flushes_without_namespace_env(metrics, monkeypatch):
+    """名前空間の環境変数がない場合も、記録数が上限に達した際の自動出力で失敗しない"""
+    # given
+    monkeypatch.delenv("POWERTOOLS_METRICS_NAMESPACE", raising=False)
+
+    # when
+    for _ in range(150):
+        with measure_stage("Benchmark"):
+            pass
+
+    # then
+    assert len(metrics.metric_set["BenchmarkDuration"]["Value"]) < 100
@@ -0,0 +1,102 @@
+import time
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+
+from src.infrastructure.page_navigator import ErrorPageDetected, PageNavigator
+
+TARGET = (By.CLASS_NAME, "total")
+ERROR = (By.NAME, "userId")
+
+
+class FakeElement:
+    """一定回数の確認後に破棄（stale）される要素"""
+
+    def __init__(self, stale_after: int = 0) -> None:
+        self.remaining = stale_after
+
+    def is_enabled(self) -> bool:
+        if self.remaining <= 0:
+            raise StaleElementReferenceException()
+        self.remaining -= 1
+        return True
+
+
+class FakeDriver:
+    """一定回数の確認後に要素が表示される WebDriver"""
+
+    def __init__(self, appear_after: dict[tuple[str, str], int]) -> None:
+        self.appear_after = dict(appear_after)
+
+    def find_elements(self, by: str, value: str) -> list[FakeElement]:
+        remaining = self.appear_after.get((by, value))
+        if remaining is None:
+            return []
+        if remaining > 0:
+            self.appear_after[(by, value)] = remaining - 1
+            return []
+        return [FakeElement()]
+
+
+def _navigator(driver: FakeDriver, timeout: float = 10.0) -> PageNavigator:
+    return PageNavigator(driver, timeout=timeout, poll_frequency=0.01)
+
+
+def test_wait_for__returns_element_when_condition_met():
+    """要素が表示された時点で待機を終了する"""
+    # given
+    navigator = _navigator(FakeDriver({TARGET: 3}))
+
+    # when
+    element = navigator.wait_for(TARGET)
+
+    # then
+    assert isinstance(element, FakeElement)
+
+
+def test_wait_for__fails_fast_on_error_page():
+    """エラー画面の要素を検出した場合はタイムアウトを待たずに失敗する"""
+    # given
+    navigator = _navigator(FakeDriver({ERROR: 2}))
+
+    # when
+    start = time.perf_counter()
+    with pytest.raises(ErrorPageDetected):
+        navigator.wait_for(TARGET, error_locators=(ERROR,))
+
+    # then
+    assert time.perf_counter() - start < 1
+
+
+def test_wait_for__raises_timeout():
+    """タイムアウトまでに要素が表示されない場合は TimeoutException を送出する"""
+    # given
+    navigator = _navigator(FakeDriver({}), timeout=0.05)
+
+    # when, then
+    with pytest.raises(TimeoutException):
+        navigator.wait_for(TARGET)
+
+
+def test_find__returns_none_without_waiting():
+    """待機せずに要素を取得し、存在しない場合は None を返す"""
+    # given
+    navigator = _navigator(FakeDriver({TARGET: 0}))
+
+    # when, then
+    assert navigator.find(TARGET) is not None
+    assert navigator.find(ERROR) is None
+
+
+def test_wait_for_page_change__waits_until_element_is_stale():
+    """遷移前の画面の要素が破棄されるまで待機する"""
+    # given
+    navigator = _navigator(FakeDriver({}))
+    element = FakeElement(stale_after=3)
+
+    # when
+    navigator.wait_for_page_change(element)
+
+    # then
+    assert element.remaining == 0
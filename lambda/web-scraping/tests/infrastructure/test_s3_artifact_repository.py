@@ -0,0 +1,98 @@
+import gzip
+import json
+import os
+from datetime import UTC, datetime
+
+from src.domain import FailureRecord
+from src.infrastructure import S3ArtifactRepository
+
+
+def _get_object(local_stack_container, key: str) -> dict:
+    return local_stack_container.get_client("s3").get_object(Bucket=os.environ["DATA_BUCKET_NAME"], Key=key)
+
+
+def test_save_error_artifact__compresses_html(local_stack_container, tmp_path):
+    """HTML は gzip で圧縮し、Content-Encoding を付与して内容のハッシュをキーとして保存する"""
+    # given
+    html = "<html><body>" + "資産評価額" * 1000 + "</body></html>"
+    html_path = tmp_path / "error.html"
+    html_path.write_text(html, encoding="utf-8")
+    repo = S3ArtifactRepository(bucket=os.environ["DATA_BUCKET_NAME"])
+
+    # when
+    key = repo.save_error_artifact(file_path=str(html_path))
+
+    # then
+    assert key.startswith("errors/objects/")
+    assert key.endswith(".html")
+    response = _get_object(local_stack_container, key)
+    body = response["Body"].read()
+    assert response["ContentEncoding"] == "gzip"
+    assert response["ContentType"] == "text/html"
+    assert len(body) < len(html.encode())
+    assert gzip.decompress(body).decode() == html
+
+
+def test_save_error_artifact__uploads_screenshot_as_is(local_stack_container, tmp_path):
+    """スクリーンショットは圧縮せずに保存する"""
+    # given
+    image_path = tmp_path / "error.png"
+    image_path.write_bytes(b"\x89PNG dummy")
+    repo = S3ArtifactRepository(bucket=os.environ["DATA_BUCKET_NAME"])
+
+    # when
+    key = repo.save_error_artifact(file_path=str(image_path))
+
+    # then
+    response = _get_object(local_stack_container, key)
+    assert "ContentEncoding" not in response
+    assert response["ContentType"] == "image/png"
+    assert response["Body"].read() == b"\x89PNG dummy"
+
+
+def test_save_error_artifact__skips_upload_of_identical_content(local_stack_container, tmp_path, monkeypatch):
+    """同一内容のファイルは同じキーになり、2 回目以降はアップロードしない"""
+    # given
+    first, second = tmp_path / "first.html", tmp_path / "second.html"
+    first.write_text("<html>broken</html>", encoding="utf-8")
+    second.write_text("<html>broken</html>", encoding="utf-8")
+    repo = S3ArtifactRepository(bucket=os.environ["DATA_BUCKET_NAME"])
+    first_key = repo.save_error_artifact(file_path=str(first))
+
+    uploads = []
+    monkeypatch.setattr(repo.client, "upload_fileobj", lambda *args, **kwargs: uploads.append(args))
+
+    # when
+    second_key = repo.save_error_artifact(file_path=str(second))
+
+    # then
+    assert second_key == first_key
+    assert uploads == []
+
+
+def test_record_failures__appends_to_index(local_stack_container):
+    """失敗の記録はインデックスに発生日時の昇順で追加される"""
+    # given
+    repo = S3ArtifactRepository(bucket=os.environ["DATA_BUCKET_NAME"])
+    repo.record_failures(
+        [
+            FailureRecord(
+                occurred_at=datetime(2026, 10, 2, tzinfo=UTC),
+                account="本人",
+                error="ログイン処理に失敗しました",
+                error_screenshot_key="errors/objects/abc.png",
+            )
+        ]
+    )
+
+    # when
+    repo.record_failures(
+        [FailureRecord(occurred_at=datetime(2026, 10, 1, tzinfo=UTC), account="配偶者", error="timeout")]
+    )
+
+    # then（他のテストで追加された記録を除いて検証する）
+    index = json.loads(_get_object(local_stack_container, "errors/index.json")["Body"].read())
+    entries = [entry for entry in index if entry["occurred_at"].startswith(("2026-10-01", "2026-10-02"))]
+    assert [entry["account"] for entry in entries] == ["配偶者", "本人"]
+    assert entries[1]["error_screenshot_key"] == "errors/objects/abc.png"
+    assert entries[0]["error_html_key"] is None
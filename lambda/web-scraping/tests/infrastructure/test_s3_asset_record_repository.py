@@ -0,0 +1,107 @@
+import os
+from datetime import date
+
+from src.domain import AssetRecord
+from src.infrastructure import S3AssetRecordRepository
+from tests.fixtures.mocks import MockAssetRecordRepository
+
+
+def _make_records(target_date: date, products: list[str], asset_valuation: int = 110_000) -> list[AssetRecord]:
+    """保存対象の資産レコードを生成"""
+    return [
+        AssetRecord(
+            date=target_date,
+            product=p,
+            asset_valuation=asset_valuation,
+            cumulative_contributions=100_000,
+            gains_or_losses=asset_valuation - 100_000,
+        )
+        for p in products
+    ]
+
+
+def test_save_daily_records__upserts_partition_in_date_order(local_stack_container):
+    """同一日付のレコードは置き換えられ、パーティション内は日付昇順を維持する"""
+    # given
+    repo = S3AssetRecordRepository(bucket=os.environ["DATA_BUCKET_NAME"])
+    repo.save_daily_records(_make_records(date(2026, 2, 12), ["商品A", "商品B"]))
+    repo.save_daily_records(_make_records(date(2026, 2, 13), ["商品A", "商品B"]))
+
+    # when
+    repo.save_daily_records(_make_records(date(2026, 2, 12), ["商品A", "商品B", "商品C"], asset_valuation=120_000))
+
+    # then
+    columns = repo.store.read_year(2026)
+    assert columns.dates == ["2026-02-12"] * 3 + ["2026-02-13"] * 2
+    assert columns.columns["product"][:3] == ["商品A", "商品B", "商品C"]
+    assert columns.columns["asset_valuation"][:3] == [120_000] * 3
+
+
+def test_save_daily_records__keeps_records_of_other_products(local_stack_container):
+    """接頭辞を指定した場合、対象日付のうち接頭辞に一致しない商品の行は残す"""
+    # given
+    repo = S3AssetRecordRepository(bucket=os.environ["DATA_BUCKET_NAME"])
+    repo.store.prefix = "asset-records-prefixes"
+    repo.save_daily_records(_make_records(date(2026, 2, 12), ["本人/商品A", "配偶者/商品A"]))
+    repo.save_daily_records(_make_records(date(2026, 2, 13), ["本人/商品A", "配偶者/商品A"]))
+
+    # when
+    repo.save_daily_records(
+        _make_records(date(2026, 2, 12), ["本人/商品A"], asset_valuation=120_000), product_prefixes=["本人/"]
+    )
+
+    # then
+    columns = repo.store.read_year(2026)
+    assert columns.dates == ["2026-02-12"] * 2 + ["2026-02-13"] * 2
+    assert columns.columns["product"][:2] == ["配偶者/商品A", "本人/商品A"]
+    assert columns.columns["asset_valuation"][:2] == [110_000, 120_000]
+
+
+def test_save_daily_records__saves_to_mirror(local_stack_container):
+    """ミラー先のリポジトリにも同じレコードを保存する"""
+    # given
+    mirror = MockAssetRecordRepository()
+    repo = S3AssetRecordRepository(bucket=os.environ["DATA_BUCKET_NAME"], mirror=mirror)
+    records = _make_records(date(2025, 12, 30), ["商品A"])
+
+    # when
+    repo.save_daily_records(records)
+
+    # then
+    assert mirror.saved_records == records
+    assert repo.store.read_year(2025).dates == ["2025-12-30"]
+
+
+def test_save_daily_records__backfills_empty_store(local_stack_container):
+    """ストアが空の場合は、既存の履歴を年ごとのパーティションに書き込んでから保存する"""
+    # given
+    history = _make_records(date(2025, 12, 30), ["商品A"]) + _make_records(date(2026, 1, 5), ["商品A", "商品B"])
+    repo = S3AssetRecordRepository(bucket=os.environ["DATA_BUCKET_NAME"], backfill=lambda: history)
+    repo.store.prefix = "asset-records-backfill"
+
+    # when
+    repo.save_daily_records(_make_records(date(2026, 1, 6), ["商品A"]))
+
+    # then
+    assert repo.store.list_years() == [2025, 2026]
+    assert repo.store.read_year(2025).dates == ["2025-12-30"]
+    assert repo.store.read_year(2026).dates == ["2026-01-05"] * 2 + ["2026-01-06"]
+
+
+def test_save_daily_records__does_not_backfill_populated_store(local_stack_container):
+    """ストアに保存済みのパーティションがある場合は、既存の履歴を取得しない"""
+    # given
+    calls = []
+    repo = S3AssetRecordRepository(
+        bucket=os.environ["DATA_BUCKET_NAME"], backfill=lambda: calls.append("backfill") or []
+    )
+    repo.store.prefix = "asset-records-no-backfill"
+    repo.save_daily_records(_make_records(date(2025, 12, 30), ["商品A"]))
+    calls.clear()
+
+    # when
+    repo.save_daily_records(_make_records(date(2026, 1, 5), ["商品A"]))
+
+    # then
+    assert calls == []
+    assert repo.store.list_years() == [2025, 2026]
@@ -0,0 +1,135 @@
+import time
+from pathlib import Path
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+
+from src.domain import AssetEvaluation, ScrapingFailed, ScrapingParams
+from src.infrastructure import SeleniumScraper, selenium_scraper
+from src.infrastructure.chrome_driver_pool import ChromeSession
+
+PAGES_DIR = Path(__file__).parent.parent / "fixtures" / "pages"
+
+
+class FakeDriver:
+    """資産評価額照会ページを表示中の WebDriver を模擬し、WebDriver の呼び出し回数を記録する"""
+
+    def __init__(self, page_source: str) -> None:
+        self._page_source = page_source
+        self.page_source_calls = 0
+        self.find_calls = 0
+
+    @property
+    def page_source(self) -> str:
+        self.page_source_calls += 1
+        return self._page_source
+
+    def find_element(self, by: str, value: str):
+        self.find_calls += 1
+        raise RuntimeError("element not found")
+
+    def find_elements(self, by: str, value: str) -> list:
+        self.find_calls += 1
+        return []
+
+    def save_screenshot(self, path: str) -> None:
+        pass
+
+    def quit(self) -> None:
+        pass
+
+
+class FakeLoginForm:
+    """送信するとログイン画面が再表示される（ログインに失敗する）フォーム要素"""
+
+    def __init__(self) -> None:
+        self.submitted = False
+
+    def send_keys(self, value: str) -> None:
+        pass
+
+    def submit(self) -> None:
+        self.submitted = True
+
+    def is_enabled(self) -> bool:
+        if self.submitted:
+            raise StaleElementReferenceException()
+        return True
+
+
+class FakeLoginFailureDriver(FakeDriver):
+    """ログインに失敗し、ログイン画面が再表示される WebDriver"""
+
+    def __init__(self) -> None:
+        super().__init__("")
+        self.form = FakeLoginForm()
+
+    def find_element(self, by: str, value: str) -> FakeLoginForm:
+        return self.form
+
+    def find_elements(self, by: str, value: str) -> list:
+        return [FakeLoginForm()] if value == "userId" else []
+
+
+@pytest.fixture
+def make_scraper(mocker, tmp_path):
+    """Chrome を起動せずに FakeDriver を使う SeleniumScraper を生成するファクトリ"""
+
+    def _make(page_source: str = "", driver: FakeDriver | None = None) -> SeleniumScraper:
+        driver = driver or FakeDriver(page_source)
+        mocker.patch.object(
+            selenium_scraper, "launch_chrome", return_value=ChromeSession(driver=driver, profile_dir=str(tmp_path))
+        )
+        params = ScrapingParams(
+            login_user_id="user",
+            login_password="secret",
+            login_birthdate="19800101",
+            start_url="https://example.com",
+            user_agent="test-agent",
+        )
+        return SeleniumScraper(scraping_params=params)
+
+    return _make
+
+
+def test_extract_asset_valuation__reads_page_source_once(make_scraper):
+    """ページの HTML を 1 回だけ取得し、要素ごとの WebDriver 呼び出しを行わずに抽出する"""
+    # given
+    scraper = make_scraper((PAGES_DIR / "assets.html").read_text(encoding="utf-8"))
+
+    # when
+    products = scraper._extract_asset_valuation()
+
+    # then
+    assert products["プロダクト_2"] == AssetEvaluation(
+        cumulative_contributions=200_000, gains_or_losses=22_222, asset_valuation=222_222
+    )
+    assert scraper.driver.page_source_calls == 1
+    assert scraper.driver.find_calls == 0
+
+
+def test_extract_asset_valuation__saves_fetched_html_on_failure(make_scraper):
+    """抽出に失敗した場合は取得済みの HTML を保存し、抽出失敗の例外を送出する"""
+    # given
+    scraper = make_scraper("<html><body><p>メンテナンス中</p></body></html>")
+
+    # when, then
+    with pytest.raises(ScrapingFailed, match="資産情報の抽出に失敗しました") as exc_info:
+        scraper._extract_asset_valuation()
+
+    assert Path(exc_info.value.tmp_html_path).read_text(encoding="utf-8").count("メンテナンス中") == 1
+    assert scraper.driver.page_source_calls == 1
+
+
+def test_login__fails_fast_when_login_page_is_redisplayed(make_scraper):
+    """ログイン画面が再表示された場合はタイムアウトを待たずにログイン失敗とする"""
+    # given
+    scraper = make_scraper(driver=FakeLoginFailureDriver())
+
+    # when
+    start = time.perf_counter()
+    with pytest.raises(ScrapingFailed, match="ログイン処理に失敗しました"):
+        scraper._login()
+
+    # then
+    assert time.perf_counter() - start < 1
@@ -0,0 +1,66 @@
+import json
+
+import pytest
+from shared.infrastructure import ssm_parameter
+
+from src.infrastructure import get_ssm_json_parameter, get_ssm_json_parameters
+
+
+@pytest.fixture
+def parameters(local_stack_container, monkeypatch) -> dict[str, dict]:
+    """SSM パラメータを作成し、キャッシュを空にする"""
+    monkeypatch.setattr(ssm_parameter, "_cache", {})
+    client = local_stack_container.get_client("ssm")
+    values = {
+        "/test/scraping": {"login_user_id": "user"},
+        "/test/spreadsheet": {"spreadsheet_id": "sheet"},
+    }
+    for name, value in values.items():
+        client.put_parameter(Name=name, Value=json.dumps(value), Type="SecureString", Overwrite=True)
+    return values
+
+
+def test_get_ssm_json_parameters__fetches_with_single_call(parameters, mocker):
+    """複数のパラメータを 1 回の GetParameters で取得する"""
+    # given
+    spy = mocker.spy(ssm_parameter._get_client(), "get_parameters")
+
+    # when
+    result = get_ssm_json_parameters(list(parameters))
+
+    # then
+    assert result == parameters
+    assert spy.call_count == 1
+
+
+def test_get_ssm_json_parameters__uses_cache_within_max_age(parameters, mocker):
+    """有効期間内のパラメータはキャッシュから返し、API を呼び出さない"""
+    # given
+    get_ssm_json_parameters(list(parameters))
+    spy = mocker.spy(ssm_parameter._get_client(), "get_parameters")
+
+    # when
+    result = get_ssm_json_parameter("/test/scraping")
+
+    # then
+    assert result == parameters["/test/scraping"]
+    assert spy.call_count == 0
+
+
+def test_get_ssm_json_parameters__refetches_expired(parameters, mocker):
+    """有効期間を過ぎたパラメータは再取得する"""
+    # given
+    get_ssm_json_parameters(list(parameters))
+    spy = mocker.spy(ssm_parameter._get_client(), "get_parameters")
+
+    # when
+    get_ssm_json_parameters(list(parameters), max_age=0)
+
+    # then
+    assert spy.call_count == 1
+
+
+def test_get_ssm_json_parameters__raises_for_missing_parameter(parameters):
+    """存在しないパラメータが含まれている場合は ValueError を送出する"""
+    with pytest.raises(ValueError, match="/test/missing"):
+        get_ssm_json_parameters(["/test/scraping", "/test/missing"])
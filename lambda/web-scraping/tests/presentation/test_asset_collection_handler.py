@@ -1,4 +1,5 @@
 import os
+import time
 
 import pytest
 
@@ -123,3 +124,253 @@ def test_main_e2e_with_extraction_error(local_stack_container):
     # S3 バケットにエラー HTML ファイルが存在することを確認
     object_keys = list_s3_objects(local_stack_container, "errors/")
     assert any(key.endswith(".html") for key in object_keys)
+
+
+def test_initialize_concurrently__runs_factories_in_parallel():
+    """リソースは並行して初期化され、全体の時間は最も遅いリソースの初期化時間程度になる"""
+    # given
+    from src.presentation.asset_collection_handler import _initialize_concurrently
+
+    def _slow(value: str) -> str:
+        time.sleep(0.2)
+        return value
+
+    # when
+    start = time.perf_counter()
+    resources = _initialize_concurrently({"a": lambda: _slow("A"), "b": lambda: _slow("B"), "c": lambda: _slow("C")})
+    elapsed = time.perf_counter() - start
+
+    # then
+    assert resources == {"a": "A", "b": "B", "c": "C"}
+    assert elapsed < 0.5
+
+
+def test_initialize_concurrently__raises_after_all_factories_complete():
+    """初期化に失敗したリソースがある場合、他のリソースの初期化完了を待ってから例外を送出する"""
+    # given
+    from src.presentation.asset_collection_handler import _initialize_concurrently
+
+    completed = []
+
+    def _fail() -> None:
+        raise RuntimeError("init failed")
+
+    def _slow() -> str:
+        time.sleep(0.1)
+        completed.append("slow")
+        return "slow"
+
+    # when, then
+    with pytest.raises(RuntimeError, match="init failed"):
+        _initialize_concurrently({"fail": _fail, "slow": _slow})
+    assert completed == ["slow"]
+
+
+def test_main__scrapes_multiple_accounts_and_saves_once(valid_products, monkeypatch):
+    """複数アカウントを取得し、失敗したアカウントを除いた資産レコードを 1 回の書き込みで保存する"""
+    # given
+    from src.domain import AccountScrapingFailed
+    from src.presentation import asset_collection_handler
+    from tests.fixtures.mocks import MockAssetRecordRepository, MockSeleniumScraper
+
+    account = {"login_password": "secret", "login_birthdate": "19800101", "start_url": "https://example.com"}
+    scraping_parameter = {
+        "accounts": [
+            {**account, "name": "本人", "login_user_id": "self"},
+            {**account, "name": "配偶者", "login_user_id": "spouse"},
+            {**account, "name": "旧口座", "login_user_id": "invalid"},
+        ]
+    }
+    monkeypatch.setattr(
+        asset_collection_handler.infrastructure,
+        "get_ssm_json_parameters",
+        lambda names, decrypt: {name: scraping_parameter for name in names},
+    )
+    monkeypatch.setattr(
+        asset_collection_handler,
+        "_create_scraper",
+        lambda params, reuse_driver, error_artifact_dir: MockSeleniumScraper(
+            mock_products=valid_products, should_fail=params.login_user_id == "invalid"
+        ),
+    )
+    asset_record_repo = MockAssetRecordRepository()
+    save_calls = []
+    monkeypatch.setattr(
+        asset_record_repo,
+        "save_daily_records",
+        lambda records, product_prefixes: save_calls.append((records, product_prefixes)),
+    )
+
+    # when
+    with pytest.raises(AccountScrapingFailed) as exc_info:
+        asset_collection_handler.main(asset_record_repository=asset_record_repo)
+
+    # then
+    assert list(exc_info.value.failures) == ["旧口座"]
+    assert len(save_calls) == 1
+    records, product_prefixes = save_calls[0]
+    assert {r.product for r in records} == {
+        f"{account_name}/{product_name}" for account_name in ("本人", "配偶者") for product_name in valid_products
+    }
+    assert product_prefixes == ["本人/", "配偶者/"]
+
+
+def test_main__retry_keeps_records_of_account_saved_by_earlier_run(valid_products, monkeypatch, local_stack_container):
+    """再実行で取得に失敗したアカウントの資産レコードは、先の実行で保存したものを残す"""
+    # given
+    from src.domain import AccountScrapingFailed
+    from src.infrastructure import S3AssetRecordRepository
+    from src.presentation import asset_collection_handler
+    from tests.fixtures.mocks import MockSeleniumScraper
+
+    account = {"login_password": "secret", "login_birthdate": "19800101", "start_url": "https://example.com"}
+    scraping_parameter = {
+        "accounts": [
+            {**account, "name": "本人", "login_user_id": "self"},
+            {**account, "name": "配偶者", "login_user_id": "spouse"},
+        ]
+    }
+    monkeypatch.setattr(
+        asset_collection_handler.infrastructure,
+        "get_ssm_json_parameters",
+        lambda names, decrypt: {name: scraping_parameter for name in names},
+    )
+    failing_user_ids: set[str] = set()
+    monkeypatch.setattr(
+        asset_collection_handler,
+        "_create_scraper",
+        lambda params, reuse_driver, error_artifact_dir: MockSeleniumScraper(
+            mock_products=valid_products, should_fail=params.login_user_id in failing_user_ids
+        ),
+    )
+    asset_record_repo = S3AssetRecordRepository(bucket=os.environ["DATA_BUCKET_NAME"])
+    asset_record_repo.store.prefix = "asset-records-retry"
+    asset_collection_handler.main(asset_record_repository=asset_record_repo)
+
+    # when
+    failing_user_ids.add("spouse")
+    with pytest.raises(AccountScrapingFailed):
+        asset_collection_handler.main(asset_record_repository=asset_record_repo)
+
+    # then
+    partition = asset_record_repo.store.read_year(asset_record_repo.store.list_years()[-1])
+    assert sorted(partition.columns["product"]) == sorted(
+        f"{account_name}/{product_name}" for account_name in ("本人", "配偶者") for product_name in valid_products
+    )
+
+
+def test_main__launches_first_scraper_during_repository_initialization(valid_products, monkeypatch):
+    """最初のアカウントのスクレイパーは、資産レコードリポジトリの初期化の完了を待たずに生成する"""
+    # given
+    from src.presentation import asset_collection_handler
+    from tests.fixtures.mocks import MockAssetRecordRepository, MockSeleniumScraper
+
+    scraping_parameter = {
+        "login_user_id": "self",
+        "login_password": "secret",
+        "login_birthdate": "19800101",
+        "start_url": "https://example.com",
+    }
+    monkeypatch.setattr(
+        asset_collection_handler.infrastructure,
+        "get_ssm_json_parameters",
+        lambda names, decrypt: {name: scraping_parameter for name in names},
+    )
+    events = []
+
+    def _create_scraper(params, reuse_driver, error_artifact_dir):
+        events.append("scraper")
+        return MockSeleniumScraper(mock_products=valid_products)
+
+    def _create_asset_record_repository(spreadsheet_param):
+        time.sleep(0.2)
+        events.append("asset_record_repository")
+        return asset_record_repo
+
+    asset_record_repo = MockAssetRecordRepository()
+    monkeypatch.setattr(asset_collection_handler, "_create_scraper", _create_scraper)
+    monkeypatch.setattr(asset_collection_handler, "_create_asset_record_repository", _create_asset_record_repository)
+
+    # when
+    asset_collection_handler.main()
+
+    # then
+    assert events == ["scraper", "asset_record_repository"]
+    assert len(asset_record_repo.saved_records) == len(valid_products)
+
+
+def test_main__first_scraper_launch_failure_fails_only_its_account(valid_products, monkeypatch):
+    """最初のアカウントのスクレイパーの生成に失敗した場合も、他のアカウントの資産レコードは保存する"""
+    # given
+    from src.domain import AccountScrapingFailed
+    from src.presentation import asset_collection_handler
+    from tests.fixtures.mocks import MockAssetRecordRepository, MockSeleniumScraper
+
+    account = {"login_password": "secret", "login_birthdate": "19800101", "start_url": "https://example.com"}
+    scraping_parameter = {
+        "accounts": [
+            {**account, "name": "本人", "login_user_id": "self"},
+            {**account, "name": "配偶者", "login_user_id": "spouse"},
+        ]
+    }
+    monkeypatch.setattr(
+        asset_collection_handler.infrastructure,
+        "get_ssm_json_parameters",
+        lambda names, decrypt: {name: scraping_parameter for name in names},
+    )
+
+    def _create_scraper(params, reuse_driver, error_artifact_dir):
+        if params.login_user_id == "self":
+            raise RuntimeError("Chrome の起動に失敗")
+        return MockSeleniumScraper(mock_products=valid_products)
+
+    monkeypatch.setattr(asset_collection_handler, "_create_scraper", _create_scraper)
+    asset_record_repo = MockAssetRecordRepository()
+
+    # when
+    with pytest.raises(AccountScrapingFailed) as exc_info:
+        asset_collection_handler.main(asset_record_repository=asset_record_repo)
+
+    # then
+    assert list(exc_info.value.failures) == ["本人"]
+    assert {r.product for r in asset_record_repo.saved_records} == {
+        f"配偶者/{product_name}" for product_name in valid_products
+    }
+
+
+def test_parse_accounts__single_account_parameter():
+    """1 アカウント分のパラメータはアカウント名を空文字として扱う"""
+    # given
+    from src.presentation.asset_collection_handler import _parse_accounts
+
+    parameter = {
+        "login_user_id": "user",
+        "login_password": "secret",
+        "login_birthdate": "19800101",
+        "start_url": "https://example.com",
+    }
+
+    # when
+    accounts = _parse_accounts(parameter)
+
+    # then
+    assert list(accounts) == [""]
+    assert accounts[""].login_user_id == "user"
+
+
+def test_parse_accounts__duplicate_name_raises():
+    """アカウント名が重複している場合は ValueError を送出する"""
+    # given
+    from src.presentation.asset_collection_handler import _parse_accounts
+
+    account = {
+        "name": "本人",
+        "login_user_id": "user",
+        "login_password": "secret",
+        "login_birthdate": "19800101",
+        "start_url": "https://example.com",
+    }
+
+    # when, then
+    with pytest.raises(ValueError, match="アカウント名"):
+        _parse_accounts({"accounts": [account, account]})
@@ -59,6 +59,7 @@ export class DcpOpsMonitorStack extends cdk.Stack {
       applicationLogLevel: props.logLevel,
       environment: {
         POWERTOOLS_SERVICE_NAME: 'web-scraping',
+        POWERTOOLS_METRICS_NAMESPACE: 'DcpOpsMonitor',
         POWERTOOLS_LOG_LEVEL: props.logLevel,
         USER_AGENT: props.userAgent,
         SCRAPING_PARAMETER_NAME: scrapingParameter.parameterName,
@@ -68,16 +69,22 @@ export class DcpOpsMonitorStack extends cdk.Stack {
     });
     webScrapingFunction.addToRolePolicy(
       new iam.PolicyStatement({
-        actions: ['ssm:GetParameter'],
+        actions: ['ssm:GetParameter', 'ssm:GetParameters'],
         resources: [scrapingParameter.parameterArn, spreadsheetParameter.parameterArn],
       }),
     );
     webScrapingFunction.addToRolePolicy(
       new iam.PolicyStatement({
-        actions: ['s3:PutObject'],
+        actions: ['s3:GetObject', 's3:PutObject', 's3:DeleteObject'],
         resources: [`${dataBucket.bucketArn}/*`],
       }),
     );
+    webScrapingFunction.addToRolePolicy(
+      new iam.PolicyStatement({
+        actions: ['s3:ListBucket'],
+        resources: [dataBucket.bucketArn],
+      }),
+    );
 
     // 平日（月〜金）09:00 JST に実行する Rule を作成
     new events.Rule(this, 'EventRule', {
@@ -117,17 +124,31 @@ export class DcpOpsMonitorStack extends cdk.Stack {
       applicationLogLevel: props.logLevel,
       environment: {
         POWERTOOLS_SERVICE_NAME: 'summary-notification',
+        POWERTOOLS_METRICS_NAMESPACE: 'DcpOpsMonitor',
         POWERTOOLS_LOG_LEVEL: props.logLevel,
         LINE_MESSAGE_PARAMETER_NAME: lineMessageParameter.parameterName,
         SPREADSHEET_PARAMETER_NAME: spreadsheetParameter.parameterName,
+        DATA_BUCKET_NAME: dataBucket.bucketName,
       },
     });
     summaryNotificationFunction.addToRolePolicy(
       new iam.PolicyStatement({
-        actions: ['ssm:GetParameter'],
+        actions: ['ssm:GetParameter', 'ssm:GetParameters'],
         resources: [lineMessageParameter.parameterArn, spreadsheetParameter.parameterArn],
       }),
     );
+    summaryNotificationFunction.addToRolePolicy(
+      new iam.PolicyStatement({
+        actions: ['s3:GetObject'],
+        resources: [`${dataBucket.bucketArn}/*`],
+      }),
+    );
+    summaryNotificationFunction.addToRolePolicy(
+      new iam.PolicyStatement({
+        actions: ['s3:ListBucket'],
+        resources: [dataBucket.bucketArn],
+      }),
+    );
 
     // 毎週日曜 09:00 JST に実行する Rule を作成
     new events.Rule(this, 'SummaryNotificationEventRule', {